@@ -0,0 +1,59 @@
+"""
+Alembic environment.
+
+Uses the application's DATABASE_URL (with Render's postgres:// fixed up)
+and the models' metadata, so ``alembic revision --autogenerate`` compares
+against app.models.
+"""
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+from app.core.database import Base, db_url
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+
+config = context.config
+# configparser treats % as interpolation; URL-encoded passwords contain it.
+config.set_main_option("sqlalchemy.url", db_url.replace("%", "%%"))
+
+if config.config_file_name is not None:
+    # Keep loggers of callers such as init_db.py working.
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """Emit SQL to stdout instead of connecting (``alembic upgrade head --sql``)."""
+    context.configure(
+        url=db_url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=db_url.startswith("sqlite"),
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against the configured database."""
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most things; batch mode rebuilds the table instead.
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,232 @@
+"""Baseline schema
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-17
+
+Databases created before migrations existed (by ``create_all`` plus the
+startup column helpers) are adopted in place: missing tables are created
+and missing columns are added, existing ones are left alone. A fresh
+database gets the full schema.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+metadata = sa.MetaData()
+
+
+def _timestamps():
+    return [
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    ]
+
+
+def _owner():
+    return sa.Column(
+        "user_id", sa.Integer, sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+
+
+# Frozen copies of the models as of this revision; later model changes get their own revisions.
+TABLES = [
+    sa.Table(
+        "users",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("email", sa.String, unique=True, index=True, nullable=False),
+        sa.Column("hashed_password", sa.String, nullable=False),
+        sa.Column("full_name", sa.String),
+        sa.Column("is_active", sa.Boolean),
+        sa.Column("is_superuser", sa.Boolean),
+        *_timestamps(),
+    ),
+    sa.Table(
+        "projects",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("title", sa.String(255), nullable=False, index=True),
+        sa.Column("description", sa.Text),
+        sa.Column("short_description", sa.String(500)),
+        sa.Column("image_url", sa.String(500)),
+        sa.Column("thumbnail_url", sa.String(500)),
+        sa.Column("github_url", sa.String(500)),
+        sa.Column("youtube_url", sa.String(500)),
+        sa.Column("live_url", sa.String(500)),
+        sa.Column("technologies", sa.JSON),
+        sa.Column("category", sa.String(100)),
+        sa.Column("tags", sa.JSON),
+        sa.Column("featured", sa.Boolean),
+        sa.Column("display_order", sa.Integer),
+        sa.Column("status", sa.String(50)),
+        sa.Column("model_url", sa.String(500)),
+        sa.Column("three_config", sa.JSON),
+        *_timestamps(),
+        sa.Column("project_date", sa.DateTime(timezone=True)),
+    ),
+    sa.Table(
+        "skills",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("name", sa.String(100), nullable=False, index=True),
+        sa.Column("category", sa.String(100)),
+        sa.Column("proficiency", sa.Float),
+        sa.Column("years_experience", sa.Float),
+        sa.Column("icon_url", sa.String(500)),
+        sa.Column("color", sa.String(50)),
+        sa.Column("display_order", sa.Integer),
+        sa.Column("three_config", sa.String(500)),
+        *_timestamps(),
+    ),
+    sa.Table(
+        "experience",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("company", sa.String(255), nullable=False),
+        sa.Column("company_url", sa.String(500)),
+        sa.Column("company_logo", sa.String(500)),
+        sa.Column("profile_slug", sa.String(100), index=True),
+        sa.Column("position", sa.String(255), nullable=False),
+        sa.Column("employment_type", sa.String(100)),
+        sa.Column("location", sa.String(255)),
+        sa.Column("is_remote", sa.Boolean),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_date", sa.DateTime(timezone=True)),
+        sa.Column("is_current", sa.Boolean),
+        sa.Column("description", sa.Text),
+        sa.Column("responsibilities", sa.Text),
+        sa.Column("achievements", sa.Text),
+        sa.Column("display_order", sa.Integer),
+        *_timestamps(),
+    ),
+    sa.Table(
+        "education",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("institution", sa.String(255), nullable=False),
+        sa.Column("institution_url", sa.String(500)),
+        sa.Column("institution_logo", sa.String(500)),
+        sa.Column("degree", sa.String(255), nullable=False),
+        sa.Column("field_of_study", sa.String(255)),
+        sa.Column("grade", sa.String(50)),
+        sa.Column("grade_scale", sa.String(50)),
+        sa.Column("start_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("end_date", sa.DateTime(timezone=True)),
+        sa.Column("is_current", sa.Boolean),
+        sa.Column("description", sa.Text),
+        sa.Column("activities", sa.Text),
+        sa.Column("achievements", sa.Text),
+        sa.Column("is_certification", sa.Boolean),
+        sa.Column("certificate_url", sa.String(500)),
+        sa.Column("credential_id", sa.String(255)),
+        sa.Column("credential_url", sa.String(500)),
+        sa.Column("display_order", sa.Integer),
+        *_timestamps(),
+    ),
+    sa.Table(
+        "three_config",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("scene_name", sa.String(100), nullable=False, unique=True, index=True),
+        sa.Column("scene_type", sa.String(50)),
+        sa.Column("description", sa.String(500)),
+        sa.Column("settings", sa.JSON),
+        sa.Column("model_url", sa.String(500)),
+        sa.Column("environment_url", sa.String(500)),
+        sa.Column("texture_urls", sa.JSON),
+        sa.Column("is_active", sa.Boolean),
+        sa.Column("display_order", sa.Integer),
+        *_timestamps(),
+    ),
+    sa.Table(
+        "contacts",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("email", sa.String(255), nullable=False, index=True),
+        sa.Column("phone", sa.String(50)),
+        sa.Column("subject", sa.String(255)),
+        sa.Column("message", sa.Text, nullable=False),
+        sa.Column("is_read", sa.Boolean),
+        sa.Column("is_replied", sa.Boolean),
+        sa.Column("ip_address", sa.String(50)),
+        sa.Column("user_agent", sa.String(500)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("read_at", sa.DateTime(timezone=True)),
+        sa.Column("replied_at", sa.DateTime(timezone=True)),
+    ),
+    sa.Table(
+        "site_content",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True, index=True),
+        _owner(),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("is_active", sa.Boolean),
+        sa.Column("profile_slug", sa.String(100), unique=True, index=True),
+        sa.Column("display_name", sa.String(255)),
+        sa.Column("icon_text", sa.String(50)),
+        sa.Column("profile_image_url", sa.String(500)),
+        sa.Column("brand_initials", sa.String(20)),
+        sa.Column("brand_title", sa.String(255)),
+        sa.Column("brand_tagline", sa.String(255)),
+        sa.Column("nav_cta_text", sa.String(100)),
+        sa.Column("nav_cta_link", sa.String(500)),
+        sa.Column("eyebrow_text", sa.String(255)),
+        sa.Column("hero_title", sa.String(500)),
+        sa.Column("hero_subtitle", sa.String(1000)),
+        sa.Column("cta_primary_text", sa.String(100)),
+        sa.Column("cta_primary_link", sa.String(500)),
+        sa.Column("cta_secondary_text", sa.String(100)),
+        sa.Column("cta_secondary_link", sa.String(500)),
+        sa.Column("contact_title", sa.String(500)),
+        sa.Column("contact_subtitle", sa.String(1000)),
+        sa.Column("contact_email", sa.String(255)),
+        sa.Column("contact_location", sa.String(255)),
+        sa.Column("contact_availability", sa.String(255)),
+        sa.Column("contact_response_time", sa.String(255)),
+        sa.Column("footer_tagline", sa.String(500)),
+        sa.Column("footer_email", sa.String(255)),
+        sa.Column("footer_location", sa.String(255)),
+        sa.Column("footer_availability", sa.String(255)),
+        sa.Column("footer_links", sa.JSON),
+        sa.Column("footer_disclaimer", sa.String(500)),
+        sa.Column("footer_rights", sa.String(500)),
+        sa.Column("about_title", sa.String(500)),
+        sa.Column("about_body_primary", sa.String(1500)),
+        sa.Column("about_body_secondary", sa.String(1500)),
+        sa.Column("about_snapshot_focus", sa.String(255)),
+        sa.Column("about_snapshot_stack", sa.String(255)),
+        sa.Column("about_snapshot_availability", sa.String(255)),
+        *_timestamps(),
+    ),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    for table in TABLES:
+        if not inspector.has_table(table.name):
+            table.create(bind)
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                # Columns added after a table was first created are all nullable.
+                op.add_column(table.name, sa.Column(column.name, column.type, nullable=True))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table in reversed(TABLES):
+        table.drop(bind, checkfirst=True)
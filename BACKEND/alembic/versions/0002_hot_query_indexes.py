@@ -0,0 +1,43 @@
+"""Composite indexes for the per-owner list queries
+
+Revision ID: 0002_hot_query_indexes
+Revises: 0001_baseline
+Create Date: 2026-10-17
+
+Each index leads with the equality filters of a hot query in app/crud
+followed by its sort columns, so the query reads one owner's rows from an
+index range instead of scanning the table (and skips the sort where the
+ORDER BY matches the index). ``python -m benchmarks.query_plans``
+checks that the planner picks them. Databases built by ``create_all``
+after the models declared these indexes already have them; those are skipped.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_hot_query_indexes"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_projects_user_display_order", "projects", ["user_id", "display_order", "created_at"]),
+    ("ix_skills_user_category_order", "skills", ["user_id", "category", "display_order"]),
+    ("ix_experience_user_current_start", "experience", ["user_id", "is_current", "start_date"]),
+    ("ix_education_user_display_order", "education", ["user_id", "display_order", "start_date"]),
+    ("ix_site_content_user_active_updated", "site_content", ["user_id", "is_active", "updated_at"]),
+    ("ix_contacts_created_at", "contacts", ["created_at"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
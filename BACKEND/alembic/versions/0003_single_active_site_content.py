@@ -0,0 +1,73 @@
+"""At most one active site content row per user
+
+Revision ID: 0003_single_active_site_content
+Revises: 0002_hot_query_indexes
+Create Date: 2026-10-17
+
+Activation used to deactivate a user's rows and activate the chosen one in
+separate commits, so concurrent activations could leave two rows active.
+Extra active rows are switched off first, keeping the one get_active
+serves (latest update, then latest created). Then the partial unique index
+ux_site_content_user_active enforces the invariant. Databases built by
+``create_all`` after the model declared the index already have it; it is
+skipped there.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003_single_active_site_content"
+down_revision = "0002_hot_query_indexes"
+branch_labels = None
+depends_on = None
+
+INDEX = "ux_site_content_user_active"
+
+site_content = sa.table(
+    "site_content",
+    sa.column("id", sa.Integer),
+    sa.column("user_id", sa.Integer),
+    sa.column("is_active", sa.Boolean),
+    sa.column("created_at", sa.DateTime),
+    sa.column("updated_at", sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    ranked = (
+        sa.select(
+            site_content.c.id,
+            sa.func.row_number()
+            .over(
+                partition_by=site_content.c.user_id,
+                order_by=[
+                    site_content.c.updated_at.is_(None),
+                    site_content.c.updated_at.desc(),
+                    site_content.c.created_at.desc(),
+                    site_content.c.id.desc(),
+                ],
+            )
+            .label("rank"),
+        )
+        .where(site_content.c.is_active.is_(True))
+        .subquery()
+    )
+    op.execute(
+        site_content.update()
+        .where(site_content.c.id.in_(sa.select(ranked.c.id).where(ranked.c.rank > 1)))
+        .values(is_active=False)
+    )
+
+    existing = {index["name"] for index in sa.inspect(op.get_bind()).get_indexes("site_content")}
+    if INDEX not in existing:
+        op.create_index(
+            INDEX,
+            "site_content",
+            ["user_id"],
+            unique=True,
+            postgresql_where=sa.text("is_active"),
+            sqlite_where=sa.text("is_active"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="site_content")
@@ -0,0 +1,44 @@
+"""NOT NULL sort columns with server defaults
+
+Revision ID: 0004_not_null_sort_columns
+Revises: 0003_single_active_site_content
+Create Date: 2026-10-17
+
+The list keysets wrapped nullable sort columns in ``coalesce(...)``, so
+their ORDER BY could not follow the composite indexes from 0002 and the
+planner added a sort. NULLs are filled with the model default, then the
+columns become NOT NULL with a server default, and the keysets order by
+the bare columns. Batch mode rebuilds the tables on SQLite, which cannot
+alter a column in place.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004_not_null_sort_columns"
+down_revision = "0003_single_active_site_content"
+branch_labels = None
+depends_on = None
+
+# (table, column, type, value for existing NULLs, server default)
+COLUMNS = [
+    ("projects", "display_order", sa.Integer(), 0, sa.text("0")),
+    ("skills", "display_order", sa.Integer(), 0, sa.text("0")),
+    ("education", "display_order", sa.Integer(), 0, sa.text("0")),
+    ("experience", "is_current", sa.Boolean(), False, sa.false()),
+]
+
+
+def upgrade() -> None:
+    for table, column, type_, value, server_default in COLUMNS:
+        target = sa.table(table, sa.column(column, type_))
+        op.execute(target.update().where(target.c[column].is_(None)).values({column: value}))
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(
+                column, existing_type=type_, nullable=False, server_default=server_default
+            )
+
+
+def downgrade() -> None:
+    for table, column, type_, _, _ in reversed(COLUMNS):
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column(column, existing_type=type_, nullable=True, server_default=None)
@@ -1,14 +1,18 @@
 """
 API dependencies for authentication and database session.
 """
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+from typing import AsyncGenerator, Generator, Optional
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.core.config import settings
-from app.core.database import SessionLocal
+# get_async_db is re-exported so endpoints and dependency overrides share one function.
+from app.core.database import SessionLocal, get_async_db  # noqa: F401
+from app.core.replicas import async_read_session, read_session
 from app.core.security import decode_token
+from app.core.timing import measure
 from app.crud.user import user as user_crud
 from app.models.user import User
 from app.schemas.token import TokenPayload
@@ -33,6 +37,28 @@ def get_db() -> Generator:
         db.close()
 
 
+def get_read_db(request: Request) -> Generator:
+    """
+    Read-only database session dependency for public GET endpoints.
+    Reads from a replica (DATABASE_READ_URL) unless the lag policy keeps
+    this request on the primary. Never write through this session.
+    """
+    db = read_session(request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async read-only database session dependency for public GET endpoints.
+    Same routing as get_read_db.
+    """
+    async with async_read_session(request) as db:
+        yield db
+
+
 async def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
@@ -56,20 +82,21 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        payload = decode_token(token)
-        if payload is None:
-            raise credentials_exception
-        
-        token_data = TokenPayload(**payload)
-        if token_data.sub is None:
+    with measure("auth"):
+        try:
+            payload = decode_token(token)
+            if payload is None:
+                raise credentials_exception
+
+            token_data = TokenPayload(**payload)
+            if token_data.sub is None:
+                raise credentials_exception
+
+            user_id: int = token_data.sub
+        except (JWTError, ValueError):
             raise credentials_exception
-            
-        user_id: int = token_data.sub
-    except (JWTError, ValueError):
-        raise credentials_exception
-    
-    user = user_crud.get(db, id=user_id)
+
+        user = user_crud.get(db, id=user_id)
     if user is None:
         raise credentials_exception
     
@@ -140,17 +167,18 @@ def get_optional_user(
     if not token:
         return None
     
-    try:
-        payload = decode_token(token)
-        if payload is None:
-            return None
-        
-        token_data = TokenPayload(**payload)
-        if token_data.sub is None:
+    with measure("auth"):
+        try:
+            payload = decode_token(token)
+            if payload is None:
+                return None
+
+            token_data = TokenPayload(**payload)
+            if token_data.sub is None:
+                return None
+
+            user_id: int = token_data.sub
+            user = user_crud.get(db, id=user_id)
+            return user
+        except (JWTError, ValueError):
             return None
-            
-        user_id: int = token_data.sub
-        user = user_crud.get(db, id=user_id)
-        return user
-    except (JWTError, ValueError):
-        return None
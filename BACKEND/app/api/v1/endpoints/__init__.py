@@ -9,6 +9,8 @@ from app.api.v1.endpoints import (
     upload,
     profile,
     site_content,
+    portfolio,
+    internal,
 )
 
 __all__ = [
@@ -22,4 +24,6 @@ __all__ = [
     "upload",
     "profile",
     "site_content",
+    "portfolio",
+    "internal",
 ]
@@ -1,17 +1,26 @@
 """
 Contact endpoints - Submit and manage contact form messages.
 """
-from typing import List, Optional
+from typing import Optional
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_superuser
 from app.models.contact import Contact as ContactModel
-from app.schemas.contact import Contact, ContactCreate, ContactUpdate
+from app.schemas.contact import Contact, ContactCreate, ContactList, ContactUpdate
 from app.models.user import User
+from app.utils.pagination import KeyPart, Keyset
 
 router = APIRouter()
 
+# Newest first; id breaks ties between messages sent in the same instant.
+INBOX_ORDER = Keyset(
+    ContactModel,
+    KeyPart("created_at", descending=True),
+    KeyPart("id", descending=True),
+)
+
 
 @router.post("/", response_model=Contact, status_code=status.HTTP_201_CREATED)
 def create_contact(
@@ -42,22 +51,36 @@ def create_contact(
     return contact
 
 
-@router.get("/", response_model=List[Contact])
+@router.get("/", response_model=ContactList)
 def list_contacts(
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
     current_user: User = Depends(get_current_superuser)
-) -> List[Contact]:
-    """List contact messages (admin only)."""
-    contacts = (
-        db.query(ContactModel)
-        .order_by(ContactModel.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+) -> ContactList:
+    """List contact messages (admin only).
+
+    Pages by skip/limit, or by following next_cursor (keyset pagination).
+    total and unread_count count the whole inbox, so they are only computed
+    for the first page; cursor pages leave them out and cost one index range
+    scan each.
+    """
+    contacts = INBOX_ORDER.paginate(
+        db.query(ContactModel), skip=skip, limit=limit, cursor=cursor
+    ).all()
+    total = unread_count = None
+    if cursor is None:
+        total, unread_count = db.query(
+            func.count(ContactModel.id),
+            func.count(case((ContactModel.is_read.is_(False), 1))),
+        ).one()
+    return ContactList(
+        contacts=contacts,
+        total=total,
+        unread_count=unread_count,
+        next_cursor=INBOX_ORDER.next_cursor(contacts, limit),
     )
-    return contacts
 
 
 @router.put("/{contact_id}", response_model=Contact)
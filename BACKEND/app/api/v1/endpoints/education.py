@@ -1,60 +1,84 @@
 """
 Education endpoints - CRUD operations for education and certifications.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user
-from app.crud.base import CRUDBase
-from app.crud import site_content as site_content_crud
-from app.models.education import Education as EducationModel
-from app.schemas.education import Education, EducationCreate, EducationUpdate, EducationList
+from app.api.deps import get_async_read_db, get_db, get_read_db, get_current_active_user
+from app.crud import education as education_crud
+from app.crud import async_education, async_site_content
+from app.schemas.education import Education, EducationCreate, EducationUpdate, EducationList, EducationBulkResult
+from app.schemas.bulk import BulkRequest, ReorderRequest
 from app.models.user import User
+from app.core.cache import tag_response
+from app.core.serialization import encode_list, json_response
+from app.utils.conditional import build_validator, check_conditional
+from app.utils.bulk import validate_bulk
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter()
 
-# Create CRUD instance
-education_crud = CRUDBase[EducationModel, EducationCreate, EducationUpdate](EducationModel)
-
 
 @router.get("/", response_model=EducationList)
-def get_educations(
-    db: Session = Depends(get_db),
+async def get_educations(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     slug: str | None = Query(None, description="Profile slug filter"),
+    fields: str | None = Query(None, description="Comma-separated item fields to return, e.g. id,title"),
 ) -> EducationList:
     """Get all education entries."""
+    columns = parse_fields(fields, Education)
     if slug:
-        content = site_content_crud.get_by_slug(db, profile_slug=slug)
-        if not content:
+        owner = await async_site_content.resolve_slug(db, profile_slug=slug)
+        if not owner:
+            tag_response("education", slug=slug)
             return EducationList(educations=[], total=0)
-        educations = (
-            db.query(EducationModel)
-            .filter(EducationModel.user_id == content.user_id)
-            .order_by(EducationModel.display_order.asc(), EducationModel.start_date.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        validator = build_validator(
+            request, *await async_education.freshness(db, user_id=owner.user_id), owner.user_id
         )
-        total = len(educations)
+        not_modified = check_conditional(request, response, validator)
+        if not_modified:
+            return not_modified
+        page = await async_education.page(
+            db, skip=skip, limit=limit, columns=columns, user_id=owner.user_id
+        )
+        tag_response("education", owner.user_id, slug=slug)
     else:
-        educations = education_crud.get_multi(db, skip=skip, limit=limit)
-        total = education_crud.count(db)
-    return EducationList(educations=educations, total=total)
+        validator = build_validator(request, *await async_education.freshness(db))
+        not_modified = check_conditional(request, response, validator)
+        if not_modified:
+            return not_modified
+        page = await async_education.page(db, skip=skip, limit=limit, columns=columns)
+        tag_response("education")
+    return json_response(
+        encode_list(EducationList, item_fields=columns, educations=page.items, total=page.total),
+        response,
+    )
 
 
 @router.get("/{education_id}", response_model=Education)
 def get_education(
     education_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ) -> Education:
     """Get education by ID."""
+    validator = build_validator(request, *education_crud.freshness(db, id=education_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     education = education_crud.get(db, id=education_id)
     if not education:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Education not found"
         )
+    tag_response("education", education.user_id)
     return education
 
 
@@ -66,15 +90,65 @@ def create_education(
     current_user: User = Depends(get_current_active_user)
 ) -> Education:
     """Create new education entry (authentication required)."""
-    education_data = education_in.dict()
-    education_data["user_id"] = current_user.id
-    education = EducationModel(**education_data)
-    db.add(education)
-    db.commit()
-    db.refresh(education)
+    education = education_crud.create_with_user(
+        db, obj_in=education_in, user_id=current_user.id
+    )
     return education
 
 
+@router.post("/bulk", response_model=EducationBulkResult)
+def bulk_education(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> EducationBulkResult:
+    """Create, update and delete education entries in one transaction (authentication required).
+
+    Invalid items, and updates or deletes of missing or other users' entries,
+    are reported in errors; the rest are applied.
+    """
+    items = validate_bulk(bulk_in, EducationCreate, EducationUpdate)
+    result = education_crud.bulk(
+        db,
+        user_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+        creates=items.creates,
+        updates=items.updates,
+        deletes=items.deletes,
+    )
+    return {
+        "created": result.created,
+        "updated": result.updated,
+        "deleted": result.deleted,
+        "errors": [*items.errors, *result.errors],
+    }
+
+
+@router.post("/reorder", status_code=status.HTTP_204_NO_CONTENT)
+def reorder_education(
+    *,
+    db: Session = Depends(get_db),
+    reorder_in: ReorderRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> None:
+    """Set display_order of education entries to their position in ids (authentication required)."""
+    owners = education_crud.owners(db, ids=reorder_in.ids)
+    if len(owners) != len(reorder_in.ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Education not found"
+        )
+
+    if set(owners.values()) != {current_user.id} and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    education_crud.reorder(db, ids=reorder_in.ids, owners=owners)
+
+
 @router.put("/{education_id}", response_model=Education)
 def update_education(
     *,
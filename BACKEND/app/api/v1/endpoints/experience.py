@@ -2,57 +2,89 @@
 Experience endpoints - CRUD operations for work experience.
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_async_read_db, get_db, get_read_db, get_current_active_user
 from app.crud import experience as experience_crud
-from app.schemas.experience import Experience, ExperienceCreate, ExperienceUpdate, ExperienceList
+from app.crud import async_experience, async_site_content
+from app.schemas.experience import Experience, ExperienceCreate, ExperienceUpdate, ExperienceList, ExperienceBulkResult
+from app.schemas.bulk import BulkRequest
 from app.models.user import User
+from app.core.cache import tag_response
+from app.core.serialization import encode_list, json_response
+from app.utils.conditional import build_validator, check_conditional
+from app.utils.bulk import validate_bulk
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=ExperienceList)
-def get_experiences(
-    db: Session = Depends(get_db),
+async def get_experiences(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     user_id: Optional[int] = None,
     current_only: bool = False,
     slug: Optional[str] = Query(None, description="Profile slug filter"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,title"),
 ) -> ExperienceList:
     """Get all experience entries with optional filters."""
+    columns = parse_fields(fields, Experience)
+    by_slug = False
     if slug:
-        experiences = experience_crud.get_by_slug(db, profile_slug=slug, skip=skip, limit=limit)
-        if not experiences:
+        filters = {"profile_slug": slug}
+        last_modified, count = await async_experience.freshness(db, **filters)
+        by_slug = count > 0
+        if not by_slug:
             # Fall back to site content slug -> user_id
-            from app.crud import site_content as site_content_crud  # local import to avoid circular
-            content = site_content_crud.get_by_slug(db, profile_slug=slug)
-            if content:
-                user_id = content.user_id
-    if user_id and current_only:
-        experiences = experience_crud.get_current(db, user_id=user_id)
-    elif user_id:
-        experiences = experience_crud.get_by_user(db, user_id=user_id, skip=skip, limit=limit)
-    else:
-        experiences = experience_crud.get_multi(db, skip=skip, limit=limit)
-    
-    total = len(experiences) if slug or user_id else experience_crud.count(db)
-    return ExperienceList(experiences=experiences, total=total)
+            owner = await async_site_content.resolve_slug(db, profile_slug=slug)
+            if owner:
+                user_id = owner.user_id
+    if not by_slug:
+        if user_id:
+            filters = {"user_id": user_id, "is_current": True if current_only else None}
+        else:
+            filters = {}
+        last_modified, count = await async_experience.freshness(db, **filters)
+    validator = build_validator(request, last_modified, count, user_id)
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
+    page = await async_experience.page(db, skip=skip, limit=limit, columns=columns, **filters)
+    tag_response("experience", None if by_slug else user_id, slug=slug)
+    return json_response(
+        encode_list(
+            ExperienceList, item_fields=columns, experiences=page.items, total=page.total
+        ),
+        response,
+    )
 
 
 @router.get("/{experience_id}", response_model=Experience)
 def get_experience(
     experience_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ) -> Experience:
     """Get experience by ID."""
+    validator = build_validator(request, *experience_crud.freshness(db, id=experience_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     experience = experience_crud.get(db, id=experience_id)
     if not experience:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Experience not found"
         )
+    tag_response("experience", experience.user_id)
     return experience
 
 
@@ -70,6 +102,35 @@ def create_experience(
     return experience
 
 
+@router.post("/bulk", response_model=ExperienceBulkResult)
+def bulk_experience(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> ExperienceBulkResult:
+    """Create, update and delete experience entries in one transaction (authentication required).
+
+    Invalid items, and updates or deletes of missing or other users' entries,
+    are reported in errors; the rest are applied.
+    """
+    items = validate_bulk(bulk_in, ExperienceCreate, ExperienceUpdate)
+    result = experience_crud.bulk(
+        db,
+        user_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+        creates=items.creates,
+        updates=items.updates,
+        deletes=items.deletes,
+    )
+    return {
+        "created": result.created,
+        "updated": result.updated,
+        "deleted": result.deleted,
+        "errors": [*items.errors, *result.errors],
+    }
+
+
 @router.put("/{experience_id}", response_model=Experience)
 def update_experience(
     *,
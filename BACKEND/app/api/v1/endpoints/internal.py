@@ -0,0 +1,58 @@
+"""
+Internal endpoints - Runtime diagnostics for operators (admin only).
+"""
+from typing import Any, Dict
+from fastapi import APIRouter, Depends
+from app.api.deps import get_current_superuser
+from app.core.cache import owner_counter_stats, response_cache
+from app.core.config import settings
+from app.core.database import db_url, pool_monitors
+from app.core.replicas import replica_stats
+from app.core.sqlite import writer_queue
+from app.crud import site_content as site_content_crud
+from app.crud import three_config as three_config_crud
+from app.middleware.coalesce import coalescing_stats
+from app.middleware.compression import compression_stats
+from app.middleware.response_cache import revalidation_stats
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("/cache-stats")
+def get_cache_stats(
+    current_user: User = Depends(get_current_superuser),
+) -> Dict[str, Any]:
+    """Report hit/miss counters for in-process caches (admin only)."""
+    return {
+        "slug_resolution": site_content_crud.slug_cache.stats(),
+        "missing_slugs": site_content_crud.missing_slugs.stats(),
+        "missing_scenes": three_config_crud.missing_scenes.stats(),
+        "owner_counters": owner_counter_stats(),
+        "responses": response_cache.stats() if response_cache else None,
+        "revalidation": dict(revalidation_stats),
+        "coalescing": dict(coalescing_stats),
+        "compression": dict(compression_stats),
+    }
+
+
+@router.get("/db-pool")
+def get_db_pool_stats(
+    current_user: User = Depends(get_current_superuser),
+) -> Dict[str, Any]:
+    """Report connection pool usage for this worker process (admin only)."""
+    return {
+        "settings": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        },
+        "engines": {name: monitor.report() for name, monitor in pool_monitors.items()},
+        "read_routing": replica_stats(),
+        "sqlite_writer_queue": (
+            writer_queue.stats()
+            if db_url.startswith("sqlite") and settings.SQLITE_WRITER_QUEUE
+            else None
+        ),
+    }
@@ -0,0 +1,35 @@
+"""
+Portfolio endpoints - Public profile bundle served in a single request.
+"""
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_async_read_db
+from app.core.cache import tag_response
+from app.core.serialization import json_response
+from app.crud import async_portfolio
+from app.schemas.portfolio import PortfolioBundle
+from app.utils.conditional import check_conditional
+
+router = APIRouter()
+
+
+@router.get("/{slug}", response_model=PortfolioBundle)
+async def get_portfolio(
+    slug: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Response:
+    """Get site content, projects, skills, experience, education and 3D configs for a profile slug."""
+    snapshot = await async_portfolio.get_by_slug(db, profile_slug=slug)
+    if not snapshot:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Portfolio not found"
+        )
+    owner_id = snapshot.bundle.site_content.user_id
+    for entity in ("site_content", "project", "skill", "experience", "education"):
+        tag_response(entity, owner_id, slug=slug)
+    tag_response("three_config")
+
+    response = json_response(snapshot.body)
+    return check_conditional(request, response, snapshot.validator) or response
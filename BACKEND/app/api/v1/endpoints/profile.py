@@ -1,12 +1,13 @@
 """
 Profile endpoints - User profile management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from app.api.deps import get_db, get_current_active_user
 from app.crud import user as user_crud
 from app.schemas.user import User, UserUpdate
 from app.models.user import User as UserModel
+from app.utils.conditional import build_validator, check_conditional
 
 router = APIRouter()
 
@@ -34,9 +35,16 @@ def update_my_profile(
 @router.get("/{user_id}", response_model=User)
 def get_user_profile(
     user_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db)
 ) -> User:
     """Get user profile by ID (public endpoint)."""
+    validator = build_validator(request, *user_crud.freshness(db, id=user_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     user = user_crud.get(db, id=user_id)
     if not user:
         raise HTTPException(
@@ -2,65 +2,100 @@
 Project endpoints - CRUD operations for portfolio projects.
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user, get_optional_user
+from app.api.deps import get_async_read_db, get_db, get_read_db, get_current_active_user
 from app.crud import project as project_crud
-from app.crud import site_content as site_content_crud
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectList
+from app.crud import async_project, async_site_content
+from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectList, ProjectBulkResult
+from app.schemas.bulk import BulkRequest, ReorderRequest
 from app.models.user import User
+from app.core.cache import tag_response
+from app.core.serialization import encode_list, json_response
+from app.utils.conditional import build_validator, check_conditional
+from app.utils.bulk import validate_bulk
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=ProjectList)
-def get_projects(
-    db: Session = Depends(get_db),
+async def get_projects(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     category: Optional[str] = None,
     featured: Optional[bool] = None,
     slug: Optional[str] = Query(None, description="Profile slug filter"),
-    current_user: Optional[User] = Depends(get_optional_user)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,title"),
 ) -> ProjectList:
-    """Get all projects with optional filters."""
+    """Get all projects with optional filters.
+
+    Pages by skip/limit, or by following next_cursor (keyset pagination).
+    ``fields`` returns only the listed fields of each project.
+    """
+    columns = parse_fields(fields, Project)
     if slug:
-        content = site_content_crud.get_by_slug(db, profile_slug=slug)
-        if content:
-            user_id = content.user_id
+        owner = await async_site_content.resolve_slug(db, profile_slug=slug)
+        if owner:
+            user_id = owner.user_id
         else:
+            tag_response("project", slug=slug)
             return ProjectList(projects=[], total=0)
     else:
         user_id = None
 
     if featured:
-        projects = project_crud.get_featured(db, skip=skip, limit=limit, user_id=user_id)
+        filters = {"featured": True, "user_id": user_id or None}
     elif category:
-        if user_id:
-            projects = project_crud.get_by_category(db, category=category, skip=skip, limit=limit, user_id=user_id)
-        else:
-            projects = project_crud.get_by_category(db, category=category, skip=skip, limit=limit)
-    elif user_id:
-        projects = project_crud.get_by_user(db, user_id=user_id, skip=skip, limit=limit)
+        filters = {"category": category, "user_id": user_id or None}
     else:
-        projects = project_crud.get_multi(db, skip=skip, limit=limit)
-    
-    total = len(projects) if user_id else project_crud.count(db)
-    return ProjectList(projects=projects, total=total)
+        filters = {"user_id": user_id or None}
+    validator = build_validator(request, *await async_project.freshness(db, **filters), user_id)
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
+    page = await async_project.page(
+        db, skip=skip, limit=limit, cursor=cursor, columns=columns, **filters
+    )
+    tag_response("project", user_id, slug=slug)
+    return json_response(
+        encode_list(
+            ProjectList,
+            item_fields=columns,
+            projects=page.items,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        ),
+        response,
+    )
 
 
 @router.get("/{project_id}", response_model=Project)
 def get_project(
     project_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ) -> Project:
     """Get project by ID."""
+    validator = build_validator(request, *project_crud.freshness(db, id=project_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     project = project_crud.get(db, id=project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found"
         )
+    tag_response("project", project.user_id)
     return project
 
 
@@ -78,6 +113,59 @@ def create_project(
     return project
 
 
+@router.post("/bulk", response_model=ProjectBulkResult)
+def bulk_projects(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> ProjectBulkResult:
+    """Create, update and delete projects in one transaction (authentication required).
+
+    Invalid items, and updates or deletes of missing or other users' projects,
+    are reported in errors; the rest are applied.
+    """
+    items = validate_bulk(bulk_in, ProjectCreate, ProjectUpdate)
+    result = project_crud.bulk(
+        db,
+        user_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+        creates=items.creates,
+        updates=items.updates,
+        deletes=items.deletes,
+    )
+    return {
+        "created": result.created,
+        "updated": result.updated,
+        "deleted": result.deleted,
+        "errors": [*items.errors, *result.errors],
+    }
+
+
+@router.post("/reorder", status_code=status.HTTP_204_NO_CONTENT)
+def reorder_projects(
+    *,
+    db: Session = Depends(get_db),
+    reorder_in: ReorderRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> None:
+    """Set display_order of projects to their position in ids (authentication required)."""
+    owners = project_crud.owners(db, ids=reorder_in.ids)
+    if len(owners) != len(reorder_in.ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    if set(owners.values()) != {current_user.id} and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    project_crud.reorder(db, ids=reorder_in.ids, owners=owners)
+
+
 @router.put("/{project_id}", response_model=Project)
 def update_project(
     *,
@@ -2,10 +2,12 @@
 Site content endpoints - Admin CRUD for homepage hero content.
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_async_read_db, get_db, get_current_active_user
 from app.crud import site_content as site_content_crud
+from app.crud import async_site_content
 from app.models.user import User
 from app.schemas.site_content import (
     SiteContent,
@@ -13,27 +15,37 @@ from app.schemas.site_content import (
     SiteContentUpdate,
     SiteContentList,
 )
+from app.core.cache import tag_response
+from app.utils.conditional import check_conditional
 
 router = APIRouter()
 
 
 @router.get("/public", response_model=SiteContent)
-def get_public_site_content(
-    db: Session = Depends(get_db),
+async def get_public_site_content(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
     slug: Optional[str] = Query(None, description="Profile slug"),
-) -> SiteContent:
-    """Get currently active site content for public pages."""
-    if slug:
-        content = site_content_crud.get_by_slug(db, profile_slug=slug)
-    else:
-        # If no slug, fall back to first active across users (legacy behavior)
-        content = site_content_crud.get_active(db)
-    if not content:
+) -> Response:
+    """Get currently active site content for public pages.
+
+    Served from JSON rendered once per slug (or for the legacy no-slug
+    default, the first active row across users) and re-rendered on write.
+    """
+    rendered = await async_site_content.get_public_json(db, profile_slug=slug)
+    if not rendered:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active site content found",
         )
-    return content
+    if slug:
+        tag_response("site_content", rendered.user_id, slug=slug)
+    else:
+        # Legacy default: any owner's activation can change which row wins.
+        tag_response("site_content")
+
+    response = Response(content=rendered.body, media_type="application/json")
+    return check_conditional(request, response, rendered.validator) or response
 
 
 @router.get("/", response_model=SiteContentList)
@@ -44,13 +56,9 @@ def list_site_content(
     current_user: User = Depends(get_current_active_user),
 ) -> SiteContentList:
     """List all site content entries (admin only)."""
-    if current_user.is_superuser:
-        contents = site_content_crud.get_multi(db, skip=skip, limit=limit)
-        total = site_content_crud.count(db)
-    else:
-        contents = site_content_crud.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
-        total = len(contents)
-    return SiteContentList(contents=contents, total=total)
+    owner_id = None if current_user.is_superuser else current_user.id
+    page = site_content_crud.page(db, skip=skip, limit=limit, user_id=owner_id)
+    return SiteContentList(contents=page.items, total=page.total)
 
 
 @router.get("/{content_id}", response_model=SiteContent)
@@ -109,12 +117,7 @@ def update_site_content(
             detail="Not enough permissions",
         )
 
-    updated = site_content_crud.update(db, db_obj=content, obj_in=content_in)
-    if content_in.is_active:
-        activated = site_content_crud.set_active(db, content_id=updated.id)
-        if activated:
-            return activated
-    return updated
+    return site_content_crud.update(db, db_obj=content, obj_in=content_in)
 
 
 @router.post("/{content_id}/activate", response_model=SiteContent)
@@ -125,7 +128,7 @@ def activate_site_content(
     current_user: User = Depends(get_current_active_user),
 ) -> SiteContent:
     """Mark one site content row as active (admin only)."""
-    content = site_content_crud.set_active(db, content_id=content_id)
+    content = site_content_crud.get(db, id=content_id)
     if not content:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +139,7 @@ def activate_site_content(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
-    return content
+    return site_content_crud.set_active(db, db_obj=content)
 
 
 @router.delete("/{content_id}", status_code=status.HTTP_204_NO_CONTENT)
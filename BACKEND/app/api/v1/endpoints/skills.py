@@ -2,57 +2,96 @@
 Skills endpoints - CRUD operations for user skills.
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_active_user
+from app.api.deps import get_async_read_db, get_db, get_read_db, get_current_active_user
 from app.crud import skill as skill_crud
-from app.crud import site_content as site_content_crud
-from app.schemas.skill import Skill, SkillCreate, SkillUpdate, SkillList
+from app.crud import async_site_content, async_skill
+from app.schemas.skill import Skill, SkillCreate, SkillUpdate, SkillList, SkillBulkResult
+from app.schemas.bulk import BulkRequest, ReorderRequest
 from app.models.user import User
+from app.core.cache import tag_response
+from app.core.serialization import encode_list, json_response
+from app.utils.conditional import build_validator, check_conditional
+from app.utils.bulk import validate_bulk
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter()
 
 
 @router.get("/", response_model=SkillList)
-def get_skills(
-    db: Session = Depends(get_db),
+async def get_skills(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     category: Optional[str] = None,
     user_id: Optional[int] = None,
     slug: Optional[str] = Query(None, description="Profile slug filter"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; replaces skip"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,title"),
 ) -> SkillList:
-    """Get all skills with optional filters."""
+    """Get all skills with optional filters.
+
+    Pages by skip/limit, or by following next_cursor (keyset pagination).
+    ``fields`` returns only the listed fields of each skill.
+    """
+    columns = parse_fields(fields, Skill)
     if slug:
-        content = site_content_crud.get_by_slug(db, profile_slug=slug)
-        if content:
-            user_id = content.user_id
+        owner = await async_site_content.resolve_slug(db, profile_slug=slug)
+        if owner:
+            user_id = owner.user_id
         else:
+            tag_response("skill", slug=slug)
             return SkillList(skills=[], total=0)
 
-    if user_id and category:
-        skills = skill_crud.get_by_category(db, user_id=user_id, category=category)
-    elif user_id:
-        skills = skill_crud.get_by_user(db, user_id=user_id, skip=skip, limit=limit)
+    if user_id:
+        filters = {"user_id": user_id, "category": category}
     else:
-        skills = skill_crud.get_multi(db, skip=skip, limit=limit)
-    
-    total = len(skills) if slug or user_id else skill_crud.count(db)
-    return SkillList(skills=skills, total=total)
+        filters = {}
+    validator = build_validator(request, *await async_skill.freshness(db, **filters), user_id)
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
+    page = await async_skill.page(
+        db, skip=skip, limit=limit, cursor=cursor, columns=columns, **filters
+    )
+    tag_response("skill", user_id, slug=slug)
+    return json_response(
+        encode_list(
+            SkillList,
+            item_fields=columns,
+            skills=page.items,
+            total=page.total,
+            next_cursor=page.next_cursor,
+        ),
+        response,
+    )
 
 
 @router.get("/{skill_id}", response_model=Skill)
 def get_skill(
     skill_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ) -> Skill:
     """Get skill by ID."""
+    validator = build_validator(request, *skill_crud.freshness(db, id=skill_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     skill = skill_crud.get(db, id=skill_id)
     if not skill:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Skill not found"
         )
+    tag_response("skill", skill.user_id)
     return skill
 
 
@@ -70,6 +109,59 @@ def create_skill(
     return skill
 
 
+@router.post("/bulk", response_model=SkillBulkResult)
+def bulk_skills(
+    *,
+    db: Session = Depends(get_db),
+    bulk_in: BulkRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> SkillBulkResult:
+    """Create, update and delete skills in one transaction (authentication required).
+
+    Invalid items, and updates or deletes of missing or other users' skills,
+    are reported in errors; the rest are applied.
+    """
+    items = validate_bulk(bulk_in, SkillCreate, SkillUpdate)
+    result = skill_crud.bulk(
+        db,
+        user_id=current_user.id,
+        is_superuser=current_user.is_superuser,
+        creates=items.creates,
+        updates=items.updates,
+        deletes=items.deletes,
+    )
+    return {
+        "created": result.created,
+        "updated": result.updated,
+        "deleted": result.deleted,
+        "errors": [*items.errors, *result.errors],
+    }
+
+
+@router.post("/reorder", status_code=status.HTTP_204_NO_CONTENT)
+def reorder_skills(
+    *,
+    db: Session = Depends(get_db),
+    reorder_in: ReorderRequest,
+    current_user: User = Depends(get_current_active_user)
+) -> None:
+    """Set display_order of skills to their position in ids (authentication required)."""
+    owners = skill_crud.owners(db, ids=reorder_in.ids)
+    if len(owners) != len(reorder_in.ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Skill not found"
+        )
+
+    if set(owners.values()) != {current_user.id} and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    skill_crud.reorder(db, ids=reorder_in.ids, owners=owners)
+
+
 @router.put("/{skill_id}", response_model=Skill)
 def update_skill(
     *,
@@ -1,69 +1,101 @@
 """
 3D Assets endpoints - CRUD operations for Three.js configurations.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.api.deps import get_db, get_current_superuser
-from app.crud.base import CRUDBase
-from app.models.three_config import ThreeConfig as ThreeConfigModel
+from app.api.deps import get_async_read_db, get_db, get_read_db, get_current_superuser
+from app.crud import three_config as three_config_crud
+from app.crud import async_three_config
 from app.schemas.three_config import ThreeConfig, ThreeConfigCreate, ThreeConfigUpdate, ThreeConfigList
+from app.schemas.bulk import ReorderRequest
 from app.models.user import User
+from app.core.cache import tag_response
+from app.core.serialization import encode_list, json_response
+from app.utils.conditional import build_validator, check_conditional
+from app.utils.fieldsets import parse_fields
 
 router = APIRouter()
 
-# Create CRUD instance
-three_config_crud = CRUDBase[ThreeConfigModel, ThreeConfigCreate, ThreeConfigUpdate](ThreeConfigModel)
-
 
 @router.get("/", response_model=ThreeConfigList)
-def get_three_configs(
-    db: Session = Depends(get_db),
+async def get_three_configs(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    scene_type: str = None
+    scene_type: str = None,
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return, e.g. id,title"),
 ) -> ThreeConfigList:
     """Get all 3D configurations."""
-    if scene_type:
-        configs = db.query(ThreeConfigModel).filter(
-            ThreeConfigModel.scene_type == scene_type
-        ).offset(skip).limit(limit).all()
-    else:
-        configs = three_config_crud.get_multi(db, skip=skip, limit=limit)
-    
-    total = three_config_crud.count(db)
-    return ThreeConfigList(configs=configs, total=total)
+    columns = parse_fields(fields, ThreeConfig)
+    validator = build_validator(request, *await async_three_config.freshness(db, scene_type=scene_type))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
+    page = await async_three_config.page(
+        db, skip=skip, limit=limit, columns=columns, scene_type=scene_type
+    )
+    tag_response("three_config")
+    return json_response(
+        encode_list(ThreeConfigList, item_fields=columns, configs=page.items, total=page.total),
+        response,
+    )
 
 
 @router.get("/by-scene/{scene_name}", response_model=ThreeConfig)
-def get_three_config_by_scene(
+async def get_three_config_by_scene(
     scene_name: str,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_read_db)
 ) -> ThreeConfig:
     """Get 3D configuration by scene name."""
-    config = db.query(ThreeConfigModel).filter(
-        ThreeConfigModel.scene_name == scene_name
-    ).first()
-    
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"Configuration for scene '{scene_name}' not found"
+    )
+    if async_three_config.scene_missing(scene_name):
+        raise not_found
+    last_modified, count = await async_three_config.scene_freshness(db, scene_name=scene_name)
+    if count == 0:
+        raise not_found
+    validator = build_validator(request, last_modified, count)
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
+    config = await async_three_config.get_by_scene(db, scene_name=scene_name)
+
     if not config:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Configuration for scene '{scene_name}' not found"
-        )
+        raise not_found
+    tag_response("three_config", config.user_id, scene=scene_name)
     return config
 
 
 @router.get("/{config_id}", response_model=ThreeConfig)
 def get_three_config(
     config_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db)
 ) -> ThreeConfig:
     """Get 3D configuration by ID."""
+    validator = build_validator(request, *three_config_crud.freshness(db, id=config_id))
+    not_modified = check_conditional(request, response, validator)
+    if not_modified:
+        return not_modified
+
     config = three_config_crud.get(db, id=config_id)
     if not config:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Configuration not found"
         )
+    tag_response("three_config", config.user_id)
     return config
 
 
@@ -76,25 +108,44 @@ def create_three_config(
 ) -> ThreeConfig:
     """Create new 3D configuration (authentication required)."""
     # Check if scene name already exists
-    existing = db.query(ThreeConfigModel).filter(
-        ThreeConfigModel.scene_name == config_in.scene_name
-    ).first()
-    
+    existing = three_config_crud.get_by_scene(db, scene_name=config_in.scene_name)
+
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Configuration for scene '{config_in.scene_name}' already exists"
         )
     
-    config_data = config_in.dict()
-    config_data["user_id"] = current_user.id
-    config = ThreeConfigModel(**config_data)
-    db.add(config)
-    db.commit()
-    db.refresh(config)
+    config = three_config_crud.create_with_user(
+        db, obj_in=config_in, user_id=current_user.id
+    )
     return config
 
 
+@router.post("/reorder", status_code=status.HTTP_204_NO_CONTENT)
+def reorder_three_configs(
+    *,
+    db: Session = Depends(get_db),
+    reorder_in: ReorderRequest,
+    current_user: User = Depends(get_current_superuser)
+) -> None:
+    """Set display_order of 3D configurations to their position in ids (authentication required)."""
+    owners = three_config_crud.owners(db, ids=reorder_in.ids)
+    if len(owners) != len(reorder_in.ids):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Configuration not found"
+        )
+
+    if set(owners.values()) != {current_user.id} and not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+
+    three_config_crud.reorder(db, ids=reorder_in.ids, owners=owners)
+
+
 @router.put("/{config_id}", response_model=ThreeConfig)
 def update_three_config(
     *,
@@ -1,7 +1,10 @@
 """
 API v1 router - Aggregates all endpoint routers.
 """
+from typing import Dict
 from fastapi import APIRouter
+from app.core.cache import CachePolicy
+from app.core.config import settings
 from app.api.v1.endpoints import (
     auth,
     contact,
@@ -13,6 +16,8 @@ from app.api.v1.endpoints import (
     upload,
     profile,
     site_content,
+    portfolio,
+    internal,
 )
 
 api_router = APIRouter()
@@ -28,3 +33,21 @@ api_router.include_router(three_assets.router, prefix="/three-config", tags=["3D
 api_router.include_router(upload.router, prefix="/upload", tags=["File Upload"])
 api_router.include_router(profile.router, prefix="/profile", tags=["Profile"])
 api_router.include_router(site_content.router, prefix="/site-content", tags=["Site Content"])
+api_router.include_router(portfolio.router, prefix="/portfolio", tags=["Portfolio"])
+api_router.include_router(internal.router, prefix="/internal", tags=["Internal"])
+
+# Response cache freshness per route group, keyed by the prefixes above.
+# Scene configs and site content change rarely and are read on every page
+# load; lists edited from the admin panel get a shorter max_age.
+cache_policies: Dict[str, CachePolicy] = {
+    "/site-content": CachePolicy(max_age=300, stale_window=900),
+    "/portfolio": CachePolicy(max_age=300, stale_window=900),
+    "/three-config": CachePolicy(max_age=600, stale_window=1800),
+    "/projects": CachePolicy(max_age=120, stale_window=300),
+    "/skills": CachePolicy(max_age=120, stale_window=300),
+    "/experience": CachePolicy(max_age=120, stale_window=300),
+    "/education": CachePolicy(max_age=120, stale_window=300),
+}
+cache_policies.update(
+    (group, CachePolicy(*values)) for group, values in settings.RESPONSE_CACHE_POLICIES.items()
+)
@@ -1,5 +1,13 @@
 from app.core.config import settings
-from app.core.database import Base, engine, SessionLocal, get_db
+from app.core.database import (
+    Base,
+    engine,
+    SessionLocal,
+    get_db,
+    async_engine,
+    AsyncSessionLocal,
+    get_async_db,
+)
 from app.core.security import (
     create_access_token,
     create_refresh_token,
@@ -14,6 +22,9 @@ __all__ = [
     "engine",
     "SessionLocal",
     "get_db",
+    "async_engine",
+    "AsyncSessionLocal",
+    "get_async_db",
     "create_access_token",
     "create_refresh_token",
     "verify_password",
@@ -0,0 +1,728 @@
+"""
+Caching primitives: an in-process LRU cache and the tagged response cache
+backends (in-process and Redis) used for public GET routes.
+"""
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import (
+    Any, Awaitable, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+)
+from app.core.config import settings
+from app.core.invalidation import TRACKED_TABLES, Change, subscribe
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with optional expiry and hit/miss counters."""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[Hashable], None]] = None,
+    ):
+        """
+        Args:
+            maxsize: Maximum number of entries kept; least recently used go first
+            ttl: Default lifetime in seconds, or None to keep entries until evicted
+            on_evict: Called with the key of each entry dropped for size or expiry
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value, or default if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at is None or expires_at > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+            self.misses += 1
+        if self.on_evict:
+            self.on_evict(key)
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        evicted = []
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                evicted.append(self._data.popitem(last=False)[0])
+                self.evictions += 1
+        if self.on_evict:
+            for old_key in evicted:
+                self.on_evict(old_key)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove one entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def evict_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """Remove every entry for which predicate(key, value) is true."""
+        with self._lock:
+            doomed = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+            for key in doomed:
+                del self._data[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class SnapshotStore:
+    """Keyed snapshots of derived data, dropped when their source rows change.
+
+    A snapshot built concurrently with an invalidation is returned to its
+    caller but not stored, so a stale build can never outlive the write
+    that made it stale.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        return self._cache.get(key)
+
+    def get_or_build(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the stored snapshot, or build, store and return it.
+
+        A build returning None is not stored.
+        """
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        generation = self._generation
+        value = build()
+        self._store(key, value, generation)
+        return value
+
+    async def aget_or_build(self, key: Hashable, build: Callable[[], Awaitable[Any]]) -> Any:
+        """get_or_build for builders that await the database."""
+        value = self._cache.get(key)
+        if value is not None:
+            return value
+        generation = self._generation
+        value = await build()
+        self._store(key, value, generation)
+        return value
+
+    def _store(self, key: Hashable, value: Any, generation: int) -> None:
+        """Keep a built value unless it is None or an invalidation ran since the build began."""
+        if value is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._cache.set(key, value)
+
+    def evict_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        with self._lock:
+            self._generation += 1
+            return self._cache.evict_where(predicate)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+class SharedGeneration:
+    """Invalidation counter seen by every worker, kept in a shared response cache backend.
+
+    Per-worker caches store the value current when an entry was filled and
+    drop the entry once it has moved, so a write handled by one worker
+    reaches the others. The counter is read at most once every ``poll``
+    seconds, which bounds both the lag and the extra round trips. With a
+    per-process backend (or none) it stays 0 and only local invalidation
+    applies.
+    """
+
+    def __init__(self, name: str, backend: Optional["CacheBackend"], poll: float = 1.0):
+        self.name = name
+        self.backend = backend if backend is not None and backend.shared else None
+        self.poll = poll
+        self._value = 0
+        self._read_at: Optional[float] = None
+
+    def current(self) -> int:
+        if self.backend is None:
+            return 0
+        now = time.monotonic()
+        if self._read_at is None or now - self._read_at >= self.poll:
+            try:
+                self._value = self.backend.generation(self.name)
+            except Exception:
+                logger.exception("Reading shared generation %s failed", self.name)
+            self._read_at = now
+        return self._value
+
+    def bump(self) -> None:
+        if self.backend is None:
+            return
+        try:
+            self.backend.bump_generation(self.name)
+        except Exception:
+            logger.exception("Bumping shared generation %s failed", self.name)
+        self._read_at = None
+
+
+class NegativeCache:
+    """Bounded, short-lived record of lookups that found nothing.
+
+    Callers take a ``token()`` before querying and pass it to
+    ``mark_missing``; a miss that raced a ``forget`` for the same data is
+    not recorded, so a key created mid-lookup is never hidden. With a
+    ``shared`` generation, a ``forget`` in any worker also drops the
+    misses every other worker recorded.
+    """
+
+    def __init__(
+        self, maxsize: int = 4096, ttl: float = 30.0, shared: Optional[SharedGeneration] = None
+    ):
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.shared = shared
+
+    def _shared_generation(self) -> int:
+        return self.shared.current() if self.shared is not None else 0
+
+    def is_missing(self, key: Hashable) -> bool:
+        recorded = self._cache.get(key)
+        if recorded is None:
+            return False
+        if recorded != self._shared_generation():
+            self._cache.delete(key)
+            return False
+        return True
+
+    def token(self) -> Tuple[int, int]:
+        return self._generation, self._shared_generation()
+
+    def mark_missing(self, key: Hashable, token: Tuple[int, int]) -> None:
+        generation, shared_generation = token
+        with self._lock:
+            if generation == self._generation:
+                self._cache.set(key, shared_generation)
+
+    def forget(self, keys: Iterable[Hashable]) -> None:
+        """Drop keys that now exist."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._cache.delete(key)
+        if self.shared is not None:
+            self.shared.bump()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+        if self.shared is not None:
+            self.shared.bump()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+class OwnerCounters:
+    """Row counts of one entity per owner (key None: every owner).
+
+    A committed write to the entity drops its owner's count and the overall
+    count, and the next read recounts. With a ``shared`` generation, the
+    write also drops every count of the entity in the other workers (within
+    the generation's poll interval); otherwise ``ttl`` bounds how long a
+    write made by another worker can go unnoticed. Like NegativeCache, a
+    count taken while a write committed is not stored.
+    """
+
+    def __init__(
+        self,
+        entity: str,
+        maxsize: int = 4096,
+        ttl: Optional[float] = None,
+        shared: Optional[SharedGeneration] = None,
+    ):
+        self.entity = entity
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.shared = shared
+
+    def _shared_generation(self) -> int:
+        return self.shared.current() if self.shared is not None else 0
+
+    def get(self, user_id: Optional[int]) -> Optional[int]:
+        entry = self._cache.get(user_id)
+        if entry is None:
+            return None
+        count, shared_generation = entry
+        if shared_generation != self._shared_generation():
+            self._cache.delete(user_id)
+            return None
+        return count
+
+    def token(self) -> Tuple[int, int]:
+        return self._generation, self._shared_generation()
+
+    def set(self, user_id: Optional[int], count: int, token: Tuple[int, int]) -> None:
+        generation, shared_generation = token
+        with self._lock:
+            if generation == self._generation:
+                self._cache.set(user_id, (count, shared_generation))
+
+    def invalidate(self, changes: List[Change]) -> None:
+        """Drop counts touched by committed writes to this entity."""
+        touched = False
+        with self._lock:
+            for change in changes:
+                if change.entity != self.entity:
+                    continue
+                touched = True
+                self._generation += 1
+                if change.user_id is None:
+                    self._cache.clear()
+                    break
+                self._cache.delete(change.user_id)
+                self._cache.delete(None)
+        if touched and self.shared is not None:
+            self.shared.bump()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+_owner_counters: Dict[str, OwnerCounters] = {}
+
+
+def owner_counters(table: str) -> Optional[OwnerCounters]:
+    """Counters for a table, shared by its sync and async CRUD objects.
+
+    None for tables the change feed does not track, whose counts could
+    never be invalidated.
+    """
+    if table not in TRACKED_TABLES:
+        return None
+    if table not in _owner_counters:
+        counters = OwnerCounters(
+            TRACKED_TABLES[table][0],
+            maxsize=settings.COUNTER_CACHE_MAXSIZE,
+            ttl=settings.COUNTER_CACHE_TTL,
+            shared=shared_generation(f"counters:{table}"),
+        )
+        subscribe(counters.invalidate)
+        _owner_counters[table] = counters
+    return _owner_counters[table]
+
+
+def owner_counter_stats() -> Dict[str, Any]:
+    """Stats of every table's counters, for /internal/cache-stats."""
+    return {table: counters.stats() for table, counters in _owner_counters.items()}
+
+
+class CachePolicy(NamedTuple):
+    """Freshness rules for a group of cached routes.
+
+    An entry younger than ``max_age`` is served as is. For ``stale_window``
+    seconds after that it is still served, but one background request
+    refreshes it; past both it is gone and the next request rebuilds it.
+    """
+
+    max_age: float
+    stale_window: float = 0.0
+
+    @property
+    def lifetime(self) -> float:
+        """How long the backend keeps an entry."""
+        return self.max_age + self.stale_window
+
+
+class CacheBackend(ABC):
+    """Interface for tagged response cache stores.
+
+    Entries are opaque bytes. Each entry is registered under one or more
+    tags, and purging a tag drops every entry registered under it.
+    """
+
+    #: True when calls do network I/O and should run off the event loop.
+    blocking = False
+    #: True when every worker reads and writes the same store.
+    shared = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: Optional[float] = None) -> None:
+        ...
+
+    @abstractmethod
+    def purge_tags(self, tags: Iterable[str]) -> None:
+        ...
+
+    @abstractmethod
+    def epoch(self) -> int:
+        """Counter bumped by every purge, used to discard fills that raced one."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def acquire_refresh(self, key: str, ttl: float) -> bool:
+        """Claim the right to refresh a stale entry; False if someone else holds it.
+
+        The claim lapses after ``ttl`` seconds so a crashed refresh cannot
+        pin an entry stale.
+        """
+
+    @abstractmethod
+    def release_refresh(self, key: str) -> None:
+        ...
+
+    def generation(self, name: str) -> int:
+        """Shared invalidation counter ``name`` (see SharedGeneration); 0 if not shared."""
+        return 0
+
+    def bump_generation(self, name: str) -> None:
+        """Advance counter ``name`` for every worker; nothing to do if not shared."""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": type(self).__name__}
+
+
+class MemoryBackend(CacheBackend):
+    """Per-process response store. Suitable for a single worker; with several
+    workers each keeps its own copy and only sees its own purges.
+
+    No entry is kept longer than ``max_lifetime``, whatever its route
+    group's policy asks for, because that is how long another worker can
+    keep serving a response a write has made stale. Several workers need
+    RedisBackend for the longer policies to take effect.
+    """
+
+    def __init__(
+        self, maxsize: int = 2048, ttl: Optional[float] = 300, max_lifetime: Optional[float] = None
+    ):
+        self.max_lifetime = max_lifetime
+        self._entries = LRUCache(maxsize=maxsize, ttl=ttl, on_evict=self._forget)
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Set[str]] = {}
+        self._refreshing = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._epoch = 0
+
+    def _forget(self, key: str) -> None:
+        """Drop a key from the tag index once its entry is gone."""
+        with self._lock:
+            for tag in self._key_tags.pop(key, ()):
+                keys = self._tags.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._tags[tag]
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._entries.get(key)
+
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: Optional[float] = None) -> None:
+        tags = set(tags)
+        if self.max_lifetime is not None:
+            ttl = self.max_lifetime if ttl is None else min(ttl, self.max_lifetime)
+        self._entries.set(key, value, ttl=ttl)
+        with self._lock:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+    def purge_tags(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._epoch += 1
+            doomed = set()
+            for tag in tags:
+                doomed |= self._tags.pop(tag, set())
+        for key in doomed:
+            self._entries.delete(key)
+            self._forget(key)
+
+    def epoch(self) -> int:
+        return self._epoch
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._tags.clear()
+            self._key_tags.clear()
+        self._entries.clear()
+
+    def acquire_refresh(self, key: str, ttl: float) -> bool:
+        with self._lock:
+            if self._refreshing.get(key) is not None:
+                return False
+            self._refreshing.set(key, True, ttl=ttl)
+            return True
+
+    def release_refresh(self, key: str) -> None:
+        self._refreshing.delete(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "tags": len(self._tags),
+            "max_lifetime": self.max_lifetime,
+            **self._entries.stats(),
+        }
+
+
+class RedisBackend(CacheBackend):
+    """Response store shared by every worker through a Redis-protocol server.
+
+    Entries are plain keys with an expiry; each tag is a set of entry keys.
+    Any server speaking the Redis protocol works, so a local stand-in
+    (e.g. a throwaway ``redis-server`` or a fakeredis instance passed as
+    ``client``) can be used in development.
+    """
+
+    blocking = True
+    shared = True
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        *,
+        client: Any = None,
+        ttl: Optional[float] = 300,
+        namespace: str = "portfolio:cache:",
+    ):
+        if client is None:
+            import redis  # optional dependency, only needed for this backend
+
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.ttl = ttl
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_key(self, key: str) -> str:
+        return f"{self.namespace}entry:{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.namespace}tag:{tag}"
+
+    def _refresh_key(self, key: str) -> str:
+        return f"{self.namespace}refresh:{key}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.client.get(self._entry_key(key))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, tags: Iterable[str], ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expire = int(ttl) if ttl else None
+        pipe = self.client.pipeline()
+        pipe.set(self._entry_key(key), value, ex=expire)
+        for tag in tags:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, key)
+            if expire:
+                # A tag set outlives the newest entry registered under it.
+                pipe.expire(tag_key, expire)
+        pipe.execute()
+
+    def purge_tags(self, tags: Iterable[str]) -> None:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        pipe = self.client.pipeline()
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        members = pipe.execute()
+
+        doomed = {self._entry_key(_decode(key)) for keys in members for key in keys}
+        pipe = self.client.pipeline()
+        if doomed:
+            pipe.delete(*doomed)
+        if tag_keys:
+            pipe.delete(*tag_keys)
+        pipe.incr(f"{self.namespace}epoch")
+        pipe.execute()
+
+    def epoch(self) -> int:
+        return int(self.client.get(f"{self.namespace}epoch") or 0)
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.namespace}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def acquire_refresh(self, key: str, ttl: float) -> bool:
+        # SET NX makes the claim exclusive across every worker sharing the server.
+        return bool(self.client.set(self._refresh_key(key), b"1", nx=True, ex=max(1, int(ttl))))
+
+    def release_refresh(self, key: str) -> None:
+        self.client.delete(self._refresh_key(key))
+
+    def generation(self, name: str) -> int:
+        return int(self.client.get(f"{self.namespace}generation:{name}") or 0)
+
+    def bump_generation(self, name: str) -> None:
+        self.client.incr(f"{self.namespace}generation:{name}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "redis", "hits": self.hits, "misses": self.misses, "ttl": self.ttl}
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def create_backend() -> Optional[CacheBackend]:
+    """Build the response cache backend selected in settings, or None when disabled."""
+    kind = settings.RESPONSE_CACHE_BACKEND.lower()
+    ttl = settings.RESPONSE_CACHE_TTL
+    if kind == "memory":
+        return MemoryBackend(
+            maxsize=settings.RESPONSE_CACHE_MAXSIZE,
+            ttl=ttl,
+            max_lifetime=settings.RESPONSE_CACHE_MEMORY_MAX_LIFETIME,
+        )
+    if kind == "redis":
+        return RedisBackend(settings.REDIS_URL, ttl=ttl)
+    if kind in ("", "none", "off"):
+        return None
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {settings.RESPONSE_CACHE_BACKEND!r}")
+
+
+response_cache: Optional[CacheBackend] = create_backend()
+
+
+def shared_generation(name: str) -> SharedGeneration:
+    """A SharedGeneration kept in the response cache backend, if that is shared."""
+    return SharedGeneration(name, response_cache, poll=settings.CACHE_GENERATION_POLL)
+
+# Natural keys published with a Change, and the tag prefix responses use for them.
+KEY_TAG_PREFIXES = {
+    "site_content": "slug",
+    "experience": "slug",
+    "three_config": "scene",
+}
+
+# Tags collected for the response being built; None outside the cache middleware.
+_response_tags: ContextVar[Optional[Set[str]]] = ContextVar("response_tags", default=None)
+
+
+def begin_response_tags() -> Any:
+    """Start collecting tags for a response; returns a token for end_response_tags."""
+    return _response_tags.set(set())
+
+
+def end_response_tags(token: Any) -> Set[str]:
+    """Stop collecting tags and return those added by the handler."""
+    tags = _response_tags.get() or set()
+    _response_tags.reset(token)
+    return tags
+
+
+def tag_response(
+    entity: str,
+    user_id: Optional[int] = None,
+    *,
+    slug: Optional[str] = None,
+    scene: Optional[str] = None,
+) -> None:
+    """
+    Mark the current response as cacheable and record what it was built from.
+
+    Args:
+        entity: Entity type the response lists, e.g. "project"
+        user_id: Owner the rows were scoped to, or None for an all-owner list
+        slug: Profile slug the owner was resolved from, if any
+        scene: 3D scene name the response was looked up by, if any
+    """
+    tags = _response_tags.get()
+    if tags is None:
+        return
+    tags.add(entity)
+    tags.add(f"{entity}:user:{user_id}" if user_id else f"{entity}:all")
+    if slug:
+        tags.add(f"slug:{slug}")
+    if scene:
+        tags.add(f"scene:{scene}")
+
+
+def tags_for_changes(changes: Iterable[Change]) -> Set[str]:
+    """Tags whose responses may include rows touched by the given changes."""
+    tags = set()
+    for change in changes:
+        if change.user_id is None:
+            tags.add(change.entity)
+        else:
+            tags.add(f"{change.entity}:user:{change.user_id}")
+            tags.add(f"{change.entity}:all")
+        prefix = KEY_TAG_PREFIXES.get(change.entity)
+        if prefix:
+            tags.update(f"{prefix}:{key}" for key in change.keys)
+    return tags
+
+
+@subscribe
+def purge_response_cache(changes: List[Change]) -> None:
+    """Purge cached responses affected by a committed write."""
+    if response_cache is None:
+        return
+    try:
+        response_cache.purge_tags(tags_for_changes(changes))
+    except Exception:
+        logger.exception("Response cache purge failed")
@@ -1,34 +1,137 @@
+from typing import Any, AsyncGenerator, Dict, List
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.pool_stats import MonitoredAsyncQueuePool, MonitoredQueuePool, PoolMonitor
+from app.core.sqlite import configure_sqlite, writer_queue
 
-# Fix Render's postgres:// URL to postgresql:// (required by SQLAlchemy 2.0+)
-db_url = settings.DATABASE_URL
-if db_url.startswith("postgres://"):
-    db_url = db_url.replace("postgres://", "postgresql://", 1)
 
-# Create database engine with appropriate settings based on database type
-if db_url.startswith("sqlite"):
-    # SQLite-specific configuration
-    engine = create_engine(
-        db_url,
-        echo=settings.DEBUG,
-        connect_args={"check_same_thread": False}  # Allow SQLite to be used with FastAPI
-    )
-else:
+def normalize_url(url: str) -> str:
+    """Fix Render's postgres:// URL to postgresql:// (required by SQLAlchemy 2.0+)."""
+    url = url.strip()
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+db_url = normalize_url(settings.DATABASE_URL)
+
+
+def pool_options(url: str, poolclass: type) -> Dict[str, Any]:
+    """Pool class and sizing from settings; in-memory SQLite keeps SQLAlchemy's default pool."""
+    if url.startswith("sqlite") and (":memory:" in url or url.partition("://")[2] in ("", "/")):
+        return {}
+    options: Dict[str, Any] = {
+        "poolclass": poolclass,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if not url.startswith("sqlite"):
+        options["pool_pre_ping"] = settings.DB_POOL_PRE_PING
+    return options
+
+
+def make_engine(url: str) -> Engine:
+    """Create a database engine with appropriate settings based on database type."""
+    if url.startswith("sqlite"):
+        # SQLite-specific configuration
+        return create_engine(
+            url,
+            echo=settings.DEBUG,
+            connect_args={"check_same_thread": False},  # Allow SQLite to be used with FastAPI
+            **pool_options(url, MonitoredQueuePool)
+        )
     # PostgreSQL/other database configuration
-    engine = create_engine(
-        db_url,
+    return create_engine(
+        url,
         echo=settings.DEBUG,
-        pool_pre_ping=True,
-        pool_size=10,
-        max_overflow=20
+        **pool_options(url, MonitoredQueuePool)
     )
 
+
+engine = make_engine(db_url)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if db_url.startswith("sqlite"):
+    # WAL, tuned pragmas, and one queued writer at a time for sync sessions
+    configure_sqlite(engine, SessionLocal, writer_queue if settings.SQLITE_WRITER_QUEUE else None)
+
+# asyncio drivers for the same databases
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def make_async_url(url: str) -> str:
+    """Swap a sync database URL's driver for its asyncio counterpart."""
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+    driver = ASYNC_DRIVERS.get(dialect)
+    if not driver:
+        return url
+    if dialect == "postgresql":
+        # asyncpg takes "ssl" where libpq takes "sslmode" (Render adds sslmode=require)
+        rest = rest.replace("sslmode=", "ssl=")
+    return f"{dialect}+{driver}{sep}{rest}"
+
+
+def make_async_engine(url: str) -> AsyncEngine:
+    """Async engine for the same database as a sync URL."""
+    async_url = make_async_url(url)
+    async_engine = create_async_engine(
+        async_url,
+        echo=settings.DEBUG,
+        **pool_options(async_url, MonitoredAsyncQueuePool)
+    )
+    if async_url.startswith("sqlite"):
+        # Same pragmas; aiosqlite waits for the write lock in its own thread via busy_timeout.
+        configure_sqlite(async_engine.sync_engine)
+    return async_engine
+
+
+def make_async_session_factory(async_engine: AsyncEngine) -> async_sessionmaker:
+    """Sessions whose objects stay readable after commit; there is no lazy refresh under asyncio."""
+    return async_sessionmaker(
+        async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+
+# Async engine for endpoints that await the database instead of holding a threadpool slot
+async_engine = make_async_engine(db_url)
+AsyncSessionLocal = make_async_session_factory(async_engine)
+
+# Read replicas for public GET endpoints (see app.core.replicas); none means reads use the primary
+read_urls: List[str] = [
+    normalize_url(url) for url in settings.DATABASE_READ_URL.split(",") if url.strip()
+]
+read_engines: List[Engine] = [make_engine(url) for url in read_urls]
+for read_engine in read_engines:
+    if read_engine.dialect.name == "sqlite":
+        configure_sqlite(read_engine)
+ReadSessionLocals: List[sessionmaker] = [
+    sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+    for read_engine in read_engines
+]
+async_read_engines: List[AsyncEngine] = [make_async_engine(url) for url in read_urls]
+AsyncReadSessionLocals: List[async_sessionmaker] = [
+    make_async_session_factory(read_engine) for read_engine in async_read_engines
+]
+
+# Checkout, wait and connection-age statistics for /internal/db-pool
+pool_monitors = {
+    "sync": PoolMonitor(engine),
+    "async": PoolMonitor(async_engine.sync_engine),
+}
+for index, read_engine in enumerate(read_engines):
+    pool_monitors[f"read-{index}"] = PoolMonitor(read_engine)
+for index, read_engine in enumerate(async_read_engines):
+    pool_monitors[f"async-read-{index}"] = PoolMonitor(read_engine.sync_engine)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -41,3 +144,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async database session generator for dependency injection."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,152 @@
+"""
+Change notifications for derived public data.
+
+Session events record the owner and natural keys (profile slug, scene name)
+of every portfolio row written inside a transaction and publish them once
+the transaction commits, so caches built from those rows can drop exactly
+the entries that depend on them.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Callable, FrozenSet, Iterable, List, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Table name -> (entity name, natural key column)
+TRACKED_TABLES = {
+    "projects": ("project", None),
+    "skills": ("skill", None),
+    "experience": ("experience", "profile_slug"),
+    "education": ("education", None),
+    "site_content": ("site_content", "profile_slug"),
+    "three_config": ("three_config", "scene_name"),
+}
+
+_PENDING_KEY = "pending_changes"
+
+
+@dataclass(frozen=True)
+class Change:
+    """A committed write to one tracked entity.
+
+    ``user_id`` is None when the owner is unknown (bulk statements without
+    an ``owner_id`` execution option); subscribers should treat that as a
+    change for every owner.
+    """
+
+    entity: str
+    user_id: Optional[int] = None
+    keys: FrozenSet[str] = frozenset()
+
+
+Subscriber = Callable[[List[Change]], None]
+_subscribers: List[Subscriber] = []
+
+
+def subscribe(callback: Subscriber) -> Subscriber:
+    """Register a callback invoked with the changes of each committed transaction."""
+    _subscribers.append(callback)
+    return callback
+
+
+def publish(changes: Iterable[Change]) -> None:
+    """Deliver changes to every subscriber; a failing subscriber never breaks the write."""
+    changes = list(changes)
+    if not changes:
+        return
+    for callback in list(_subscribers):
+        try:
+            callback(changes)
+        except Exception:
+            logger.exception("Invalidation subscriber %r failed", callback)
+
+
+def record_changes(session: Session, changes: Iterable[Change]) -> None:
+    """Queue changes written by bulk or RETURNING statements; they are published with the commit.
+
+    Statements whose changes are recorded this way should carry
+    ``execution_options(changes_recorded=True)`` so they are not also
+    recorded as a change for every owner.
+    """
+    session.info.setdefault(_PENDING_KEY, set()).update(changes)
+
+
+def row_change(obj) -> Optional[Change]:
+    """Describe a row as its current owner and key, for statements that record their changes."""
+    tracked = TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+    if obj is None or not tracked:
+        return None
+    entity, key_attr = tracked
+    key = getattr(obj, key_attr) if key_attr else None
+    return Change(entity=entity, user_id=obj.user_id, keys=frozenset({key} if key else ()))
+
+
+def _change_for(obj) -> Optional[Change]:
+    """Describe a flushed ORM instance as a Change, if its table is tracked."""
+    tracked = TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+    if not tracked:
+        return None
+    entity, key_attr = tracked
+    state = inspect(obj)
+    keys = set()
+    if key_attr:
+        # Old and new values both matter when a slug or scene name is renamed.
+        history = state.attrs[key_attr].history
+        for value in (*history.added, *history.unchanged, *history.deleted):
+            if value:
+                keys.add(value)
+    return Change(entity=entity, user_id=state.dict.get("user_id"), keys=frozenset(keys))
+
+
+@event.listens_for(Session, "after_flush")
+def _record_flush(session: Session, flush_context) -> None:
+    """Collect changes for rows written by the unit of work."""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in (*session.new, *session.deleted):
+        change = _change_for(obj)
+        if change:
+            pending.add(change)
+    for obj in session.dirty:
+        if session.is_modified(obj):
+            change = _change_for(obj)
+            if change:
+                pending.add(change)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _record_bulk_write(orm_execute_state) -> None:
+    """Collect changes for ORM-enabled INSERT/UPDATE/DELETE statements.
+
+    Callers can pass ``execution_options(owner_id=...)`` to scope the change
+    to one owner instead of every owner of the entity, or
+    ``changes_recorded=True`` after describing it with record_changes.
+    """
+    if not (
+        orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete
+    ):
+        return
+    if orm_execute_state.execution_options.get("changes_recorded"):
+        return
+    owner_id = orm_execute_state.execution_options.get("owner_id")
+    pending = orm_execute_state.session.info.setdefault(_PENDING_KEY, set())
+    for mapper in orm_execute_state.all_mappers:
+        tracked = TRACKED_TABLES.get(mapper.local_table.name)
+        if tracked:
+            pending.add(Change(entity=tracked[0], user_id=owner_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed(session: Session) -> None:
+    """Publish collected changes once they are durable."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        publish(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    """Drop changes that never reached the database."""
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,157 @@
+"""
+Connection pool statistics for /internal/db-pool.
+
+Pool events count connects, checkouts, check-ins and invalidations and
+track when each pooled connection was opened. The pool classes below also
+time every checkout, which no pool event exposes. That time is spent
+waiting for a free connection, or opening a new one within the overflow.
+The numbers are per worker process; multiply by the worker count when
+sizing the database's connection limit.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (ms) of the checkout wait histogram buckets; the last bucket is open-ended.
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class TimedCheckoutMixin:
+    """Report how long each checkout took to the pool's PoolMonitor."""
+
+    monitor: Optional["PoolMonitor"] = None
+
+    def _do_get(self):
+        if self.monitor is None:
+            return super()._do_get()
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except sa_exc.TimeoutError:
+            self.monitor.record_timeout(time.perf_counter() - started)
+            raise
+        self.monitor.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep reporting to the same monitor.
+        pool = super().recreate()
+        pool.monitor = self.monitor
+        return pool
+
+
+class MonitoredQueuePool(TimedCheckoutMixin, QueuePool):
+    """QueuePool that times checkouts."""
+
+
+class MonitoredAsyncQueuePool(TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that times checkouts."""
+
+
+class PoolMonitor:
+    """Counters, checkout wait histogram and connection ages for one engine's pool."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._counters = {
+            "connects": 0,
+            "checkouts": 0,
+            "checkins": 0,
+            "invalidations": 0,
+            "timeouts": 0,
+            "peak_checked_out": 0,
+        }
+        self._buckets: List[int] = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._opened_at: Dict[int, float] = {}
+
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "detach", self._on_close)
+        if isinstance(engine.pool, TimedCheckoutMixin):
+            engine.pool.monitor = self
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._counters["connects"] += 1
+            self._opened_at[id(connection_record)] = time.monotonic()
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_out = self._pool_stat("checkedout")
+        with self._lock:
+            self._counters["checkouts"] += 1
+            if checked_out is not None and checked_out > self._counters["peak_checked_out"]:
+                self._counters["peak_checked_out"] = checked_out
+
+    def _on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._counters["checkins"] += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        with self._lock:
+            self._counters["invalidations"] += 1
+            self._opened_at.pop(id(connection_record), None)
+
+    def _on_close(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._opened_at.pop(id(connection_record), None)
+
+    def record_wait(self, seconds: float) -> None:
+        milliseconds = seconds * 1000
+        index = next(
+            (i for i, bound in enumerate(WAIT_BUCKETS_MS) if milliseconds <= bound),
+            len(WAIT_BUCKETS_MS),
+        )
+        with self._lock:
+            self._buckets[index] += 1
+            self._wait_total += seconds
+            self._wait_max = max(self._wait_max, seconds)
+
+    def record_timeout(self, seconds: float) -> None:
+        with self._lock:
+            self._counters["timeouts"] += 1
+            self._wait_max = max(self._wait_max, seconds)
+
+    def _pool_stat(self, name: str) -> Optional[int]:
+        """A QueuePool gauge such as checkedout(), or None for pools without it."""
+        method = getattr(self.engine.pool, name, None)
+        return method() if callable(method) else None
+
+    def report(self) -> Dict[str, Any]:
+        """Current gauges plus counters since startup."""
+        now = time.monotonic()
+        with self._lock:
+            counters = dict(self._counters)
+            buckets = list(self._buckets)
+            wait_total, wait_max = self._wait_total, self._wait_max
+            ages = [now - opened for opened in self._opened_at.values()]
+        waits = sum(buckets)
+        labels = [f"<={bound}ms" for bound in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}ms"]
+        return {
+            "pool": type(self.engine.pool).__name__,
+            "size": self._pool_stat("size"),
+            "checked_out": self._pool_stat("checkedout"),
+            "checked_in": self._pool_stat("checkedin"),
+            "overflow": self._pool_stat("overflow"),
+            **counters,
+            "wait_ms": {
+                "count": waits,
+                "mean": round(wait_total / waits * 1000, 3) if waits else 0.0,
+                "max": round(wait_max * 1000, 3),
+                "histogram": dict(zip(labels, buckets)),
+            },
+            "connection_age_s": {
+                "open": len(ages),
+                "mean": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                "oldest": round(max(ages), 1) if ages else 0.0,
+            },
+        }
@@ -0,0 +1,118 @@
+"""
+Read replica routing for public GET endpoints.
+
+``get_read_db`` and ``get_async_read_db`` (app.api.deps) open their session
+on one of the ``DATABASE_READ_URL`` replicas, taken in turn. Writes and
+admin endpoints keep using the primary through ``get_db``. Before each read
+the lag policy decides whether a replica is fresh enough for the request;
+if not, the request reads from the primary.
+
+The default policy, ``ReadYourWrites``, sends every authenticated request
+(an ``Authorization`` header) to the primary, on whichever worker it lands,
+so an author always sees their own writes. Anonymous reads go to a replica,
+except for ``REPLICA_READ_AFTER_WRITE`` seconds after this worker commits a
+portfolio write: those first reads rebuild the caches the write just purged,
+and a lagging replica would otherwise put the old rows back for a whole
+cache TTL. Set it to 0 when there is no response cache. Install another
+policy with ``set_lag_policy``.
+"""
+import itertools
+import threading
+import time
+from typing import Dict, List
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.database import (
+    AsyncReadSessionLocals,
+    AsyncSessionLocal,
+    ReadSessionLocals,
+    SessionLocal,
+)
+from app.core.invalidation import Change, subscribe
+
+
+class ReplicaLagPolicy:
+    """Decides whether a request's reads may go to a replica.
+
+    Subclasses override ``use_replica``, and ``note_changes`` if they track
+    writes. ``note_changes`` receives each transaction this worker commits.
+    """
+
+    def note_changes(self, changes: List[Change]) -> None:
+        pass
+
+    def use_replica(self, request: Request) -> bool:
+        return True
+
+
+class ReadAfterWriteWindow(ReplicaLagPolicy):
+    """Read from the primary for ``window`` seconds after a committed write."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._last_write = float("-inf")
+
+    def note_changes(self, changes: List[Change]) -> None:
+        self._last_write = time.monotonic()
+
+    def use_replica(self, request: Request) -> bool:
+        return time.monotonic() - self._last_write >= self.window
+
+
+class ReadYourWrites(ReadAfterWriteWindow):
+    """Authenticated requests read the primary; anonymous ones follow the write window."""
+
+    def use_replica(self, request: Request) -> bool:
+        if "authorization" in request.headers:
+            return False
+        return super().use_replica(request)
+
+
+_policy: ReplicaLagPolicy = ReadYourWrites(settings.REPLICA_READ_AFTER_WRITE)
+_next_replica = itertools.count()
+_stats_lock = threading.Lock()
+routing_stats: Dict[str, int] = {"replica": 0, "primary": 0}
+
+
+def set_lag_policy(policy: ReplicaLagPolicy) -> None:
+    """Replace the policy that decides when reads may use a replica."""
+    global _policy
+    _policy = policy
+
+
+@subscribe
+def _note_changes(changes: List[Change]) -> None:
+    _policy.note_changes(changes)
+
+
+def _replica_index(request: Request, replicas: int) -> int:
+    """Index of the replica for this request, or -1 to read from the primary."""
+    use_replica = replicas > 0 and _policy.use_replica(request)
+    with _stats_lock:
+        routing_stats["replica" if use_replica else "primary"] += 1
+    return next(_next_replica) % replicas if use_replica else -1
+
+
+def read_session(request: Request) -> Session:
+    """A sync session on a replica, or on the primary when the policy says so."""
+    index = _replica_index(request, len(ReadSessionLocals))
+    return ReadSessionLocals[index]() if index >= 0 else SessionLocal()
+
+
+def async_read_session(request: Request) -> AsyncSession:
+    """An async session on a replica, or on the primary when the policy says so."""
+    index = _replica_index(request, len(AsyncReadSessionLocals))
+    return AsyncReadSessionLocals[index]() if index >= 0 else AsyncSessionLocal()
+
+
+def replica_stats() -> Dict[str, object]:
+    """Replica count, active policy and how reads were routed."""
+    with _stats_lock:
+        routed = dict(routing_stats)
+    return {
+        "replicas": len(ReadSessionLocals),
+        "policy": type(_policy).__name__,
+        **routed,
+    }
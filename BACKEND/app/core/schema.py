@@ -0,0 +1,40 @@
+"""
+Startup schema check.
+
+Schema changes are applied once per deploy by ``alembic upgrade head``, not
+by each worker at boot. Workers only read the revision stored in
+``alembic_version`` and compare it with the one this code was written
+against: a single-row SELECT instead of create_all and table
+introspection.
+"""
+from typing import Optional
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from app.core.database import engine
+
+# Latest revision in alembic/versions; bump it with every new migration.
+SCHEMA_VERSION = "0004_not_null_sort_columns"
+
+
+class SchemaVersionError(RuntimeError):
+    """The database is not at the migration revision this code expects."""
+
+
+def current_schema_version() -> Optional[str]:
+    """Revision stored by Alembic, or None for a database never migrated."""
+    try:
+        with engine.connect() as connection:
+            return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except SQLAlchemyError:
+        return None
+
+
+def check_schema_version() -> str:
+    """Raise SchemaVersionError unless the database is at SCHEMA_VERSION."""
+    version = current_schema_version()
+    if version != SCHEMA_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at {version or 'no revision'}, expected {SCHEMA_VERSION}; "
+            "run `alembic upgrade head`"
+        )
+    return version
@@ -0,0 +1,111 @@
+"""
+Fast JSON encoding for API responses.
+
+``FastJSONResponse`` is the application's default response class and
+encodes with orjson when it is installed and ``FAST_JSON`` is enabled.
+``encode_list`` goes one step further for the list schemas: it reads the
+schema's fields straight off ORM rows and dumps them to bytes without
+building intermediate Pydantic models.
+"""
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type, get_args, get_origin
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.responses import Response
+from app.core.config import settings
+from app.core.timing import measure
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback keeps the app working without the extra wheel
+    orjson = None
+
+# Z suffix for UTC matches Pydantic's own datetime output.
+_ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content to JSON bytes using the fastest available encoder."""
+    if orjson is not None and settings.FAST_JSON:
+        return orjson.dumps(content, default=jsonable_encoder, option=_ORJSON_OPTIONS)
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders through dumps()."""
+
+    def render(self, content: Any) -> bytes:
+        with measure("serialize"):
+            return dumps(content)
+
+
+@lru_cache(maxsize=None)
+def _fields(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _item_schemas(list_schema: Type[BaseModel]) -> Dict[str, Type[BaseModel]]:
+    """Map each ``List[Model]`` field of a list schema to its item model."""
+    items = {}
+    for name, field in list_schema.model_fields.items():
+        args = get_args(field.annotation)
+        if get_origin(field.annotation) is list and args and isinstance(args[0], type) \
+                and issubclass(args[0], BaseModel):
+            items[name] = args[0]
+    return items
+
+
+def rows_to_dicts(
+    schema: Type[BaseModel], rows: Iterable[Any], fields: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """Read a schema's fields (or the given subset) off ORM rows or any attribute objects."""
+    fields = fields or _fields(schema)
+    return [{field: getattr(row, field) for field in fields} for row in rows]
+
+
+def encode_list(
+    list_schema: Type[BaseModel], *, item_fields: Optional[Sequence[str]] = None, **values: Any
+) -> bytes:
+    """
+    Encode a list response straight from ORM rows.
+
+    Args:
+        list_schema: Response schema, e.g. ProjectList
+        item_fields: Sparse fieldset (see app.utils.fieldsets); None writes every item field
+        values: Field values; ``List[Model]`` fields take ORM rows
+
+    Returns:
+        JSON bytes shaped like ``list_schema``
+    """
+    with measure("serialize"):
+        item_schemas = _item_schemas(list_schema)
+        payload = {
+            name: rows_to_dicts(item_schemas[name], value, item_fields) if name in item_schemas else value
+            for name, value in values.items()
+        }
+        return dumps(payload)
+
+
+def json_response(body: bytes, template: Optional[Response] = None) -> Response:
+    """
+    Wrap pre-encoded JSON in a Response.
+
+    Args:
+        body: Encoded JSON
+        template: FastAPI's injected response; its headers (e.g. ETag) are
+            copied, since returning a Response bypasses them otherwise
+    """
+    response = Response(content=body, media_type="application/json")
+    if template is not None:
+        for name, value in template.headers.items():
+            if name != "content-length":
+                response.headers[name] = value
+    return response
@@ -0,0 +1,136 @@
+"""
+SQLite production profile.
+
+Every new connection gets WAL journaling and the tuned pragmas below, so
+readers never block on a writer. SQLite still allows one writer at a time:
+instead of letting concurrent write transactions race for the lock and fail
+with "database is locked", sync sessions queue on a per-process
+``WriterQueue`` from their first flush until their transaction ends. Reads
+take no part in the queue and stay parallel. ``busy_timeout`` covers
+writers in other worker processes and the async engine.
+"""
+import threading
+import time
+from typing import Any, Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
+from app.core.config import settings
+
+_HOLDS_WRITER = "holds_writer_queue"
+
+
+class WriterQueueTimeout(SQLAlchemyError):
+    """A write transaction waited longer than SQLITE_BUSY_TIMEOUT for its turn."""
+
+
+def sqlite_pragmas() -> Dict[str, Any]:
+    """Pragmas applied to each new connection, from settings."""
+    pragmas: Dict[str, Any] = {
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": "MEMORY",
+    }
+    if settings.SQLITE_WAL:
+        pragmas["journal_mode"] = "WAL"
+    return pragmas
+
+
+def apply_pragmas(dbapi_connection, connection_record) -> None:
+    """Engine "connect" listener: set the profile's pragmas on a new connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+class WriterQueue:
+    """One write transaction at a time per process; waiters block until it ends."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._counters: Dict[str, float] = {
+            "writes": 0,
+            "waited": 0,
+            "wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+            "timeouts": 0,
+        }
+
+    def acquire(self) -> None:
+        started = time.perf_counter()
+        acquired = self._lock.acquire(blocking=False)
+        if not acquired:
+            acquired = self._lock.acquire(timeout=self.timeout)
+            waited = time.perf_counter() - started
+            with self._stats_lock:
+                self._counters["waited"] += 1
+                self._counters["wait_seconds"] += waited
+                self._counters["max_wait_seconds"] = max(
+                    self._counters["max_wait_seconds"], waited
+                )
+                if not acquired:
+                    self._counters["timeouts"] += 1
+            if not acquired:
+                raise WriterQueueTimeout(
+                    f"Waited {waited:.1f}s for the SQLite writer queue"
+                )
+        with self._stats_lock:
+            self._counters["writes"] += 1
+
+    def release(self) -> None:
+        # The session may end on another threadpool thread; a plain Lock allows that.
+        self._lock.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._counters)
+        stats["busy"] = self._lock.locked()
+        return stats
+
+
+def _enter_queue(session: Session, queue: WriterQueue) -> None:
+    if not session.info.get(_HOLDS_WRITER):
+        queue.acquire()
+        session.info[_HOLDS_WRITER] = True
+
+
+def _leave_queue(session: Session, queue: WriterQueue) -> None:
+    if session.info.pop(_HOLDS_WRITER, False):
+        queue.release()
+
+
+def configure_sqlite(
+    engine: Engine,
+    session_factory: Optional[sessionmaker] = None,
+    writer_queue: Optional[WriterQueue] = None,
+) -> None:
+    """Apply the pragmas to an engine and queue the writes of a session factory's sessions."""
+    event.listen(engine, "connect", apply_pragmas)
+    if session_factory is None or writer_queue is None:
+        return
+
+    @event.listens_for(session_factory, "before_flush")
+    def queue_flush(session: Session, flush_context, instances) -> None:
+        _enter_queue(session, writer_queue)
+
+    @event.listens_for(session_factory, "do_orm_execute")
+    def queue_bulk_write(orm_execute_state) -> None:
+        if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+            _enter_queue(orm_execute_state.session, writer_queue)
+
+    @event.listens_for(session_factory, "after_transaction_end")
+    def leave_queue(session: Session, transaction) -> None:
+        if transaction.parent is None:
+            _leave_queue(session, writer_queue)
+
+
+# The application's queue; wired to SessionLocal by app.core.database.
+writer_queue = WriterQueue(timeout=settings.SQLITE_BUSY_TIMEOUT / 1000)
@@ -0,0 +1,19 @@
+"""
+Fire-and-forget background tasks.
+
+The event loop only keeps weak references to tasks, so a task nobody
+holds can be garbage-collected before it finishes. ``spawn`` keeps a
+reference until the task is done.
+"""
+import asyncio
+from typing import Any, Coroutine, Set
+
+_running: Set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Schedule coro on the running loop and hold the task until it completes."""
+    task = asyncio.create_task(coro)
+    _running.add(task)
+    task.add_done_callback(_running.discard)
+    return task
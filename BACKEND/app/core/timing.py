@@ -0,0 +1,94 @@
+"""
+Per-request timings for the Server-Timing header.
+
+ServerTimingMiddleware starts a RequestTimings for each HTTP request in a
+context variable. Every SQL statement, on any engine (primary, replicas and
+the async engines' sync cores), is counted and timed by cursor events.
+Other spans are added with ``measure``: "auth" around token decoding and the
+user lookup, "serialize" around JSON rendering. Outside a request (startup,
+warm-up, scripts) nothing is recorded.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestTimings:
+    """SQL statement count and milliseconds per metric for one request."""
+
+    __slots__ = ("started", "statements", "durations")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.statements = 0
+        self.durations: Dict[str, float] = {"db": 0.0, "auth": 0.0, "serialize": 0.0}
+
+    def add(self, metric: str, milliseconds: float) -> None:
+        self.durations[metric] = self.durations.get(metric, 0.0) + milliseconds
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def header(self) -> str:
+        """Server-Timing header value; "app" is the whole request so far."""
+        metrics = []
+        for metric, duration in self.durations.items():
+            entry = f"{metric};dur={duration:.1f}"
+            if metric == "db":
+                entry += f';desc="{self.statements} queries"'
+            metrics.append(entry)
+        metrics.append(f"app;dur={self.elapsed_ms():.1f}")
+        return ", ".join(metrics)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Rounded numbers for the log line."""
+        values = {f"{metric}_ms": round(duration, 2) for metric, duration in self.durations.items()}
+        values["queries"] = self.statements
+        values["total_ms"] = round(self.elapsed_ms(), 2)
+        return values
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request() -> Tuple[RequestTimings, Token]:
+    """Begin recording for the current request; pass the token to finish_request."""
+    timings = RequestTimings()
+    return timings, _current.set(timings)
+
+
+def finish_request(token: Token) -> None:
+    _current.reset(token)
+
+
+@contextmanager
+def measure(metric: str) -> Iterator[None]:
+    """Add the time spent in the block to metric of the current request, if any."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(metric, (time.perf_counter() - started) * 1000)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _statement_started(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None and _current.get() is not None:
+        context._timing_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _statement_finished(conn, cursor, statement, parameters, context, executemany) -> None:
+    timings = _current.get()
+    started = getattr(context, "_timing_started", None)
+    if timings is None or started is None:
+        return
+    timings.statements += 1
+    timings.add("db", (time.perf_counter() - started) * 1000)
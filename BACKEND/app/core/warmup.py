@@ -0,0 +1,191 @@
+"""
+Startup warm-up.
+
+Runs in the background after startup: opens connections in every database
+pool (sync and async, primary and replicas), then requests every active
+profile's public routes through the full application, so the slug cache,
+pre-rendered snapshots and the response cache are filled before real
+visitors arrive. ``app.state.ready`` stays
+False until the warm-up finishes or its time budget runs out.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List
+from anyio import to_thread
+from fastapi import FastAPI
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+from app.core.database import (
+    SessionLocal,
+    async_engine,
+    async_read_engines,
+    engine,
+    read_engines,
+)
+from app.core.tasks import spawn
+from app.models.site_content import SiteContent
+
+logger = logging.getLogger(__name__)
+
+# Public routes shared by every profile, fetched once.
+SHARED_ROUTES = (
+    ("/api/v1/site-content/public", ""),
+    ("/api/v1/three-config/", ""),
+)
+
+# Public routes fetched for each slug, as (path, query string) templates.
+WARMUP_ROUTES = (
+    ("/api/v1/site-content/public", "slug={slug}"),
+    ("/api/v1/projects/", "slug={slug}"),
+    ("/api/v1/skills/", "slug={slug}"),
+    ("/api/v1/experience/", "slug={slug}"),
+    ("/api/v1/education/", "slug={slug}"),
+    ("/api/v1/portfolio/{slug}", ""),
+)
+
+# What a browser sends, so the response cache fills the variant visitors ask for.
+WARMUP_ACCEPT_ENCODING = b"gzip, deflate, br"
+
+def open_pool_connections(count: int, target: Engine = engine) -> int:
+    """Check out ``count`` connections at once so the pool holds them when returned."""
+    connections = []
+    try:
+        for _ in range(count):
+            connection = target.connect()
+            connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    except Exception:
+        logger.exception("Warm-up could not open all pool connections")
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+async def open_async_pool_connections(count: int, target: AsyncEngine) -> int:
+    """Async counterpart of open_pool_connections, for the pools the public lists read from."""
+    connections = []
+    try:
+        for _ in range(count):
+            connection = await target.connect()
+            await connection.execute(text("SELECT 1"))
+            connections.append(connection)
+    except Exception:
+        logger.exception("Warm-up could not open all async pool connections")
+    finally:
+        for connection in connections:
+            await connection.close()
+    return len(connections)
+
+
+async def open_all_pools(count: int) -> Dict[str, int]:
+    """Warm every pool serving requests, named as in /internal/db-pool."""
+    opened = {"sync": await to_thread.run_sync(open_pool_connections, count)}
+    opened["async"] = await open_async_pool_connections(count, async_engine)
+    for index, read_engine in enumerate(read_engines):
+        opened[f"read-{index}"] = await to_thread.run_sync(open_pool_connections, count, read_engine)
+    for index, read_engine in enumerate(async_read_engines):
+        opened[f"async-read-{index}"] = await open_async_pool_connections(count, read_engine)
+    return opened
+
+
+def active_slugs() -> List[str]:
+    """Profile slugs of every active site content row."""
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(SiteContent.profile_slug)
+            .filter(SiteContent.is_active.is_(True), SiteContent.profile_slug.isnot(None))
+            .distinct()
+            .all()
+        )
+        return [row.profile_slug for row in rows if row.profile_slug]
+    finally:
+        db.close()
+
+
+async def asgi_get(app: FastAPI, path: str, query: str = "") -> int:
+    """Send an anonymous in-process GET through the app and return its status."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "root_path": "",
+        "query_string": query.encode("utf-8"),
+        "headers": [(b"host", b"warmup"), (b"accept-encoding", WARMUP_ACCEPT_ENCODING)],
+        "client": None,
+        "server": None,
+    }
+    status = 0
+    requested = False
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def warm_up(app: FastAPI, report: Dict[str, Any]) -> None:
+    """Warm the pool and every active slug, recording progress in ``report``."""
+    report["pool_connections"] = await open_all_pools(settings.WARMUP_POOL_CONNECTIONS)
+    for path, query in SHARED_ROUTES:
+        if await asgi_get(app, path, query) >= 500:
+            report["errors"] += 1
+    slugs = await to_thread.run_sync(active_slugs)
+    report["slugs"] = len(slugs)
+    for slug in slugs:
+        for path, query in WARMUP_ROUTES:
+            status = await asgi_get(app, path.format(slug=slug), query.format(slug=slug))
+            if status >= 500:
+                report["errors"] += 1
+        report["warmed"] += 1
+
+
+async def run_warmup(app: FastAPI) -> None:
+    """Run warm_up within WARMUP_BUDGET seconds, then mark the app ready."""
+    started = time.monotonic()
+    report: Dict[str, Any] = {
+        "pool_connections": {},
+        "slugs": 0,
+        "warmed": 0,
+        "errors": 0,
+        "completed": False,
+    }
+    app.state.warmup = report
+    try:
+        await asyncio.wait_for(warm_up(app, report), timeout=settings.WARMUP_BUDGET)
+        report["completed"] = True
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Warm-up budget of %.1fs ran out after %d of %d slugs",
+            settings.WARMUP_BUDGET, report["warmed"], report["slugs"],
+        )
+    except Exception:
+        logger.exception("Warm-up failed")
+    finally:
+        report["elapsed"] = round(time.monotonic() - started, 3)
+        app.state.ready = True
+        logger.info("Warm-up finished: %s", report)
+
+
+def start_warmup(app: FastAPI) -> None:
+    """Schedule the warm-up; readiness stays False until it ends."""
+    app.state.ready = False
+    spawn(run_warmup(app))
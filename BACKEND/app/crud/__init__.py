@@ -1,15 +1,30 @@
 from app.crud.base import CRUDBase
+from app.crud.async_base import AsyncCRUDBase
 from app.crud.user import user
-from app.crud.project import project
-from app.crud.skill import skill
-from app.crud.experience import experience
-from app.crud.site_content import site_content
+from app.crud.project import project, async_project
+from app.crud.skill import skill, async_skill
+from app.crud.experience import experience, async_experience
+from app.crud.education import education, async_education
+from app.crud.three_config import three_config, async_three_config
+from app.crud.site_content import site_content, async_site_content
+from app.crud.portfolio import portfolio, async_portfolio
 
 __all__ = [
     "CRUDBase",
+    "AsyncCRUDBase",
     "user",
     "project",
     "skill",
     "experience",
+    "education",
+    "three_config",
     "site_content",
+    "portfolio",
+    "async_project",
+    "async_skill",
+    "async_experience",
+    "async_education",
+    "async_three_config",
+    "async_site_content",
+    "async_portfolio",
 ]
@@ -0,0 +1,219 @@
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, Union
+from sqlalchemy import delete, func, insert, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased, load_only
+from sqlalchemy.sql import Select
+from app.core.cache import owner_counters
+from app.core.invalidation import Change, record_changes, row_change
+from app.crud.base import (
+    CreateSchemaType,
+    ModelType,
+    UpdateSchemaType,
+    apply_row,
+    column_values,
+    not_null_defaults,
+)
+from app.utils.pagination import Keyset, KeyPart, Page
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """Async counterpart of CRUDBase for `async def` endpoints."""
+
+    # Order of the list endpoints (see page); None means by id.
+    list_keyset: Optional[Keyset] = None
+
+    def __init__(self, model: Type[ModelType]):
+        """Initialize CRUD object with database model."""
+        self.model = model
+        self.column_names = frozenset(attr.key for attr in inspect(model).column_attrs)
+        self.not_null = not_null_defaults(model)
+        self.keyset = Keyset(model, KeyPart("id"))
+        # Shared with the sync CRUD object for the same table.
+        self.counters = owner_counters(model.__tablename__)
+
+    async def all(self, db: AsyncSession, statement: Select) -> List[ModelType]:
+        """Run a select and return its ORM rows."""
+        result = await db.scalars(statement)
+        return list(result.all())
+
+    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
+        """Get a single record by ID."""
+        return await db.get(self.model, id)
+
+    async def get_multi(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
+    ) -> List[ModelType]:
+        """Get multiple records by id, paged by offset or by a cursor from self.keyset."""
+        statement = self.keyset.paginate(select(self.model), skip=skip, limit=limit, cursor=cursor)
+        return await self.all(db, statement)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType, **extra: Any) -> ModelType:
+        """Create a new record with one ``INSERT ... RETURNING``; see CRUDBase.create."""
+        values = column_values(
+            {**obj_in.model_dump(), **extra}, self.column_names, self.not_null, creating=True
+        )
+        statement = (
+            insert(self.model)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(changes_recorded=True)
+        )
+        return await self._commit(db, await db.scalar(statement))
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """Update a record with one ``UPDATE ... RETURNING``; db_obj gets the stored values."""
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
+        values = column_values(update_data, self.column_names, self.not_null, creating=False)
+        if not values:
+            return db_obj
+        before = row_change(db_obj)
+        statement = (
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**values)
+            .returning(*(getattr(self.model, name) for name in self.column_names))
+            .execution_options(changes_recorded=True, synchronize_session=False)
+        )
+        row = (await db.execute(statement)).one_or_none()
+        return await self._commit(db, apply_row(db_obj, row), before)
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        """Delete a record with one ``DELETE ... RETURNING``; None if it did not exist."""
+        statement = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model)
+            .execution_options(changes_recorded=True)
+        )
+        return await self._commit(db, await db.scalar(statement))
+
+    async def _commit(
+        self, db: AsyncSession, obj: Optional[ModelType], before: Optional[Change] = None
+    ) -> Optional[ModelType]:
+        """Record the change for a row written by a RETURNING statement and commit.
+
+        Async sessions do not expire on commit, so the row needs no refresh.
+        """
+        changes = [change for change in (before, row_change(obj)) if change]
+        if changes:
+            record_changes(db.sync_session, changes)
+        await db.commit()
+        return obj
+
+    async def count(self, db: AsyncSession, *, user_id: Optional[int] = None) -> int:
+        """Count records, optionally of one owner, using the owner counters when cached."""
+        token = None
+        if self.counters is not None:
+            cached = self.counters.get(user_id)
+            if cached is not None:
+                return cached
+            token = self.counters.token()
+        statement = select(func.count()).select_from(self.model)
+        if user_id is not None:
+            statement = statement.where(self.model.user_id == user_id)
+        total = await db.scalar(statement)
+        if token is not None:
+            self.counters.set(user_id, total, token)
+        return total
+
+    async def page(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        **filters: Any
+    ) -> Page:
+        """
+        One page of rows matching equality filters, in list_keyset order, with
+        the total number of matches.
+
+        Same totals strategy and ``columns`` projection as CRUDBase.page:
+        owner counters for lists filtered by owner alone, ``count(*) OVER()``
+        in the page query otherwise. Unloaded attributes cannot be read here
+        at all, since there is no lazy loading under asyncio.
+        """
+        keyset = self.list_keyset or self.keyset
+        filters = {field: value for field, value in filters.items() if value is not None}
+        statement = select(self.model).filter_by(**filters)
+        if self.counters is not None and set(filters) <= {"user_id"}:
+            projected = self._project(statement, self.model, keyset, columns)
+            items = await self.all(
+                db, keyset.paginate(projected, skip=skip, limit=limit, cursor=cursor)
+            )
+            total = await self.count(db, user_id=filters.get("user_id"))
+            return Page(items, total, keyset.next_cursor(items, limit))
+
+        rows = (
+            await db.execute(
+                self._windowed(
+                    statement, keyset, skip=skip, limit=limit, cursor=cursor, columns=columns
+                )
+            )
+        ).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif skip or cursor:
+            # Past the last page no row carries the window; count the matches directly.
+            total = await db.scalar(select(func.count()).select_from(statement.subquery()))
+        else:
+            total = 0
+        return Page(items, total, keyset.next_cursor(items, limit))
+
+    def _windowed(
+        self,
+        statement: Select,
+        keyset: Keyset,
+        *,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        columns: Optional[Sequence[str]] = None
+    ) -> Select:
+        """Add a ``count(*) OVER()`` column to a filtered select and paginate it."""
+        total = func.count().over().label("total")
+        if cursor:
+            # The cursor goes outside the window, so the total still covers every match.
+            window = statement.add_columns(total).subquery()
+            entity = aliased(self.model, window)
+            statement, keyset = select(entity, window.c.total), keyset.bind(entity)
+            statement = self._project(statement, entity, keyset, columns)
+        else:
+            statement = self._project(statement, self.model, keyset, columns).add_columns(total)
+        return keyset.paginate(statement, skip=skip, limit=limit, cursor=cursor)
+
+    def _project(
+        self, statement: Select, entity: Any, keyset: Keyset, columns: Optional[Sequence[str]]
+    ) -> Select:
+        """Load only ``columns`` of entity plus the keyset's sort key; None loads every column."""
+        if not columns:
+            return statement
+        names = self.column_names.intersection({*columns, *(part.attr for part in keyset.parts)})
+        return statement.options(load_only(*(getattr(entity, name) for name in sorted(names))))
+
+    async def freshness(self, db: AsyncSession, **filters: Any) -> Tuple[Optional[datetime], int]:
+        """
+        Newest change timestamp and row count for rows matching equality filters.
+
+        Filters whose value is None are ignored, as in CRUDBase.freshness.
+        """
+        changed_at = func.coalesce(self.model.updated_at, self.model.created_at)
+        statement = select(func.max(changed_at), func.count(self.model.id))
+        for field, value in filters.items():
+            if value is not None:
+                statement = statement.where(getattr(self.model, field) == value)
+        last_modified, count = (await db.execute(statement)).one()
+        return last_modified, count
@@ -1,39 +1,115 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
-from fastapi.encoders import jsonable_encoder
+from datetime import datetime
+from typing import (
+    Any, Dict, FrozenSet, Generic, List, NamedTuple, Optional, Sequence, Set, Tuple, Type,
+    TypeVar, Union
+)
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import case, delete, func, insert, inspect, update
+from sqlalchemy.orm import Query, Session, aliased, load_only
+from sqlalchemy.orm.attributes import set_committed_value
+from app.core.cache import owner_counters
 from app.core.database import Base
+from app.core.invalidation import TRACKED_TABLES, Change, record_changes, row_change
+from app.schemas.bulk import BulkItemError
+from app.utils.pagination import Keyset, KeyPart, Page
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+def not_null_defaults(model: Any) -> Dict[str, Any]:
+    """NOT NULL columns of a model (besides the key) mapped to their scalar default, or None."""
+    defaults = {}
+    for attr in inspect(model).column_attrs:
+        column = attr.columns[0]
+        if not column.nullable and not column.primary_key:
+            default = column.default
+            defaults[attr.key] = default.arg if default is not None and default.is_scalar else None
+    return defaults
+
+
+def column_values(
+    data: Dict[str, Any], names: FrozenSet[str], not_null: Dict[str, Any], *, creating: bool
+) -> Dict[str, Any]:
+    """
+    The entries of data that are mapped columns.
+
+    An explicit None for a NOT NULL column becomes the column's scalar
+    default when creating, and is otherwise left out so the column keeps its
+    value or gets its server default, instead of failing the statement (e.g.
+    ``"display_order": null`` from a client).
+    """
+    values = {}
+    for field, value in data.items():
+        if field not in names:
+            continue
+        if value is None and field in not_null:
+            value = not_null[field] if creating else None
+            if value is None:
+                continue
+        values[field] = value
+    return values
+
+
+def apply_row(obj: Any, row: Optional[Any]) -> Optional[Any]:
+    """
+    Copy a RETURNING row of column values onto obj as its loaded state.
+
+    An ORM ``UPDATE ... RETURNING`` of the entity hands back the instance
+    already in the identity map without overwriting its attributes, so the
+    row is returned as plain columns and applied here. None (the row was
+    deleted meanwhile) gives None.
+    """
+    if row is None:
+        return None
+    for name, value in row._mapping.items():
+        set_committed_value(obj, name, value)
+    return obj
+
+
+class BulkResult(NamedTuple):
+    """Rows written by CRUDBase.bulk, in request order, and the items refused."""
+
+    created: List[Any]
+    updated: List[Any]
+    deleted: List[int]
+    errors: List[BulkItemError]
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base CRUD operations class."""
 
+    # Order of the list endpoints (see page); None means by id.
+    list_keyset: Optional[Keyset] = None
+
     def __init__(self, model: Type[ModelType]):
         """Initialize CRUD object with database model."""
         self.model = model
+        self.column_names = frozenset(attr.key for attr in inspect(model).column_attrs)
+        self.not_null = not_null_defaults(model)
+        self.keyset = Keyset(model, KeyPart("id"))
+        self.counters = owner_counters(model.__tablename__)
 
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         """Get a single record by ID."""
         return db.query(self.model).filter(self.model.id == id).first()
 
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self, db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None
     ) -> List[ModelType]:
-        """Get multiple records with pagination."""
-        return db.query(self.model).offset(skip).limit(limit).all()
-
-    def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
-        """Create a new record."""
-        obj_in_data = jsonable_encoder(obj_in)
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        """Get multiple records by id, paged by offset or by a cursor from self.keyset."""
+        query = db.query(self.model)
+        return self.keyset.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
+
+    def create(self, db: Session, *, obj_in: CreateSchemaType, **extra: Any) -> ModelType:
+        """
+        Create a new record with one ``INSERT ... RETURNING``.
+
+        ``extra`` sets columns the schema does not carry, such as user_id.
+        """
+        values = {**obj_in.model_dump(), **extra}
+        return self._insert(db, values)
 
     def update(
         self,
@@ -42,27 +118,320 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        """Update a record."""
-        obj_data = jsonable_encoder(db_obj)
+        """Update a record with one ``UPDATE ... RETURNING``; db_obj gets the stored values."""
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
-            update_data = obj_in.dict(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+            update_data = obj_in.model_dump(exclude_unset=True)
+        values = column_values(update_data, self.column_names, self.not_null, creating=False)
+        if not values:
+            return db_obj
+        before = row_change(db_obj)
+        statement = (
+            update(self.model)
+            .where(self.model.id == db_obj.id)
+            .values(**values)
+            .returning(*(getattr(self.model, name) for name in self.column_names))
+            .execution_options(changes_recorded=True, synchronize_session=False)
+        )
+        row = db.execute(statement).one_or_none()
+        return self._commit(db, apply_row(db_obj, row), before)
+
+    def remove(self, db: Session, *, id: int) -> Optional[ModelType]:
+        """Delete a record with one ``DELETE ... RETURNING``; None if it did not exist."""
+        statement = (
+            delete(self.model)
+            .where(self.model.id == id)
+            .returning(self.model)
+            .execution_options(changes_recorded=True)
+        )
+        obj = db.scalar(statement)
+        return self._commit(db, obj)
+
+    def _insert(self, db: Session, values: Dict[str, Any]) -> ModelType:
+        """INSERT ... RETURNING one row of mapped column values and commit it."""
+        values = column_values(values, self.column_names, self.not_null, creating=True)
+        statement = (
+            insert(self.model)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(changes_recorded=True)
+        )
+        return self._commit(db, db.scalar(statement))
 
-    def remove(self, db: Session, *, id: int) -> ModelType:
-        """Delete a record."""
-        obj = db.query(self.model).get(id)
-        db.delete(obj)
+    def _commit(
+        self, db: Session, obj: Optional[ModelType], before: Optional[Change] = None
+    ) -> Optional[ModelType]:
+        """
+        Record the change for a row written by a RETURNING statement and commit.
+
+        The row already holds what the database stored, so it is detached
+        before the commit instead of being expired and refreshed after it.
+        A renamed slug or scene name, or a new owner, is recorded under both
+        the old and the new value.
+        """
+        changes = [change for change in (before, row_change(obj)) if change]
+        if changes:
+            record_changes(db, changes)
+        if obj is not None and obj in db:
+            db.expunge(obj)
         db.commit()
         return obj
 
-    def count(self, db: Session) -> int:
-        """Count total records."""
-        return db.query(self.model).count()
+    def bulk(
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        is_superuser: bool = False,
+        creates: Sequence[Tuple[int, BaseModel]] = (),
+        updates: Sequence[Tuple[int, int, BaseModel]] = (),
+        deletes: Sequence[Tuple[int, int]] = ()
+    ) -> BulkResult:
+        """
+        Create, update and delete many rows in a single transaction.
+
+        Items come from app.utils.bulk.validate_bulk. Creates are one
+        multi-row INSERT ... RETURNING owned by ``user_id``. Updates are one
+        executemany UPDATE by primary key followed by one SELECT of the
+        changed rows, because bulk UPDATE by primary key cannot use
+        RETURNING. Deletes are one DELETE ... RETURNING. Updates and deletes
+        keep the single-item rules: a missing row is reported as not found,
+        and another owner's row is refused unless the user is a superuser.
+        A row deleted by someone else after the ownership check is reported
+        as not found too.
+        The returned rows are detached before the commit, so reading them
+        afterwards does not refresh each one.
+        """
+        errors: List[BulkItemError] = []
+        entity, key_attr = TRACKED_TABLES.get(self.model.__tablename__, (None, None))
+        writable = self.column_names - {"id", "user_id"}
+
+        existing: Dict[int, Tuple[int, Optional[str]]] = {}
+        target_ids = {item_id for _, item_id, _ in updates} | {item_id for _, item_id in deletes}
+        if target_ids:
+            columns = [self.model.id, self.model.user_id]
+            if key_attr:
+                columns.append(getattr(self.model, key_attr))
+            query = db.query(*columns).filter(self.model.id.in_(target_ids))
+            existing = {row[0]: (row[1], row[2] if key_attr else None) for row in query}
+
+        def not_found(operation: str, index: int, item_id: int) -> BulkItemError:
+            return BulkItemError(
+                operation=operation, index=index, id=item_id, detail=f"{self.model.__name__} not found"
+            )
+
+        def allowed(operation: str, index: int, item_id: int) -> bool:
+            if item_id not in existing:
+                errors.append(not_found(operation, index, item_id))
+            elif existing[item_id][0] != user_id and not is_superuser:
+                errors.append(
+                    BulkItemError(
+                        operation=operation, index=index, id=item_id, detail="Not enough permissions"
+                    )
+                )
+            else:
+                return True
+            return False
+
+        updates = [item for item in updates if allowed("update", item[0], item[1])]
+        deletes = [item for item in deletes if allowed("delete", item[0], item[1])]
+        touched: Dict[int, Set[str]] = {}
+
+        def touch(owner_id: int, *keys: Optional[str]) -> None:
+            touched.setdefault(owner_id, set()).update(key for key in keys if key)
+
+        created: List[Any] = []
+        if creates:
+            rows = []
+            for _, item in creates:
+                values = column_values(item.model_dump(), writable, self.not_null, creating=True)
+                rows.append({**values, "user_id": user_id})
+            statement = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            created = list(db.scalars(statement.execution_options(changes_recorded=True), rows))
+            for obj in created:
+                touch(user_id, getattr(obj, key_attr) if key_attr else None)
+
+        updated: List[Any] = []
+        if updates:
+            params = []
+            for _, item_id, item in updates:
+                values = column_values(
+                    item.model_dump(exclude_unset=True), writable, self.not_null, creating=False
+                )
+                owner_id, key = existing[item_id]
+                touch(owner_id, key, values.get(key_attr) if key_attr else None)
+                if values:
+                    params.append({"id": item_id, **values})
+            if params:
+                db.execute(update(self.model).execution_options(changes_recorded=True), params)
+            ids = [item_id for _, item_id, _ in updates]
+            rows_by_id = {
+                obj.id: obj
+                for obj in db.query(self.model).filter(self.model.id.in_(ids)).populate_existing()
+            }
+            for index, item_id, _ in updates:
+                if item_id in rows_by_id:
+                    updated.append(rows_by_id[item_id])
+                else:
+                    # Deleted since the ownership check; its UPDATE matched nothing.
+                    errors.append(not_found("update", index, item_id))
+
+        deleted: List[int] = []
+        if deletes:
+            ids = [item_id for _, item_id in deletes]
+            statement = (
+                delete(self.model)
+                .where(self.model.id.in_(ids))
+                .returning(self.model.id)
+                .execution_options(changes_recorded=True, synchronize_session=False)
+            )
+            removed = set(db.scalars(statement))
+            for index, item_id in deletes:
+                if item_id in removed:
+                    deleted.append(item_id)
+                    touch(*existing[item_id])
+                else:
+                    errors.append(not_found("delete", index, item_id))
+
+        if entity:
+            record_changes(
+                db, [Change(entity, owner_id, frozenset(keys)) for owner_id, keys in touched.items()]
+            )
+        for obj in (*created, *updated):
+            db.expunge(obj)
+        db.commit()
+        return BulkResult(created, updated, deleted, errors)
+
+    def owners(self, db: Session, *, ids: Sequence[int]) -> Dict[int, int]:
+        """Owner of each existing row among ids, in one query; missing ids are absent."""
+        query = db.query(self.model.id, self.model.user_id).filter(self.model.id.in_(ids))
+        return {row_id: owner_id for row_id, owner_id in query}
+
+    def reorder(self, db: Session, *, ids: Sequence[int], owners: Dict[int, int]) -> None:
+        """
+        Set display_order to each id's position in ids and commit.
+
+        One ``UPDATE ... SET display_order = CASE id WHEN ... END`` statement.
+        ``owners`` comes from self.owners after the caller's ownership check;
+        it scopes the change notification to the owner whose list moved.
+        """
+        owner_ids = set(owners.values())
+        positions = {row_id: position for position, row_id in enumerate(ids)}
+        statement = (
+            update(self.model)
+            .where(self.model.id.in_(ids))
+            .values(display_order=case(positions, value=self.model.id))
+            .execution_options(
+                synchronize_session=False,
+                owner_id=owner_ids.pop() if len(owner_ids) == 1 else None,
+            )
+        )
+        db.execute(statement)
+        db.commit()
+
+    def count(self, db: Session, *, user_id: Optional[int] = None) -> int:
+        """Count records, optionally of one owner, using the owner counters when cached."""
+        token = None
+        if self.counters is not None:
+            cached = self.counters.get(user_id)
+            if cached is not None:
+                return cached
+            token = self.counters.token()
+        query = db.query(self.model)
+        if user_id is not None:
+            query = query.filter(self.model.user_id == user_id)
+        total = query.count()
+        if token is not None:
+            self.counters.set(user_id, total, token)
+        return total
+
+    def page(
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        **filters: Any
+    ) -> Page:
+        """
+        One page of rows matching equality filters, in list_keyset order, with
+        the total number of matches.
+
+        Filters whose value is None are ignored, as in freshness. Lists
+        filtered by owner alone (or not at all) take the total from the owner
+        counters; other filters count matches with ``count(*) OVER()`` in the
+        page query itself, so no second query is needed. ``columns`` (a
+        sparse fieldset) loads only those columns and the sort key; the other
+        attributes of the returned rows must not be read.
+        """
+        keyset = self.list_keyset or self.keyset
+        filters = {field: value for field, value in filters.items() if value is not None}
+        query = db.query(self.model).filter_by(**filters)
+        if self.counters is not None and set(filters) <= {"user_id"}:
+            projected = self._project(query, self.model, keyset, columns)
+            items = keyset.paginate(projected, skip=skip, limit=limit, cursor=cursor).all()
+            total = self.count(db, user_id=filters.get("user_id"))
+            return Page(items, total, keyset.next_cursor(items, limit))
+
+        rows = self._windowed(
+            db, query, keyset, skip=skip, limit=limit, cursor=cursor, columns=columns
+        ).all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][1]
+        elif skip or cursor:
+            # Past the last page no row carries the window; count the matches directly.
+            total = query.count()
+        else:
+            total = 0
+        return Page(items, total, keyset.next_cursor(items, limit))
+
+    def _windowed(
+        self,
+        db: Session,
+        query: Query,
+        keyset: Keyset,
+        *,
+        skip: int,
+        limit: int,
+        cursor: Optional[str],
+        columns: Optional[Sequence[str]] = None
+    ) -> Query:
+        """Add a ``count(*) OVER()`` column to a filtered query and paginate it."""
+        total = func.count().over().label("total")
+        if cursor:
+            # The cursor goes outside the window, so the total still covers every match.
+            window = query.add_columns(total).subquery()
+            entity = aliased(self.model, window)
+            query, keyset = db.query(entity, window.c.total), keyset.bind(entity)
+            query = self._project(query, entity, keyset, columns)
+        else:
+            query = self._project(query, self.model, keyset, columns).add_columns(total)
+        return keyset.paginate(query, skip=skip, limit=limit, cursor=cursor)
+
+    def _project(
+        self, query: Query, entity: Any, keyset: Keyset, columns: Optional[Sequence[str]]
+    ) -> Query:
+        """Load only ``columns`` of entity plus the keyset's sort key; None loads every column."""
+        if not columns:
+            return query
+        names = self.column_names.intersection({*columns, *(part.attr for part in keyset.parts)})
+        return query.options(load_only(*(getattr(entity, name) for name in sorted(names))))
+
+    def freshness(self, db: Session, **filters: Any) -> Tuple[Optional[datetime], int]:
+        """
+        Newest change timestamp and row count for rows matching equality filters.
+
+        Filters whose value is None are ignored, so callers can pass optional
+        query parameters straight through.
+        """
+        changed_at = func.coalesce(self.model.updated_at, self.model.created_at)
+        query = db.query(func.max(changed_at), func.count(self.model.id))
+        for field, value in filters.items():
+            if value is not None:
+                query = query.filter(getattr(self.model, field) == value)
+        last_modified, count = query.one()
+        return last_modified, count
@@ -0,0 +1,71 @@
+from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.crud.async_base import AsyncCRUDBase
+from app.crud.base import CRUDBase
+from app.models.education import Education
+from app.schemas.education import EducationCreate, EducationUpdate
+from app.utils.pagination import Keyset, KeyPart
+
+# Display order of the list endpoint; id breaks ties so cursors are exact.
+DISPLAY_ORDER = Keyset(
+    Education,
+    KeyPart("display_order"),
+    KeyPart("start_date", descending=True),
+    KeyPart("id"),
+)
+
+
+class CRUDEducation(CRUDBase[Education, EducationCreate, EducationUpdate]):
+    """CRUD operations for Education model."""
+
+    list_keyset = DISPLAY_ORDER
+
+    def get_by_user(
+        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Education]:
+        """Get all education entries for a specific user."""
+        return (
+            db.query(Education)
+            .filter(Education.user_id == user_id)
+            .order_by(Education.display_order.asc(), Education.start_date.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def create_with_user(
+        self, db: Session, *, obj_in: EducationCreate, user_id: int
+    ) -> Education:
+        """Create new education entry for a specific user."""
+        return self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+class AsyncCRUDEducation(AsyncCRUDBase[Education, EducationCreate, EducationUpdate]):
+    """Async CRUD operations for Education model."""
+
+    list_keyset = DISPLAY_ORDER
+
+    async def get_by_user(
+        self, db: AsyncSession, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Education]:
+        """Get all education entries for a specific user."""
+        return await self.all(
+            db,
+            select(Education)
+            .where(Education.user_id == user_id)
+            .order_by(Education.display_order.asc(), Education.start_date.desc())
+            .offset(skip)
+            .limit(limit),
+        )
+
+    async def create_with_user(
+        self, db: AsyncSession, *, obj_in: EducationCreate, user_id: int
+    ) -> Education:
+        """Create new education entry for a specific user."""
+        return await self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+education = CRUDEducation(Education)
+async_education = AsyncCRUDEducation(Education)
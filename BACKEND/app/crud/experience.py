@@ -1,13 +1,27 @@
 from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.crud.async_base import AsyncCRUDBase
 from app.crud.base import CRUDBase
 from app.models.experience import Experience
 from app.schemas.experience import ExperienceCreate, ExperienceUpdate
+from app.utils.pagination import Keyset, KeyPart
+
+# Timeline order of the list endpoint: current roles first, newest first.
+TIMELINE = Keyset(
+    Experience,
+    KeyPart("is_current", descending=True),
+    KeyPart("start_date", descending=True),
+    KeyPart("id", descending=True),
+)
 
 
 class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
     """CRUD operations for Experience model."""
 
+    list_keyset = TIMELINE
+
     def get_by_user(
         self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
     ) -> List[Experience]:
@@ -47,12 +61,56 @@ class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
         self, db: Session, *, obj_in: ExperienceCreate, user_id: int
     ) -> Experience:
         """Create new experience entry for a specific user."""
-        obj_in_data = obj_in.dict()
-        db_obj = Experience(**obj_in_data, user_id=user_id)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+class AsyncCRUDExperience(AsyncCRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
+    """Async CRUD operations for Experience model."""
+
+    list_keyset = TIMELINE
+    ordering = (Experience.is_current.desc(), Experience.start_date.desc())
+
+    async def get_by_user(
+        self, db: AsyncSession, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Experience]:
+        """Get all experience entries for a specific user."""
+        return await self.all(
+            db,
+            select(Experience)
+            .where(Experience.user_id == user_id)
+            .order_by(*self.ordering)
+            .offset(skip)
+            .limit(limit),
+        )
+
+    async def get_by_slug(
+        self, db: AsyncSession, *, profile_slug: str, skip: int = 0, limit: int = 100
+    ) -> List[Experience]:
+        """Get experience entries for a profile slug."""
+        return await self.all(
+            db,
+            select(Experience)
+            .where(Experience.profile_slug == profile_slug)
+            .order_by(*self.ordering)
+            .offset(skip)
+            .limit(limit),
+        )
+
+    async def get_current(self, db: AsyncSession, *, user_id: int) -> List[Experience]:
+        """Get current employment for a user."""
+        return await self.all(
+            db,
+            select(Experience)
+            .where(Experience.user_id == user_id, Experience.is_current.is_(True))
+            .order_by(Experience.start_date.desc()),
+        )
+
+    async def create_with_user(
+        self, db: AsyncSession, *, obj_in: ExperienceCreate, user_id: int
+    ) -> Experience:
+        """Create new experience entry for a specific user."""
+        return await self.create(db, obj_in=obj_in, user_id=user_id)
 
 
 experience = CRUDExperience(Experience)
+async_experience = AsyncCRUDExperience(Experience)
@@ -0,0 +1,154 @@
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.cache import SnapshotStore
+from app.core.config import settings
+from app.core.invalidation import Change, subscribe
+from app.crud.education import async_education, education as education_crud
+from app.crud.experience import async_experience, experience as experience_crud
+from app.crud.project import async_project, project as project_crud
+from app.crud.site_content import async_site_content, site_content as site_content_crud
+from app.crud.skill import async_skill, skill as skill_crud
+from app.crud.three_config import async_three_config, three_config as three_config_crud
+from app.schemas.portfolio import PortfolioBundle
+from app.utils.conditional import Validator, as_utc, make_etag
+
+
+class PortfolioSnapshot(NamedTuple):
+    """A built bundle, its encoded JSON and the validator clients revalidate it with."""
+
+    bundle: PortfolioBundle
+    body: bytes
+    validator: Validator
+
+
+def _last_modified(bundle: PortfolioBundle) -> Optional[datetime]:
+    """Newest change timestamp across every section of a bundle."""
+    rows = [
+        bundle.site_content,
+        *bundle.projects,
+        *bundle.skills,
+        *bundle.experiences,
+        *bundle.educations,
+        *bundle.three_configs,
+    ]
+    # Naive on SQLite, aware on Postgres; normalized so max() and Last-Modified work on both.
+    stamps = [as_utc(row.updated_at or row.created_at) for row in rows]
+    return max((stamp for stamp in stamps if stamp), default=None)
+
+
+def make_snapshot(bundle: PortfolioBundle) -> PortfolioSnapshot:
+    """Encode and hash a bundle once; hits never re-serialize."""
+    body = bundle.model_dump_json().encode("utf-8")
+    validator = Validator(
+        etag=make_etag("portfolio", body),
+        last_modified=_last_modified(bundle),
+    )
+    return PortfolioSnapshot(bundle=bundle, body=body, validator=validator)
+
+
+class CRUDPortfolio:
+    """Builds the public portfolio bundle for a profile slug and keeps a
+    per-slug snapshot of it until one of its owning rows changes."""
+
+    def __init__(self) -> None:
+        self.snapshots = SnapshotStore(
+            maxsize=settings.SNAPSHOT_MAXSIZE, ttl=settings.SNAPSHOT_TTL
+        )
+
+    def build(self, db: Session, *, profile_slug: str) -> Optional[PortfolioBundle]:
+        """Query every public section for a slug, mirroring the per-section endpoints."""
+        content = site_content_crud.get_by_slug(db, profile_slug=profile_slug)
+        if not content:
+            return None
+        user_id = content.user_id
+
+        experiences = experience_crud.get_by_slug(db, profile_slug=profile_slug)
+        if not experiences:
+            experiences = experience_crud.get_by_user(db, user_id=user_id)
+
+        return PortfolioBundle(
+            slug=profile_slug,
+            site_content=content,
+            projects=project_crud.get_by_user(db, user_id=user_id),
+            skills=skill_crud.get_by_user(db, user_id=user_id),
+            experiences=experiences,
+            educations=education_crud.get_by_user(db, user_id=user_id),
+            three_configs=three_config_crud.get_by_user(db, user_id=user_id),
+        )
+
+    def build_snapshot(self, db: Session, *, profile_slug: str) -> Optional[PortfolioSnapshot]:
+        """Build a bundle and wrap it in a snapshot."""
+        bundle = self.build(db, profile_slug=profile_slug)
+        return make_snapshot(bundle) if bundle is not None else None
+
+    def get_by_slug(self, db: Session, *, profile_slug: str) -> Optional[PortfolioSnapshot]:
+        """Return the snapshot for a slug, building it on first use."""
+        if not site_content_crud.resolve_slug(db, profile_slug=profile_slug):
+            return None
+        return self.snapshots.get_or_build(
+            profile_slug, lambda: self.build_snapshot(db, profile_slug=profile_slug)
+        )
+
+    def invalidate(self, changes: List[Change]) -> None:
+        """Drop snapshots that include any of the changed rows."""
+        for change in changes:
+            if change.user_id is None:
+                # Owner unknown.
+                self.snapshots.clear()
+                return
+            self.snapshots.evict_where(
+                lambda slug, snapshot: slug in change.keys
+                or snapshot.bundle.site_content.user_id == change.user_id
+            )
+
+
+class AsyncCRUDPortfolio:
+    """Async bundle builder sharing the sync instance's snapshots and invalidation."""
+
+    def __init__(self, snapshots: SnapshotStore) -> None:
+        self.snapshots = snapshots
+
+    async def build(self, db: AsyncSession, *, profile_slug: str) -> Optional[PortfolioBundle]:
+        """Query every public section for a slug, mirroring CRUDPortfolio.build."""
+        content = await async_site_content.get_by_slug(db, profile_slug=profile_slug)
+        if not content:
+            return None
+        user_id = content.user_id
+
+        experiences = await async_experience.get_by_slug(db, profile_slug=profile_slug)
+        if not experiences:
+            experiences = await async_experience.get_by_user(db, user_id=user_id)
+
+        return PortfolioBundle(
+            slug=profile_slug,
+            site_content=content,
+            projects=await async_project.get_by_user(db, user_id=user_id),
+            skills=await async_skill.get_by_user(db, user_id=user_id),
+            experiences=experiences,
+            educations=await async_education.get_by_user(db, user_id=user_id),
+            three_configs=await async_three_config.get_by_user(db, user_id=user_id),
+        )
+
+    async def build_snapshot(
+        self, db: AsyncSession, *, profile_slug: str
+    ) -> Optional[PortfolioSnapshot]:
+        """Build a bundle and wrap it in a snapshot."""
+        bundle = await self.build(db, profile_slug=profile_slug)
+        return make_snapshot(bundle) if bundle is not None else None
+
+    async def get_by_slug(
+        self, db: AsyncSession, *, profile_slug: str
+    ) -> Optional[PortfolioSnapshot]:
+        """Return the snapshot for a slug, building it on first use."""
+        if not await async_site_content.resolve_slug(db, profile_slug=profile_slug):
+            return None
+        return await self.snapshots.aget_or_build(
+            profile_slug, lambda: self.build_snapshot(db, profile_slug=profile_slug)
+        )
+
+
+portfolio = CRUDPortfolio()
+subscribe(portfolio.invalidate)
+async_portfolio = AsyncCRUDPortfolio(portfolio.snapshots)
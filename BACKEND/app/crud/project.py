@@ -1,25 +1,39 @@
 from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.crud.async_base import AsyncCRUDBase
 from app.crud.base import CRUDBase
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.utils.pagination import Keyset, KeyPart
+
+# Display order for every per-owner list; id breaks ties so cursors are exact.
+DISPLAY_ORDER = Keyset(
+    Project,
+    KeyPart("display_order"),
+    KeyPart("created_at", descending=True),
+    KeyPart("id", descending=True),
+)
 
 
 class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
     """CRUD operations for Project model."""
 
+    list_keyset = DISPLAY_ORDER
+
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Project]:
         """Get all projects for a specific user."""
-        return (
-            db.query(Project)
-            .filter(Project.user_id == user_id)
-            .order_by(Project.display_order.asc(), Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(Project).filter(Project.user_id == user_id)
+        return DISPLAY_ORDER.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
 
     def get_featured(
         self,
@@ -27,7 +41,8 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         *,
         skip: int = 0,
         limit: int = 10,
-        user_id: int | None = None
+        user_id: int | None = None,
+        cursor: Optional[str] = None
     ) -> List[Project]:
         """Get featured projects, optionally scoped to a user."""
         query = (
@@ -36,12 +51,7 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         )
         if user_id:
             query = query.filter(Project.user_id == user_id)
-        return (
-            query.order_by(Project.display_order.asc(), Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return DISPLAY_ORDER.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
 
     def get_by_category(
         self,
@@ -50,29 +60,83 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         category: str,
         skip: int = 0,
         limit: int = 100,
-        user_id: int | None = None
+        user_id: int | None = None,
+        cursor: Optional[str] = None
     ) -> List[Project]:
         """Get projects by category."""
         query = db.query(Project).filter(Project.category == category)
         if user_id:
             query = query.filter(Project.user_id == user_id)
-        return (
-            query.order_by(Project.display_order.asc(), Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        return DISPLAY_ORDER.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
 
     def create_with_user(
         self, db: Session, *, obj_in: ProjectCreate, user_id: int
     ) -> Project:
         """Create new project for a specific user."""
-        obj_in_data = obj_in.dict()
-        db_obj = Project(**obj_in_data, user_id=user_id)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+class AsyncCRUDProject(AsyncCRUDBase[Project, ProjectCreate, ProjectUpdate]):
+    """Async CRUD operations for Project model."""
+
+    list_keyset = DISPLAY_ORDER
+
+    async def get_by_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Project]:
+        """Get all projects for a specific user."""
+        statement = select(Project).where(Project.user_id == user_id)
+        return await self.all(
+            db, DISPLAY_ORDER.paginate(statement, skip=skip, limit=limit, cursor=cursor)
+        )
+
+    async def get_featured(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 10,
+        user_id: int | None = None,
+        cursor: Optional[str] = None
+    ) -> List[Project]:
+        """Get featured projects, optionally scoped to a user."""
+        statement = select(Project).where(Project.featured.is_(True))
+        if user_id:
+            statement = statement.where(Project.user_id == user_id)
+        return await self.all(
+            db, DISPLAY_ORDER.paginate(statement, skip=skip, limit=limit, cursor=cursor)
+        )
+
+    async def get_by_category(
+        self,
+        db: AsyncSession,
+        *,
+        category: str,
+        skip: int = 0,
+        limit: int = 100,
+        user_id: int | None = None,
+        cursor: Optional[str] = None
+    ) -> List[Project]:
+        """Get projects by category."""
+        statement = select(Project).where(Project.category == category)
+        if user_id:
+            statement = statement.where(Project.user_id == user_id)
+        return await self.all(
+            db, DISPLAY_ORDER.paginate(statement, skip=skip, limit=limit, cursor=cursor)
+        )
+
+    async def create_with_user(
+        self, db: AsyncSession, *, obj_in: ProjectCreate, user_id: int
+    ) -> Project:
+        """Create new project for a specific user."""
+        return await self.create(db, obj_in=obj_in, user_id=user_id)
 
 
 project = CRUDProject(Project)
+async_project = AsyncCRUDProject(Project)
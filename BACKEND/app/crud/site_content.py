@@ -1,13 +1,78 @@
-from typing import List, Optional
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.core.cache import LRUCache, NegativeCache, SnapshotStore, shared_generation
+from app.core.config import settings
+from app.core.invalidation import Change, subscribe
+from app.crud.async_base import AsyncCRUDBase
 from app.crud.base import CRUDBase
 from app.models.site_content import SiteContent
-from app.schemas.site_content import SiteContentCreate, SiteContentUpdate
+from app.schemas.site_content import (
+    SiteContent as SiteContentSchema,
+    SiteContentCreate,
+    SiteContentUpdate,
+)
+from app.utils.conditional import Validator, make_etag
+from app.utils.pagination import Keyset, KeyPart
+
+# Public JSON snapshot key for the legacy no-slug homepage.
+DEFAULT_CONTENT_KEY = ""
+
+# Admin list order: newest first.
+NEWEST_FIRST = Keyset(
+    SiteContent,
+    KeyPart("created_at", descending=True),
+    KeyPart("id", descending=True),
+)
+
+
+class SlugOwner(NamedTuple):
+    """Owner of a profile slug."""
+
+    user_id: int
+    content_id: int
+
+
+class PublicContent(NamedTuple):
+    """Rendered public JSON for one site content row."""
+
+    body: bytes
+    validator: Validator
+    user_id: int
+
+
+def render_content(content: SiteContent) -> PublicContent:
+    """Serialize one row to public JSON and derive its validator."""
+    body = SiteContentSchema.model_validate(content).model_dump_json().encode("utf-8")
+    validator = Validator(
+        etag=make_etag("site_content", body),
+        last_modified=content.updated_at or content.created_at,
+    )
+    return PublicContent(body=body, validator=validator, user_id=content.user_id)
 
 
 class CRUDSiteContent(CRUDBase[SiteContent, SiteContentCreate, SiteContentUpdate]):
     """CRUD operations for site content."""
 
+    list_keyset = NEWEST_FIRST
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.slug_cache = LRUCache(
+            maxsize=settings.SLUG_CACHE_MAXSIZE, ttl=settings.SLUG_CACHE_TTL
+        )
+        self.public_json = SnapshotStore(
+            maxsize=settings.SNAPSHOT_MAXSIZE, ttl=settings.SNAPSHOT_TTL
+        )
+        self.missing_slugs = NegativeCache(
+            maxsize=settings.NEGATIVE_CACHE_MAXSIZE,
+            ttl=settings.NEGATIVE_CACHE_TTL,
+            shared=shared_generation("missing_slugs"),
+        )
+
     def get_active(self, db: Session, *, user_id: int | None = None) -> Optional[SiteContent]:
         """Get the currently active homepage content. Scoped to user if provided."""
         query = db.query(SiteContent).filter(SiteContent.is_active.is_(True))
@@ -27,6 +92,88 @@ class CRUDSiteContent(CRUDBase[SiteContent, SiteContentCreate, SiteContentUpdate
             .first()
         )
 
+    def resolve_slug(self, db: Session, *, profile_slug: str) -> Optional[SlugOwner]:
+        """Map a profile slug to its owner, served from the slug caches when possible.
+
+        Unknown slugs are remembered for NEGATIVE_CACHE_TTL seconds, or until
+        a row with that slug is committed.
+        """
+        owner = self.slug_cache.get(profile_slug)
+        if owner is not None:
+            return owner
+        if self.missing_slugs.is_missing(profile_slug):
+            return None
+        token = self.missing_slugs.token()
+        row = (
+            db.query(SiteContent.user_id, SiteContent.id)
+            .filter(SiteContent.profile_slug == profile_slug)
+            .first()
+        )
+        if row is None:
+            self.missing_slugs.mark_missing(profile_slug, token)
+            return None
+        owner = SlugOwner(user_id=row.user_id, content_id=row.id)
+        self.slug_cache.set(profile_slug, owner)
+        return owner
+
+    def invalidate_slugs(self, changes: List[Change]) -> None:
+        """Evict cached slugs touched by committed site content writes."""
+        for change in changes:
+            if change.entity != "site_content":
+                continue
+            if change.user_id is None:
+                self.slug_cache.clear()
+                self.missing_slugs.clear()
+                return
+            self.missing_slugs.forget(change.keys)
+            self.slug_cache.evict_where(
+                lambda slug, owner: slug in change.keys or owner.user_id == change.user_id
+            )
+
+    def render_public(
+        self, db: Session, *, profile_slug: Optional[str] = None
+    ) -> Optional[PublicContent]:
+        """Query and serialize public content once: by slug, or the legacy active default."""
+        if profile_slug:
+            content = self.get_by_slug(db, profile_slug=profile_slug)
+        else:
+            content = self.get_active(db)
+        if not content:
+            return None
+        return render_content(content)
+
+    def get_public_json(
+        self, db: Session, *, profile_slug: Optional[str] = None
+    ) -> Optional[PublicContent]:
+        """Return pre-rendered public content, rendering it on first use."""
+        if profile_slug and not self.resolve_slug(db, profile_slug=profile_slug):
+            return None
+        key = profile_slug or DEFAULT_CONTENT_KEY
+        return self.public_json.get_or_build(
+            key, lambda: self.render_public(db, profile_slug=profile_slug)
+        )
+
+    def prime_public_json(self, db: Session, *, profile_slug: Optional[str] = None) -> None:
+        """Re-render public JSON after a write so the next visitor gets stored bytes."""
+        if profile_slug:
+            self.get_public_json(db, profile_slug=profile_slug)
+        self.get_public_json(db)
+
+    def invalidate_public_json(self, changes: List[Change]) -> None:
+        """Drop rendered public JSON touched by committed site content writes."""
+        for change in changes:
+            if change.entity != "site_content":
+                continue
+            if change.user_id is None:
+                self.public_json.clear()
+                return
+            # Any activation can change which row the legacy default serves.
+            self.public_json.evict_where(
+                lambda key, rendered: key == DEFAULT_CONTENT_KEY
+                or key in change.keys
+                or rendered.user_id == change.user_id
+            )
+
     def get_by_user(
         self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
     ) -> List[SiteContent]:
@@ -40,40 +187,170 @@ class CRUDSiteContent(CRUDBase[SiteContent, SiteContentCreate, SiteContentUpdate
             .all()
         )
 
-    def deactivate_all(self, db: Session, *, user_id: int | None = None) -> None:
-        """Set content rows inactive. If user_id provided, only that user's rows."""
-        query = db.query(SiteContent)
-        if user_id:
-            query = query.filter(SiteContent.user_id == user_id)
-        query.update({SiteContent.is_active: False})
-        db.commit()
+    def deactivate_others(self, db: Session, *, user_id: int, keep: Optional[int] = None) -> None:
+        """Set the user's active rows other than ``keep`` inactive, without committing."""
+        statement = (
+            update(SiteContent)
+            .where(SiteContent.user_id == user_id, SiteContent.is_active.is_(True))
+            .values(is_active=False)
+            .execution_options(owner_id=user_id)
+        )
+        if keep is not None:
+            statement = statement.where(SiteContent.id != keep)
+        db.execute(statement)
+
+    def _single_active(
+        self, db: Session, *, user_id: int, keep: Optional[int], write: Callable[[], SiteContent]
+    ) -> SiteContent:
+        """
+        Deactivate the user's other rows and run write, which commits, in one transaction.
+
+        The partial unique index ux_site_content_user_active allows one active
+        row per user. Of two concurrent activations the second fails on it
+        once the first commits; it is retried once against the committed state.
+        """
+        for attempt in range(2):
+            try:
+                self.deactivate_others(db, user_id=user_id, keep=keep)
+                return write()
+            except IntegrityError:
+                db.rollback()
+                if attempt:
+                    raise
 
     def create_with_user(
         self, db: Session, *, obj_in: SiteContentCreate, user_id: int
     ) -> SiteContent:
         """Create content for user, preserving single active row when needed."""
+        write = partial(self.create, db, obj_in=obj_in, user_id=user_id)
         if obj_in.is_active:
-            self.deactivate_all(db, user_id=user_id)
+            db_obj = self._single_active(db, user_id=user_id, keep=None, write=write)
+        else:
+            db_obj = write()
+        self.prime_public_json(db, profile_slug=db_obj.profile_slug)
+        return db_obj
 
-        obj_in_data = obj_in.dict()
-        db_obj = SiteContent(**obj_in_data, user_id=user_id)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: SiteContent,
+        obj_in: Union[SiteContentUpdate, Dict[str, Any]]
+    ) -> SiteContent:
+        """
+        Update content and re-render its public JSON.
+
+        Setting is_active deactivates the user's other rows in the same transaction.
+        """
+        if isinstance(obj_in, dict):
+            activate = obj_in.get("is_active")
+        else:
+            activate = obj_in.is_active
+        write = partial(super().update, db, db_obj=db_obj, obj_in=obj_in)
+        if activate:
+            db_obj = self._single_active(db, user_id=db_obj.user_id, keep=db_obj.id, write=write)
+        else:
+            db_obj = write()
+        self.prime_public_json(db, profile_slug=db_obj.profile_slug)
         return db_obj
 
-    def set_active(self, db: Session, *, content_id: int) -> Optional[SiteContent]:
-        """Activate one row and deactivate the rest for that user."""
-        content = self.get(db, id=content_id)
+    def remove(self, db: Session, *, id: int) -> SiteContent:
+        """Delete content and re-render the legacy default it may have been serving."""
+        obj = super().remove(db, id=id)
+        self.prime_public_json(db)
+        return obj
+
+    def set_active(self, db: Session, *, db_obj: SiteContent) -> SiteContent:
+        """
+        Activate one row and deactivate the rest for that user.
+
+        Two UPDATEs and one commit: the user's other active rows are switched
+        off first, then the row is switched on with ``UPDATE ... RETURNING``.
+        """
+        return self.update(db, db_obj=db_obj, obj_in={"is_active": True})
+
+
+class AsyncCRUDSiteContent(AsyncCRUDBase[SiteContent, SiteContentCreate, SiteContentUpdate]):
+    """Async public reads for site content.
+
+    Uses the sync instance's slug caches and public JSON snapshots, which
+    stay subscribed to the change feed, so both paths share one set of
+    cached entries and invalidations.
+    """
+
+    ordering = (SiteContent.updated_at.desc().nullslast(), SiteContent.created_at.desc())
+
+    def __init__(self, model, caches: CRUDSiteContent):
+        super().__init__(model)
+        self.slug_cache = caches.slug_cache
+        self.missing_slugs = caches.missing_slugs
+        self.public_json = caches.public_json
+
+    async def get_active(
+        self, db: AsyncSession, *, user_id: int | None = None
+    ) -> Optional[SiteContent]:
+        """Get the currently active homepage content. Scoped to user if provided."""
+        statement = select(SiteContent).where(SiteContent.is_active.is_(True))
+        if user_id:
+            statement = statement.where(SiteContent.user_id == user_id)
+        return await db.scalar(statement.order_by(*self.ordering).limit(1))
+
+    async def get_by_slug(self, db: AsyncSession, *, profile_slug: str) -> Optional[SiteContent]:
+        """Get site content by profile slug."""
+        return await db.scalar(
+            select(SiteContent)
+            .where(SiteContent.profile_slug == profile_slug)
+            .order_by(*self.ordering)
+            .limit(1)
+        )
+
+    async def resolve_slug(self, db: AsyncSession, *, profile_slug: str) -> Optional[SlugOwner]:
+        """Map a profile slug to its owner, served from the slug caches when possible."""
+        owner = self.slug_cache.get(profile_slug)
+        if owner is not None:
+            return owner
+        if self.missing_slugs.is_missing(profile_slug):
+            return None
+        token = self.missing_slugs.token()
+        row = (
+            await db.execute(
+                select(SiteContent.user_id, SiteContent.id)
+                .where(SiteContent.profile_slug == profile_slug)
+                .limit(1)
+            )
+        ).first()
+        if row is None:
+            self.missing_slugs.mark_missing(profile_slug, token)
+            return None
+        owner = SlugOwner(user_id=row.user_id, content_id=row.id)
+        self.slug_cache.set(profile_slug, owner)
+        return owner
+
+    async def render_public(
+        self, db: AsyncSession, *, profile_slug: Optional[str] = None
+    ) -> Optional[PublicContent]:
+        """Query and serialize public content once: by slug, or the legacy active default."""
+        if profile_slug:
+            content = await self.get_by_slug(db, profile_slug=profile_slug)
+        else:
+            content = await self.get_active(db)
         if not content:
             return None
+        return render_content(content)
 
-        self.deactivate_all(db, user_id=content.user_id)
-        content.is_active = True
-        db.add(content)
-        db.commit()
-        db.refresh(content)
-        return content
+    async def get_public_json(
+        self, db: AsyncSession, *, profile_slug: Optional[str] = None
+    ) -> Optional[PublicContent]:
+        """Return pre-rendered public content, rendering it on first use."""
+        if profile_slug and not await self.resolve_slug(db, profile_slug=profile_slug):
+            return None
+        key = profile_slug or DEFAULT_CONTENT_KEY
+        return await self.public_json.aget_or_build(
+            key, lambda: self.render_public(db, profile_slug=profile_slug)
+        )
 
 
 site_content = CRUDSiteContent(SiteContent)
+subscribe(site_content.invalidate_slugs)
+subscribe(site_content.invalidate_public_json)
+async_site_content = AsyncCRUDSiteContent(SiteContent, site_content)
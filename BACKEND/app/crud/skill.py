@@ -1,25 +1,39 @@
-from typing import List
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.crud.async_base import AsyncCRUDBase
 from app.crud.base import CRUDBase
 from app.models.skill import Skill
 from app.schemas.skill import SkillCreate, SkillUpdate
+from app.utils.pagination import Keyset, KeyPart
+
+# Display order for every per-owner list; id breaks ties so cursors are exact.
+DISPLAY_ORDER = Keyset(
+    Skill,
+    KeyPart("display_order"),
+    KeyPart("proficiency", descending=True, default=0),
+    KeyPart("id"),
+)
 
 
 class CRUDSkill(CRUDBase[Skill, SkillCreate, SkillUpdate]):
     """CRUD operations for Skill model."""
 
+    list_keyset = DISPLAY_ORDER
+
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
     ) -> List[Skill]:
         """Get all skills for a specific user."""
-        return (
-            db.query(Skill)
-            .filter(Skill.user_id == user_id)
-            .order_by(Skill.display_order.asc(), Skill.proficiency.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(Skill).filter(Skill.user_id == user_id)
+        return DISPLAY_ORDER.paginate(query, skip=skip, limit=limit, cursor=cursor).all()
 
     def get_by_category(
         self, db: Session, *, user_id: int, category: str
@@ -28,7 +42,7 @@ class CRUDSkill(CRUDBase[Skill, SkillCreate, SkillUpdate]):
         return (
             db.query(Skill)
             .filter(Skill.user_id == user_id, Skill.category == category)
-            .order_by(Skill.display_order.asc(), Skill.proficiency.desc())
+            .order_by(*DISPLAY_ORDER.order_by())
             .all()
         )
 
@@ -36,12 +50,46 @@ class CRUDSkill(CRUDBase[Skill, SkillCreate, SkillUpdate]):
         self, db: Session, *, obj_in: SkillCreate, user_id: int
     ) -> Skill:
         """Create new skill for a specific user."""
-        obj_in_data = obj_in.dict()
-        db_obj = Skill(**obj_in_data, user_id=user_id)
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+        return self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+class AsyncCRUDSkill(AsyncCRUDBase[Skill, SkillCreate, SkillUpdate]):
+    """Async CRUD operations for Skill model."""
+
+    list_keyset = DISPLAY_ORDER
+
+    async def get_by_user(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> List[Skill]:
+        """Get all skills for a specific user."""
+        statement = select(Skill).where(Skill.user_id == user_id)
+        return await self.all(
+            db, DISPLAY_ORDER.paginate(statement, skip=skip, limit=limit, cursor=cursor)
+        )
+
+    async def get_by_category(
+        self, db: AsyncSession, *, user_id: int, category: str
+    ) -> List[Skill]:
+        """Get skills by category for a user."""
+        return await self.all(
+            db,
+            select(Skill)
+            .where(Skill.user_id == user_id, Skill.category == category)
+            .order_by(*DISPLAY_ORDER.order_by()),
+        )
+
+    async def create_with_user(
+        self, db: AsyncSession, *, obj_in: SkillCreate, user_id: int
+    ) -> Skill:
+        """Create new skill for a specific user."""
+        return await self.create(db, obj_in=obj_in, user_id=user_id)
 
 
 skill = CRUDSkill(Skill)
+async_skill = AsyncCRUDSkill(Skill)
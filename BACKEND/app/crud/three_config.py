@@ -0,0 +1,158 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.cache import NegativeCache, shared_generation
+from app.core.config import settings
+from app.core.invalidation import Change, subscribe
+from app.crud.async_base import AsyncCRUDBase
+from app.crud.base import CRUDBase
+from app.models.three_config import ThreeConfig
+from app.schemas.three_config import ThreeConfigCreate, ThreeConfigUpdate
+
+
+class CRUDThreeConfig(CRUDBase[ThreeConfig, ThreeConfigCreate, ThreeConfigUpdate]):
+    """CRUD operations for ThreeConfig model."""
+
+    def __init__(self, model):
+        super().__init__(model)
+        self.missing_scenes = NegativeCache(
+            maxsize=settings.NEGATIVE_CACHE_MAXSIZE,
+            ttl=settings.NEGATIVE_CACHE_TTL,
+            shared=shared_generation("missing_scenes"),
+        )
+
+    def get_by_scene(self, db: Session, *, scene_name: str) -> Optional[ThreeConfig]:
+        """Get a 3D configuration by its unique scene name."""
+        return db.query(ThreeConfig).filter(ThreeConfig.scene_name == scene_name).first()
+
+    def scene_missing(self, scene_name: str) -> bool:
+        """True when the scene was recently looked up and not found."""
+        return self.missing_scenes.is_missing(scene_name)
+
+    def get_by_scene_cached(self, db: Session, *, scene_name: str) -> Optional[ThreeConfig]:
+        """get_by_scene that remembers unknown scene names for NEGATIVE_CACHE_TTL seconds."""
+        if self.scene_missing(scene_name):
+            return None
+        token = self.missing_scenes.token()
+        config = self.get_by_scene(db, scene_name=scene_name)
+        if config is None:
+            self.missing_scenes.mark_missing(scene_name, token)
+        return config
+
+    def invalidate_scenes(self, changes: List[Change]) -> None:
+        """Forget misses for scene names that a committed write created or renamed."""
+        for change in changes:
+            if change.entity != "three_config":
+                continue
+            if change.user_id is None and not change.keys:
+                self.missing_scenes.clear()
+                return
+            self.missing_scenes.forget(change.keys)
+
+    def get_by_user(
+        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[ThreeConfig]:
+        """Get the 3D configurations owned by one user."""
+        query = db.query(ThreeConfig).filter(ThreeConfig.user_id == user_id)
+        return self.keyset.paginate(query, skip=skip, limit=limit).all()
+
+    def get_by_type(
+        self, db: Session, *, scene_type: str, skip: int = 0, limit: int = 100
+    ) -> List[ThreeConfig]:
+        """Get 3D configurations of one scene type."""
+        return (
+            db.query(ThreeConfig)
+            .filter(ThreeConfig.scene_type == scene_type)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def create_with_user(
+        self, db: Session, *, obj_in: ThreeConfigCreate, user_id: int
+    ) -> ThreeConfig:
+        """Create new 3D configuration for a specific user."""
+        return self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+class AsyncCRUDThreeConfig(AsyncCRUDBase[ThreeConfig, ThreeConfigCreate, ThreeConfigUpdate]):
+    """Async CRUD operations for ThreeConfig model.
+
+    Shares the unknown-scene cache of the sync instance, so both paths see
+    the same misses and the same invalidations.
+    """
+
+    def __init__(self, model, missing_scenes: NegativeCache):
+        super().__init__(model)
+        self.missing_scenes = missing_scenes
+
+    async def get_by_scene(self, db: AsyncSession, *, scene_name: str) -> Optional[ThreeConfig]:
+        """Get a 3D configuration by its unique scene name."""
+        return await db.scalar(
+            select(ThreeConfig).where(ThreeConfig.scene_name == scene_name).limit(1)
+        )
+
+    async def get_by_user(
+        self, db: AsyncSession, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[ThreeConfig]:
+        """Get the 3D configurations owned by one user."""
+        statement = select(ThreeConfig).where(ThreeConfig.user_id == user_id)
+        return await self.all(db, self.keyset.paginate(statement, skip=skip, limit=limit))
+
+    async def get_by_type(
+        self, db: AsyncSession, *, scene_type: str, skip: int = 0, limit: int = 100
+    ) -> List[ThreeConfig]:
+        """Get 3D configurations of one scene type."""
+        return await self.all(
+            db,
+            select(ThreeConfig)
+            .where(ThreeConfig.scene_type == scene_type)
+            .offset(skip)
+            .limit(limit),
+        )
+
+    def scene_missing(self, scene_name: str) -> bool:
+        """True when the scene was recently looked up and not found."""
+        return self.missing_scenes.is_missing(scene_name)
+
+    async def get_by_scene_cached(
+        self, db: AsyncSession, *, scene_name: str
+    ) -> Optional[ThreeConfig]:
+        """get_by_scene that remembers unknown scene names for NEGATIVE_CACHE_TTL seconds."""
+        if self.scene_missing(scene_name):
+            return None
+        token = self.missing_scenes.token()
+        config = await self.get_by_scene(db, scene_name=scene_name)
+        if config is None:
+            self.missing_scenes.mark_missing(scene_name, token)
+        return config
+
+    async def scene_freshness(
+        self, db: AsyncSession, *, scene_name: str
+    ) -> Tuple[Optional[datetime], int]:
+        """
+        freshness for one scene name, recording the name as missing when
+        nothing matches.
+
+        The by-scene endpoint needs this query for its validator anyway, so
+        an unknown scene is negatively cached after one round trip instead
+        of a second lookup through get_by_scene_cached.
+        """
+        token = self.missing_scenes.token()
+        last_modified, count = await self.freshness(db, scene_name=scene_name)
+        if count == 0:
+            self.missing_scenes.mark_missing(scene_name, token)
+        return last_modified, count
+
+    async def create_with_user(
+        self, db: AsyncSession, *, obj_in: ThreeConfigCreate, user_id: int
+    ) -> ThreeConfig:
+        """Create new 3D configuration for a specific user."""
+        return await self.create(db, obj_in=obj_in, user_id=user_id)
+
+
+three_config = CRUDThreeConfig(ThreeConfig)
+subscribe(three_config.invalidate_scenes)
+async_three_config = AsyncCRUDThreeConfig(ThreeConfig, three_config.missing_scenes)
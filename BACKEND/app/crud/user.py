@@ -15,16 +15,15 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
 
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
         """Create new user with hashed password."""
-        db_obj = User(
-            email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
-            full_name=obj_in.full_name,
-            is_active=obj_in.is_active,
+        return self._insert(
+            db,
+            {
+                "email": obj_in.email,
+                "hashed_password": get_password_hash(obj_in.password),
+                "full_name": obj_in.full_name,
+                "is_active": obj_in.is_active,
+            },
         )
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
 
     def update(
         self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
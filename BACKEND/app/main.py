@@ -1,19 +1,31 @@
 """
 FastAPI main application for 3D Portfolio Backend.
 """
+import logging
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from app.core.config import settings
-from app.core.database import engine, Base, SessionLocal
+from app.core.cache import CachePolicy, response_cache
+from app.core.database import SessionLocal
+from app.core.schema import SchemaVersionError, check_schema_version
+from app.core.serialization import FastJSONResponse
+from app.core.warmup import start_warmup
 from app.core.security import get_password_hash
 from app.models.user import User
 from app.models.site_content import SiteContent
-from app.api.v1.router import api_router
+from app.api.v1.router import api_router, cache_policies
 from app.middleware.error_handler import add_exception_handlers
-from sqlalchemy import text, inspect
+from app.middleware.coalesce import RequestCoalescingMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.response_cache import ResponseCacheMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
+from sqlalchemy import text
 import os
 
+logger = logging.getLogger(__name__)
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
@@ -22,8 +34,30 @@ app = FastAPI(
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/api/openapi.json" if settings.DEBUG else None,
+    default_response_class=FastJSONResponse,
 )
 
+# Compression is innermost: the cache and coalescing layers key on the negotiated
+# encoding, so cached hits replay already-compressed bytes.
+if settings.COMPRESSION:
+    app.add_middleware(CompressionMiddleware)
+
+# Single-flight coalescing sits inside the response cache, so it only sees misses
+if settings.REQUEST_COALESCING:
+    app.add_middleware(RequestCoalescingMiddleware)
+
+# Response cache for public GET routes (added before CORS so CORS wraps cached hits too)
+if response_cache is not None:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        backend=response_cache,
+        policies=cache_policies,
+        default_policy=CachePolicy(
+            max_age=settings.RESPONSE_CACHE_TTL,
+            stale_window=settings.RESPONSE_CACHE_STALE_WINDOW,
+        ),
+    )
+
 # CORS Configuration
 app.add_middleware(
     CORSMiddleware,
@@ -33,6 +67,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Server-Timing is outermost so cached and coalesced responses get this request's numbers
+if settings.SERVER_TIMING:
+    app.add_middleware(ServerTimingMiddleware)
+
 # Add custom exception handlers
 add_exception_handlers(app)
 
@@ -50,10 +88,16 @@ app.mount("/uploads", StaticFiles(directory=upload_dir), name="uploads")
 @app.on_event("startup")
 async def startup_event():
     """Startup event handler."""
-    # Ensure any new tables are created (safe no-op if already present).
-    Base.metadata.create_all(bind=engine)
-    ensure_site_content_columns()
-    ensure_experience_columns()
+    started = time.perf_counter()
+    # Migrations run once per deploy (`alembic upgrade head`); workers only compare versions.
+    try:
+        schema_version = check_schema_version()
+    except SchemaVersionError as exc:
+        if settings.SCHEMA_CHECK_STRICT:
+            raise
+        logger.warning("%s", exc)
+        schema_version = "mismatch"
+    schema_checked = time.perf_counter()
 
     # Seed the first admin user when credentials are provided via env vars.
     email = settings.FIRST_SUPERUSER_EMAIL
@@ -107,9 +151,19 @@ async def startup_event():
                 db.commit()
         finally:
             db.close()
+
+    # Fill caches and the connection pool in the background; /ready reports progress.
+    if settings.WARMUP_ENABLED:
+        start_warmup(app)
+    else:
+        app.state.ready = True
     print(f">> Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f">> Environment: {settings.ENVIRONMENT}")
-    print(f">> Database: Connected")
+    print(f">> Database: Connected (schema {schema_version})")
+    print(
+        f">> Startup took {(time.perf_counter() - started) * 1000:.1f} ms"
+        f" (schema check {(schema_checked - started) * 1000:.1f} ms)"
+    )
 
 
 @app.on_event("shutdown")
@@ -145,6 +199,16 @@ async def health_check():
     }
 
 
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: 503 until the startup warm-up has finished or run out of time."""
+    ready = getattr(app.state, "ready", False)
+    return FastJSONResponse(
+        {"ready": ready, "warmup": getattr(app.state, "warmup", None)},
+        status_code=200 if ready else 503,
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -154,62 +218,3 @@ if __name__ == "__main__":
         reload=settings.DEBUG
     )
 
-
-def ensure_site_content_columns():
-    """
-    Lightweight migration helper for new SiteContent fields.
-    Adds columns if they are missing (dialect-safe for SQLite/Postgres).
-    """
-    new_columns = {
-        "brand_initials": "TEXT",
-        "brand_title": "TEXT",
-        "brand_tagline": "TEXT",
-        "nav_cta_text": "TEXT",
-        "nav_cta_link": "TEXT",
-        "contact_title": "TEXT",
-        "contact_subtitle": "TEXT",
-        "contact_email": "TEXT",
-        "contact_location": "TEXT",
-        "contact_availability": "TEXT",
-        "contact_response_time": "TEXT",
-        "footer_tagline": "TEXT",
-        "footer_email": "TEXT",
-        "footer_location": "TEXT",
-        "footer_availability": "TEXT",
-        "footer_links": "JSON",
-        "footer_disclaimer": "TEXT",
-        "footer_rights": "TEXT",
-        "about_title": "TEXT",
-        "about_body_primary": "TEXT",
-        "about_body_secondary": "TEXT",
-        "about_snapshot_focus": "TEXT",
-        "about_snapshot_stack": "TEXT",
-        "about_snapshot_availability": "TEXT",
-        "profile_slug": "TEXT",
-    }
-
-    with engine.begin() as conn:
-        inspector = inspect(conn)
-        try:
-          columns = inspector.get_columns("site_content")
-          existing = {col["name"] for col in columns}
-        except Exception:
-          # If table doesn't exist yet, nothing to do (create_all will create)
-          return
-        for column, sql_type in new_columns.items():
-            if column not in existing:
-                # SQLite/Postgres compatible types already defined above
-                conn.execute(text(f'ALTER TABLE site_content ADD COLUMN "{column}" {sql_type}'))
-
-
-def ensure_experience_columns():
-    """Add profile_slug to experience table if missing."""
-    with engine.begin() as conn:
-        inspector = inspect(conn)
-        try:
-            columns = inspector.get_columns("experience")
-            existing = {col["name"] for col in columns}
-        except Exception:
-            return
-        if "profile_slug" not in existing:
-            conn.execute(text('ALTER TABLE experience ADD COLUMN "profile_slug" TEXT'))
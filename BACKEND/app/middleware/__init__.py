@@ -1,8 +1,16 @@
 from app.middleware.cors import get_cors_config, configure_cors
 from app.middleware.error_handler import add_exception_handlers
+from app.middleware.response_cache import ResponseCacheMiddleware
+from app.middleware.coalesce import RequestCoalescingMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.server_timing import ServerTimingMiddleware
 
 __all__ = [
     "get_cors_config",
     "configure_cors",
     "add_exception_handlers",
+    "ResponseCacheMiddleware",
+    "RequestCoalescingMiddleware",
+    "CompressionMiddleware",
+    "ServerTimingMiddleware",
 ]
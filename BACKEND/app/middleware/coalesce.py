@@ -0,0 +1,101 @@
+"""
+Single-flight coalescing for identical concurrent public GET requests.
+
+When many clients ask for the same anonymous URL at once (e.g. a freshly
+shared profile link), only the first request runs the handler; the rest
+wait for it and are sent a copy of its response. Coalescing is per
+process and only spans requests that overlap in time; the response cache
+takes over once the first response has been stored.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middleware.compression import encoding_suffix
+from app.middleware.response_cache import request_key
+
+logger = logging.getLogger(__name__)
+
+# Request headers that change the response and so must match to share one.
+VARY_HEADERS = ("if-none-match", "if-modified-since")
+
+# Counters for /internal/cache-stats.
+coalescing_stats: Dict[str, int] = {
+    "leaders": 0,
+    "collapsed": 0,
+    "fallbacks": 0,
+}
+
+SharedResponse = Tuple[Message, bytes]
+
+
+class RequestCoalescingMiddleware:
+    """Let concurrent identical anonymous GETs share one handler run."""
+
+    def __init__(self, app: ASGIApp, prefix: str = "/api/v1/"):
+        self.app = app
+        self.prefix = prefix
+        self._inflight: Dict[str, "asyncio.Future[Optional[SharedResponse]]"] = {}
+
+    def flight_key(self, scope: Scope) -> str:
+        """Method, path, normalized query, encoding and the headers listed in VARY_HEADERS."""
+        headers = Headers(scope=scope)
+        vary = "|".join(headers.get(name, "") for name in VARY_HEADERS)
+        return f"{scope['method']} {request_key(scope)}{encoding_suffix(scope)} {vary}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.prefix)
+            or "authorization" in Headers(scope=scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = self.flight_key(scope)
+        leader = self._inflight.get(key)
+        if leader is not None:
+            coalescing_stats["collapsed"] += 1
+            try:
+                # Shielded so a follower disconnecting cannot cancel the shared result.
+                shared = await asyncio.shield(leader)
+            except Exception:
+                shared = None
+            if shared is not None:
+                await self._replay(shared, send)
+                return
+            # The leader failed or streamed; serve this request on its own.
+            coalescing_stats["fallbacks"] += 1
+            await self.app(scope, receive, send)
+            return
+
+        future: "asyncio.Future[Optional[SharedResponse]]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        coalescing_stats["leaders"] += 1
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        complete = False
+
+        async def capture(message: Message) -> None:
+            nonlocal start, complete
+            if message["type"] == "http.response.start":
+                start = {**message, "headers": list(message.get("headers", []))}
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            del self._inflight[key]
+            if not future.done():
+                future.set_result((start, b"".join(chunks)) if start and complete else None)
+
+    async def _replay(self, shared: SharedResponse, send: Send) -> None:
+        """Send a copy of the leader's response."""
+        start, body = shared
+        await send({**start, "headers": list(start["headers"])})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,148 @@
+"""
+Response compression (brotli or gzip) negotiated from Accept-Encoding.
+
+Only complete, non-streamed bodies of compressible types above
+``COMPRESSION_MIN_SIZE`` are compressed. The response cache sits outside
+this middleware and varies its key by the negotiated encoding, so cached
+hits replay the compressed bytes instead of compressing them again.
+"""
+import gzip
+from typing import Dict, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # gzip only without the optional wheel
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+# Counters for /internal/cache-stats.
+compression_stats: Dict[str, int] = {
+    "compressed": 0,
+    "skipped_small": 0,
+    "bytes_in": 0,
+    "bytes_out": 0,
+    "bytes_saved": 0,
+}
+
+
+def _parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value."""
+    codings = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        codings[coding.strip().lower()] = quality
+    return codings
+
+
+def negotiate_encoding(headers: Headers) -> Optional[str]:
+    """Pick "br" or "gzip" for a request, or None for an uncompressed response."""
+    if not settings.COMPRESSION:
+        return None
+    codings = _parse_accept_encoding(headers.get("accept-encoding", ""))
+    wildcard = codings.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = codings.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a body with "br" or "gzip"."""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """Compress eligible responses with the client's preferred encoding."""
+
+    def __init__(self, app: ASGIApp, minimum_size: Optional[int] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def compress_send(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough or start is None:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if not self._eligible(start["status"], headers):
+                passthrough = True
+            elif message.get("more_body", False):
+                # Streamed bodies are left alone; they are never cached either.
+                headers.add_vary_header("Accept-Encoding")
+                passthrough = True
+            else:
+                headers.add_vary_header("Accept-Encoding")
+                if encoding and len(body) >= self.minimum_size:
+                    body = self._compress(body, encoding, headers)
+                    message = {**message, "body": body}
+                elif encoding:
+                    compression_stats["skipped_small"] += 1
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, compress_send)
+
+    def _eligible(self, status: int, headers: MutableHeaders) -> bool:
+        content_type = headers.get("content-type", "")
+        return (
+            status == 200
+            and "content-encoding" not in headers
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    def _compress(self, body: bytes, encoding: str, headers: MutableHeaders) -> bytes:
+        """Compress a body and rewrite the representation headers to match."""
+        compressed = compress(body, encoding)
+        headers["content-encoding"] = encoding
+        headers["content-length"] = str(len(compressed))
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # Same content, different bytes: only weakly equal to the identity body.
+            headers["etag"] = f"W/{etag}"
+        compression_stats["compressed"] += 1
+        compression_stats["bytes_in"] += len(body)
+        compression_stats["bytes_out"] += len(compressed)
+        compression_stats["bytes_saved"] += len(body) - len(compressed)
+        return compressed
+
+
+def encoding_suffix(scope: Scope) -> str:
+    """Cache-key suffix for the encoding a request will be served with."""
+    encoding = negotiate_encoding(Headers(scope=scope))
+    return f"|{encoding}" if encoding else ""
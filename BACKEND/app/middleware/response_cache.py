@@ -0,0 +1,287 @@
+"""
+Response cache middleware for public GET routes.
+
+Handlers opt in by calling ``tag_response`` (app.core.cache); untagged
+responses pass through untouched. Cached entries are purged by tag when a
+committed write touches the rows they were built from.
+
+Entries past their route group's ``max_age`` but inside its
+``stale_window`` are still served (``X-Cache: STALE``) while a single
+background request rebuilds them, so expiry never sends a burst of
+requests to the database. Purged entries are deleted outright and are
+never served stale.
+"""
+import json
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from anyio import to_thread
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.cache import CacheBackend, CachePolicy, begin_response_tags, end_response_tags
+from app.core.tasks import spawn
+from app.middleware.compression import encoding_suffix
+from app.utils.conditional import headers_not_modified, parse_http_date
+
+logger = logging.getLogger(__name__)
+
+# Headers replayed from a cached entry; per-request headers are left to outer middleware.
+STORED_HEADERS = {
+    b"content-type",
+    b"content-encoding",
+    b"vary",
+    b"etag",
+    b"last-modified",
+    b"cache-control",
+}
+
+# Request headers dropped from background refreshes so they always get a full 200.
+CONDITIONAL_HEADERS = {b"if-none-match", b"if-modified-since"}
+
+# Upper bound on one background refresh before another worker may retry it.
+REFRESH_LOCK_TTL = 30.0
+
+# Counters for /internal/cache-stats.
+revalidation_stats: Dict[str, int] = {
+    "stale_served": 0,
+    "refreshes": 0,
+    "refresh_errors": 0,
+}
+
+
+class CachedResponse:
+    """A response captured for the cache."""
+
+    def __init__(
+        self,
+        status: int,
+        headers: List[Tuple[bytes, bytes]],
+        body: bytes,
+        stored_at: Optional[float] = None,
+    ):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+    def age(self) -> float:
+        """Seconds since the entry was stored (wall clock, so shared backends agree)."""
+        if self.stored_at is None:
+            return 0.0
+        return max(0.0, time.time() - self.stored_at)
+
+
+def request_key(scope: Scope) -> str:
+    """Path plus sorted query string, so parameter order does not matter."""
+    query = scope.get("query_string", b"").decode("latin-1")
+    params = "&".join(sorted(part for part in query.split("&") if part))
+    return f"{scope['path']}?{params}"
+
+
+def pack_entry(status: int, headers: List[Tuple[bytes, bytes]], body: bytes) -> bytes:
+    """Serialize a response as a JSON header line followed by the raw body."""
+    meta = {
+        "status": status,
+        "headers": [[name.decode("latin-1"), value.decode("latin-1")] for name, value in headers],
+        "stored_at": time.time(),
+    }
+    return json.dumps(meta).encode("utf-8") + b"\n" + body
+
+
+def unpack_entry(entry: bytes) -> CachedResponse:
+    """Inverse of pack_entry."""
+    meta, _, body = entry.partition(b"\n")
+    data = json.loads(meta)
+    headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in data["headers"]]
+    return CachedResponse(data["status"], headers, body, data.get("stored_at"))
+
+
+class ResponseCacheMiddleware:
+    """Serve tagged public GET responses from a CacheBackend."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        backend: CacheBackend,
+        prefix: str = "/api/v1/",
+        policies: Optional[Mapping[str, CachePolicy]] = None,
+        default_policy: Optional[CachePolicy] = None,
+    ):
+        """
+        Args:
+            app: Wrapped ASGI application
+            backend: Where entries are stored
+            prefix: Only paths under this prefix are considered
+            policies: Freshness per route group, keyed by path below ``prefix``
+                (e.g. "/projects"); the longest matching key wins
+            default_policy: Used for paths no group matches
+        """
+        self.app = app
+        self.backend = backend
+        self.prefix = prefix
+        self.policies = sorted((policies or {}).items(), key=lambda item: len(item[0]), reverse=True)
+        self.default_policy = default_policy or CachePolicy(max_age=300)
+
+    async def _call(self, method: str, *args: Any) -> Any:
+        """Invoke a backend method, off the event loop for network backends.
+
+        Backend failures degrade to a cache miss rather than a failed request.
+        """
+        func = getattr(self.backend, method)
+        try:
+            if self.backend.blocking:
+                return await to_thread.run_sync(func, *args)
+            return func(*args)
+        except Exception:
+            logger.exception("Response cache %s failed", method)
+            return None
+
+    def cache_key(self, scope: Scope) -> str:
+        """Request key plus the negotiated encoding; each variant is stored precompressed."""
+        return request_key(scope) + encoding_suffix(scope)
+
+    def policy_for(self, path: str) -> CachePolicy:
+        """Freshness policy of the route group a path belongs to."""
+        route = path[len(self.prefix) - 1:]
+        for group, policy in self.policies:
+            if route == group or route.startswith(group.rstrip("/") + "/"):
+                return policy
+        return self.default_policy
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if "authorization" in request_headers:
+            # Authenticated views may differ per user; never share them.
+            await self.app(scope, receive, send)
+            return
+
+        key = self.cache_key(scope)
+        policy = self.policy_for(scope["path"])
+        entry = await self._call("get", key)
+        if entry is not None:
+            cached = unpack_entry(entry)
+            stale = cached.age() > policy.max_age
+            if stale:
+                revalidation_stats["stale_served"] += 1
+                await self._schedule_refresh(scope, key, policy)
+            await self._replay(cached, scope["method"], request_headers, send, stale)
+            return
+
+        async def tag_miss(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", []).append((b"x-cache", b"MISS"))
+            await send(message)
+
+        await self._fill(scope, receive, tag_miss, key, policy)
+
+    async def _fill(
+        self, scope: Scope, receive: Receive, send: Send, key: str, policy: CachePolicy
+    ) -> None:
+        """Run the app, forward its response to send, and store it if cacheable."""
+        epoch = await self._call("epoch")
+        status: Optional[int] = None
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+        complete = False
+
+        async def capture(message: Message) -> None:
+            nonlocal status, headers, complete
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                complete = not message.get("more_body", False)
+            await send(message)
+
+        token = begin_response_tags()
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            tags = end_response_tags(token)
+
+        if not (tags and complete and status == 200 and scope["method"] == "GET"):
+            return
+        if epoch is None or epoch != await self._call("epoch"):
+            # A write was purged while this response was built; it may be stale.
+            return
+        stored = [(name, value) for name, value in headers if name.lower() in STORED_HEADERS]
+        entry = pack_entry(status, stored, b"".join(chunks))
+        await self._call("set", key, entry, tags, policy.lifetime)
+
+    async def _schedule_refresh(self, scope: Scope, key: str, policy: CachePolicy) -> None:
+        """Start one background rebuild of a stale entry unless one is already running."""
+        if not await self._call("acquire_refresh", key, REFRESH_LOCK_TTL):
+            return
+        refresh_scope = dict(scope)
+        refresh_scope["method"] = "GET"
+        refresh_scope["headers"] = [
+            (name, value) for name, value in scope["headers"] if name.lower() not in CONDITIONAL_HEADERS
+        ]
+        if "state" in scope:
+            refresh_scope["state"] = {}
+        spawn(self._refresh(refresh_scope, key, policy))
+
+    async def _refresh(self, scope: Scope, key: str, policy: CachePolicy) -> None:
+        """Rebuild a stale entry with no client attached."""
+        requested = False
+
+        async def receive() -> Message:
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            return {"type": "http.disconnect"}
+
+        async def discard(message: Message) -> None:
+            return None
+
+        revalidation_stats["refreshes"] += 1
+        try:
+            await self._fill(scope, receive, discard, key, policy)
+        except Exception:
+            revalidation_stats["refresh_errors"] += 1
+            logger.exception("Background refresh of %s failed", key)
+        finally:
+            await self._call("release_refresh", key)
+
+    async def _replay(
+        self,
+        cached: CachedResponse,
+        method: str,
+        request_headers: Headers,
+        send: Send,
+        stale: bool = False,
+    ) -> None:
+        """Send a cached response, or a 304 if the client already has it."""
+        status, headers, body = cached.status, cached.headers, cached.body
+        stored = dict(headers)
+        etag = stored.get(b"etag")
+        last_modified = stored.get(b"last-modified")
+        if headers_not_modified(
+            request_headers,
+            etag.decode("latin-1") if etag else None,
+            parse_http_date(last_modified.decode("latin-1")) if last_modified else None,
+        ):
+            status = 304
+            headers = [
+                (name, value) for name, value in headers
+                if name not in (b"content-type", b"content-encoding")
+            ]
+            body = b""
+        else:
+            headers = headers + [(b"content-length", str(len(body)).encode("latin-1"))]
+            if method == "HEAD":
+                body = b""
+        headers.append((b"age", str(int(cached.age())).encode("latin-1")))
+        headers.append((b"x-cache", b"STALE" if stale else b"HIT"))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,57 @@
+"""
+Server-Timing header and a timing log line for every HTTP request.
+
+The header lists SQL time with the statement count, auth time,
+serialization time and the whole request (see app.core.timing), so a
+route that runs more queries than it should shows up in the browser's
+network panel. This middleware is outermost: the response cache and
+coalescing layers store and share response headers, and each request
+needs its own numbers.
+"""
+import logging
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.timing import finish_request, start_request
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """Time each request's SQL, auth and serialization; report in Server-Timing and the log."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings, token = start_request()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("Server-Timing", timings.header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            finish_request(token)
+            # The router stores the matched endpoint in the scope.
+            route = getattr(scope.get("endpoint"), "__name__", None)
+            values = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route,
+                "status": status_code,
+                **timings.as_dict(),
+            }
+            logger.info(
+                "request %s",
+                " ".join(f"{key}={value}" for key, value in values.items()),
+                extra={"timing": values},
+            )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -7,6 +7,10 @@ class Contact(Base):
     """Contact model for contact form submissions (standalone, no user FK)."""
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        # Admin inbox, newest first
+        Index("ix_contacts_created_at", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
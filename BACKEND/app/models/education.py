@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,10 @@ class Education(Base):
     """Education model for academic background and certifications."""
 
     __tablename__ = "education"
+    __table_args__ = (
+        # Per-owner lists in display order
+        Index("ix_education_user_display_order", "user_id", "display_order", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -40,7 +44,7 @@ class Education(Base):
     credential_url = Column(String(500), nullable=True)  # URL to verify credential
 
     # Display
-    display_order = Column(Integer, default=0)
+    display_order = Column(Integer, default=0, nullable=False, server_default=text("0"))
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
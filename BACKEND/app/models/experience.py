@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Boolean, Index, false
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,10 @@ class Experience(Base):
     """Experience model for work experience and employment history."""
 
     __tablename__ = "experience"
+    __table_args__ = (
+        # Per-owner timeline: current roles first, newest first
+        Index("ix_experience_user_current_start", "user_id", "is_current", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -27,7 +31,7 @@ class Experience(Base):
     # Date Range
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=True)  # NULL means current
-    is_current = Column(Boolean, default=False)
+    is_current = Column(Boolean, default=False, nullable=False, server_default=false())
 
     # Description
     description = Column(Text, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Boolean, Column, Integer, String, Text, DateTime, ForeignKey, Index, JSON, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,10 @@ class Project(Base):
     """Project model for portfolio projects."""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # Per-owner lists in display order (crud.project.DISPLAY_ORDER)
+        Index("ix_projects_user_display_order", "user_id", "display_order", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -31,7 +35,7 @@ class Project(Base):
 
     # Display Settings
     featured = Column(Boolean, default=False)
-    display_order = Column(Integer, default=0)
+    display_order = Column(Integer, default=0, nullable=False, server_default=text("0"))
     status = Column(String(50), default="completed")  # completed, in-progress, archived
 
     # 3D Related
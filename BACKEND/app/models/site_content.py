@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, JSON
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, JSON, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,18 @@ class SiteContent(Base):
     """Editable homepage content managed from admin dashboard."""
 
     __tablename__ = "site_content"
+    __table_args__ = (
+        # Active content lookup, newest edit first
+        Index("ix_site_content_user_active_updated", "user_id", "is_active", "updated_at"),
+        # At most one active row per user (alembic 0003)
+        Index(
+            "ux_site_content_user_active",
+            "user_id",
+            unique=True,
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
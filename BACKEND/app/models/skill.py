@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Float, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -8,6 +8,10 @@ class Skill(Base):
     """Skill model for user skills and proficiency levels."""
 
     __tablename__ = "skills"
+    __table_args__ = (
+        # Per-owner lists, optionally narrowed to one category
+        Index("ix_skills_user_category_order", "user_id", "category", "display_order"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -21,7 +25,7 @@ class Skill(Base):
     # Display
     icon_url = Column(String(500), nullable=True)  # Skill icon/logo URL
     color = Column(String(50), nullable=True)  # Hex color for visualization
-    display_order = Column(Integer, default=0)
+    display_order = Column(Integer, default=0, nullable=False, server_default=text("0"))
 
     # 3D Visualization (Optional)
     three_config = Column(String(500), nullable=True)  # JSON string for 3D representation
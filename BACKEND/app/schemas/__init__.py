@@ -1,21 +1,25 @@
 from app.schemas.user import User, UserCreate, UserUpdate, UserLogin, UserInDB
 from app.schemas.token import Token, TokenPayload, RefreshToken
-from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectList
-from app.schemas.skill import Skill, SkillCreate, SkillUpdate, SkillList
-from app.schemas.experience import Experience, ExperienceCreate, ExperienceUpdate, ExperienceList
-from app.schemas.education import Education, EducationCreate, EducationUpdate, EducationList
+from app.schemas.project import Project, ProjectCreate, ProjectUpdate, ProjectList, ProjectBulkResult
+from app.schemas.skill import Skill, SkillCreate, SkillUpdate, SkillList, SkillBulkResult
+from app.schemas.experience import Experience, ExperienceCreate, ExperienceUpdate, ExperienceList, ExperienceBulkResult
+from app.schemas.education import Education, EducationCreate, EducationUpdate, EducationList, EducationBulkResult
 from app.schemas.three_config import ThreeConfig, ThreeConfigCreate, ThreeConfigUpdate, ThreeConfigList
 from app.schemas.contact import Contact, ContactCreate, ContactUpdate, ContactList
 from app.schemas.site_content import SiteContent, SiteContentCreate, SiteContentUpdate, SiteContentList
+from app.schemas.portfolio import PortfolioBundle
+from app.schemas.bulk import BulkRequest, BulkItemError, ReorderRequest
 
 __all__ = [
     "User", "UserCreate", "UserUpdate", "UserLogin", "UserInDB",
     "Token", "TokenPayload", "RefreshToken",
-    "Project", "ProjectCreate", "ProjectUpdate", "ProjectList",
-    "Skill", "SkillCreate", "SkillUpdate", "SkillList",
-    "Experience", "ExperienceCreate", "ExperienceUpdate", "ExperienceList",
-    "Education", "EducationCreate", "EducationUpdate", "EducationList",
+    "Project", "ProjectCreate", "ProjectUpdate", "ProjectList", "ProjectBulkResult",
+    "Skill", "SkillCreate", "SkillUpdate", "SkillList", "SkillBulkResult",
+    "Experience", "ExperienceCreate", "ExperienceUpdate", "ExperienceList", "ExperienceBulkResult",
+    "Education", "EducationCreate", "EducationUpdate", "EducationList", "EducationBulkResult",
     "ThreeConfig", "ThreeConfigCreate", "ThreeConfigUpdate", "ThreeConfigList",
     "Contact", "ContactCreate", "ContactUpdate", "ContactList",
     "SiteContent", "SiteContentCreate", "SiteContentUpdate", "SiteContentList",
+    "PortfolioBundle",
+    "BulkRequest", "BulkItemError", "ReorderRequest",
 ]
@@ -0,0 +1,40 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Dict, List, Optional
+
+# Largest number of items accepted per operation in one bulk request.
+MAX_BULK_ITEMS = 500
+
+
+class BulkRequest(BaseModel):
+    """
+    Items to create, update and delete in one transaction.
+
+    Items are validated one by one against the entity's create and update
+    schemas, so an invalid item is reported in the response's errors
+    instead of rejecting the whole request. Update items carry the ``id``
+    of the row to change plus the fields to set.
+    """
+    create: List[Dict[str, Any]] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    update: List[Dict[str, Any]] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+    delete: List[int] = Field(default_factory=list, max_length=MAX_BULK_ITEMS)
+
+
+class BulkItemError(BaseModel):
+    """Why one item of a bulk request was not applied."""
+    operation: str  # "create", "update" or "delete"
+    index: int  # position in that operation's list
+    id: Optional[int] = None
+    detail: Any = None  # message, or the item's validation errors
+
+
+class ReorderRequest(BaseModel):
+    """Ids in their new display order; each gets its position as display_order."""
+    ids: List[int] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+    @field_validator("ids")
+    @classmethod
+    def ids_unique(cls, ids: List[int]) -> List[int]:
+        """An id may appear only once."""
+        if len(set(ids)) != len(ids):
+            raise ValueError("ids must not repeat")
+        return ids
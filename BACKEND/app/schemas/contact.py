@@ -46,5 +46,6 @@ class Contact(ContactInDBBase):
 class ContactList(BaseModel):
     """Schema for list of contacts response."""
     contacts: List[Contact]
-    total: int
-    unread_count: int
+    total: Optional[int] = None  # first page only; None on cursor pages
+    unread_count: Optional[int] = None  # first page only; None on cursor pages
+    next_cursor: Optional[str] = None
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.bulk import BulkItemError
 
 
 class EducationBase(BaseModel):
@@ -72,3 +73,11 @@ class EducationList(BaseModel):
     """Schema for list of education entries response."""
     educations: List[Education]
     total: int
+
+
+class EducationBulkResult(BaseModel):
+    """Schema for bulk create/update/delete response."""
+    created: List[Education]
+    updated: List[Education]
+    deleted: List[int]
+    errors: List[BulkItemError]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.bulk import BulkItemError
 
 
 class ExperienceBase(BaseModel):
@@ -67,3 +68,11 @@ class ExperienceList(BaseModel):
     """Schema for list of experiences response."""
     experiences: List[Experience]
     total: int
+
+
+class ExperienceBulkResult(BaseModel):
+    """Schema for bulk create/update/delete response."""
+    created: List[Experience]
+    updated: List[Experience]
+    deleted: List[int]
+    errors: List[BulkItemError]
@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List
+from app.schemas.site_content import SiteContent
+from app.schemas.project import Project
+from app.schemas.skill import Skill
+from app.schemas.experience import Experience
+from app.schemas.education import Education
+from app.schemas.three_config import ThreeConfig
+
+
+class PortfolioBundle(BaseModel):
+    """Schema for everything the public site renders for one profile slug."""
+    slug: str
+    site_content: SiteContent
+    projects: List[Project]
+    skills: List[Skill]
+    experiences: List[Experience]
+    educations: List[Education]
+    three_configs: List[ThreeConfig]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, HttpUrl, Field
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.bulk import BulkItemError
 
 
 class ProjectBase(BaseModel):
@@ -70,3 +71,12 @@ class ProjectList(BaseModel):
     """Schema for list of projects response."""
     projects: List[Project]
     total: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
+
+
+class ProjectBulkResult(BaseModel):
+    """Schema for bulk create/update/delete response."""
+    created: List[Project]
+    updated: List[Project]
+    deleted: List[int]
+    errors: List[BulkItemError]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.bulk import BulkItemError
 
 
 class SkillBase(BaseModel):
@@ -52,3 +53,12 @@ class SkillList(BaseModel):
     """Schema for list of skills response."""
     skills: List[Skill]
     total: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page
+
+
+class SkillBulkResult(BaseModel):
+    """Schema for bulk create/update/delete response."""
+    created: List[Skill]
+    updated: List[Skill]
+    deleted: List[int]
+    errors: List[BulkItemError]
@@ -19,6 +19,16 @@ from app.utils.email import (
     send_contact_notification,
     send_welcome_email
 )
+from app.utils.conditional import (
+    Validator,
+    as_utc,
+    build_validator,
+    check_conditional,
+    make_etag
+)
+from app.utils.pagination import InvalidCursor, Keyset, KeyPart
+from app.utils.fieldsets import InvalidFields, parse_fields
+from app.utils.bulk import BulkItems, validate_bulk
 
 __all__ = [
     # File handler
@@ -39,4 +49,20 @@ __all__ = [
     "send_email",
     "send_contact_notification",
     "send_welcome_email",
+    # Conditional GET
+    "Validator",
+    "as_utc",
+    "build_validator",
+    "check_conditional",
+    "make_etag",
+    # Pagination
+    "InvalidCursor",
+    "Keyset",
+    "KeyPart",
+    # Sparse fieldsets
+    "InvalidFields",
+    "parse_fields",
+    # Bulk requests
+    "BulkItems",
+    "validate_bulk",
 ]
@@ -0,0 +1,84 @@
+"""
+Bulk request validation.
+
+Splits a BulkRequest into schema-validated items and per-item errors, so a
+bad item is reported without rejecting the rest of the batch. Items that
+pass go to the CRUD ``bulk`` method, which applies them in one transaction.
+"""
+from typing import Any, Dict, List, NamedTuple, Set, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from app.schemas.bulk import BulkItemError, BulkRequest
+
+
+class BulkItems(NamedTuple):
+    """Validated items as (index, ...) tuples, plus the errors of those that failed."""
+
+    creates: List[Tuple[int, BaseModel]]
+    updates: List[Tuple[int, int, BaseModel]]
+    deletes: List[Tuple[int, int]]
+    errors: List[BulkItemError]
+
+
+def _validation_detail(exc: ValidationError) -> List[Dict[str, Any]]:
+    return [
+        {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+        for error in exc.errors()
+    ]
+
+
+def validate_bulk(
+    bulk_in: BulkRequest, create_schema: Type[BaseModel], update_schema: Type[BaseModel]
+) -> BulkItems:
+    """
+    Validate each item of a bulk request against the entity's schemas.
+
+    Args:
+        bulk_in: Raw request body
+        create_schema: Schema for new items, e.g. SkillCreate
+        update_schema: Schema for changes, e.g. SkillUpdate
+
+    Returns:
+        BulkItems; an id may appear only once across update and delete
+    """
+    items = BulkItems([], [], [], [])
+    for index, item in enumerate(bulk_in.create):
+        try:
+            items.creates.append((index, create_schema.model_validate(item)))
+        except ValidationError as exc:
+            items.errors.append(
+                BulkItemError(operation="create", index=index, detail=_validation_detail(exc))
+            )
+
+    seen: Set[int] = set()
+    for index, item in enumerate(bulk_in.update):
+        item_id = item.get("id")
+        if not isinstance(item_id, int) or isinstance(item_id, bool):
+            items.errors.append(
+                BulkItemError(operation="update", index=index, detail="Missing or invalid id")
+            )
+            continue
+        if item_id in seen:
+            items.errors.append(
+                BulkItemError(operation="update", index=index, id=item_id, detail="Duplicate id")
+            )
+            continue
+        seen.add(item_id)
+        changes = {field: value for field, value in item.items() if field != "id"}
+        try:
+            items.updates.append((index, item_id, update_schema.model_validate(changes)))
+        except ValidationError as exc:
+            items.errors.append(
+                BulkItemError(
+                    operation="update", index=index, id=item_id, detail=_validation_detail(exc)
+                )
+            )
+
+    for index, item_id in enumerate(bulk_in.delete):
+        if item_id in seen:
+            items.errors.append(
+                BulkItemError(operation="delete", index=index, id=item_id, detail="Duplicate id")
+            )
+            continue
+        seen.add(item_id)
+        items.deletes.append((index, item_id))
+    return items
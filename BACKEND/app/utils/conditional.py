@@ -0,0 +1,148 @@
+"""
+Conditional GET helpers (ETag / Last-Modified validators).
+
+Validators are derived from the newest change timestamp and the row count
+of the query behind a response, so a 304 can be answered with one
+aggregate query and without loading or serializing any rows.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Mapping, NamedTuple, Optional
+from fastapi import Request, Response, status
+from app.core.config import settings
+
+# Clients may keep a copy but must revalidate it on every use.
+CACHE_CONTROL = "no-cache"
+
+
+class Validator(NamedTuple):
+    """Strong entity tag plus optional modification time for a response.
+
+    last_modified may be naive (SQLite) or aware; is_not_modified and
+    set_validator_headers normalize it with as_utc, so callers need not.
+    """
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    Normalize naive (SQLite) and aware (Postgres) timestamps to UTC.
+
+    Full precision is kept: the ETag hashes it, so two edits in the same
+    second still give different tags. Only the HTTP dates (Last-Modified,
+    If-Modified-Since) are whole seconds.
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def make_etag(*parts: Any) -> str:
+    """Hash arbitrary parts into a quoted strong ETag."""
+    raw = "|".join(str(part) for part in (settings.APP_VERSION, *parts))
+    return '"%s"' % hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def build_validator(
+    request: Request, last_modified: Optional[datetime], count: int, *scope: Any
+) -> Validator:
+    """
+    Build a validator for a query-backed response.
+
+    Args:
+        request: Incoming request; path and query parameters are part of the tag
+        last_modified: Newest updated_at/created_at among the matching rows
+        count: Number of matching rows (catches deletes of older rows)
+        scope: Extra values the response depends on, e.g. the resolved owner id
+
+    Returns:
+        Validator for the response
+    """
+    last_modified = as_utc(last_modified)
+    query = sorted(request.query_params.multi_items())
+    etag = make_etag(
+        request.url.path,
+        query,
+        last_modified.isoformat() if last_modified else None,
+        count,
+        *scope,
+    )
+    return Validator(etag=etag, last_modified=last_modified)
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, per RFC 9110)."""
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def parse_http_date(value: str) -> Optional[datetime]:
+    """An HTTP date header as an aware UTC datetime, or None if it does not parse."""
+    try:
+        return as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def headers_not_modified(
+    headers: Mapping[str, str], etag: Optional[str], last_modified: Optional[datetime]
+) -> bool:
+    """
+    True when request headers show the client's copy is still current.
+
+    is_not_modified for a handler's validator; the response cache applies
+    the same rules to the ETag and Last-Modified of a stored response.
+    """
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-Modified-Since is ignored whenever If-None-Match is present.
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = headers.get("if-modified-since")
+    last_modified = as_utc(last_modified)
+    if if_modified_since and last_modified:
+        since = parse_http_date(if_modified_since)
+        # HTTP dates have whole seconds; compare at the precision the client saw.
+        return since is not None and last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def is_not_modified(request: Request, validator: Validator) -> bool:
+    """True when the client's cached copy is still current."""
+    return headers_not_modified(request.headers, validator.etag, validator.last_modified)
+
+
+def set_validator_headers(response: Response, validator: Validator) -> None:
+    """Stamp ETag, Last-Modified and Cache-Control on a response."""
+    response.headers["ETag"] = validator.etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    last_modified = as_utc(validator.last_modified)
+    if last_modified:
+        response.headers["Last-Modified"] = format_datetime(
+            last_modified.replace(microsecond=0), usegmt=True
+        )
+
+
+def check_conditional(
+    request: Request, response: Response, validator: Validator
+) -> Optional[Response]:
+    """
+    Answer a conditional GET.
+
+    Returns a bodyless 304 response when the client copy is current;
+    otherwise stamps the validator on the outgoing response and returns None
+    so the handler goes on to build the full body.
+    """
+    if is_not_modified(request, validator):
+        not_modified = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        set_validator_headers(not_modified, validator)
+        return not_modified
+    set_validator_headers(response, validator)
+    return None
@@ -0,0 +1,43 @@
+"""
+Sparse fieldsets for list endpoints.
+
+``?fields=id,title,thumbnail_url`` asks for a subset of each item's fields.
+The CRUD ``page`` methods then load only those columns with ``load_only``,
+plus the primary key and the sort key that the next cursor is built from.
+``encode_list`` writes only the requested fields. Without ``fields`` the
+full items are returned as before.
+"""
+from typing import Optional, Tuple, Type
+from pydantic import BaseModel
+
+
+class InvalidFields(ValueError):
+    """A fields parameter naming fields the item schema does not have (answered with 400)."""
+
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Validate a comma-separated ``fields`` parameter against an item schema.
+
+    Args:
+        fields: Raw query parameter, e.g. "id,title,category"
+        schema: Item schema of the list, e.g. Project
+
+    Returns:
+        Requested field names in schema order, or None for all fields
+
+    Raises:
+        InvalidFields: If a name is not a field of the schema
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    if not requested:
+        return None
+    unknown = requested.difference(schema.model_fields)
+    if unknown:
+        raise InvalidFields(
+            f"Unknown fields: {', '.join(sorted(unknown))}; "
+            f"allowed: {', '.join(schema.model_fields)}"
+        )
+    return tuple(name for name in schema.model_fields if name in requested)
@@ -0,0 +1,201 @@
+"""
+Keyset (cursor) pagination.
+
+A ``Keyset`` describes a list's sort order as a sequence of columns ending in
+a unique tiebreaker (the primary key). Pages after the first are fetched
+with ``WHERE (sort key) > (last row's sort key)`` instead of ``OFFSET``, so
+deep pages cost the same as the first. Cursors are opaque URL-safe tokens
+holding the last row's sort key values.
+
+Offset pagination keeps working: without a cursor, ``paginate`` applies
+``skip``/``limit`` in the same order, so a client can read the first page
+in offset mode and follow ``next_cursor`` from there.
+
+CRUD ``page`` methods return a ``Page``: the rows, the total number of
+matches and the cursor for the next page.
+"""
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, NamedTuple, Optional, Sequence
+from sqlalchemy import DateTime, and_, func, or_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+
+class InvalidCursor(ValueError):
+    """A cursor that was not issued for this list (answered with 400)."""
+
+
+class Page(NamedTuple):
+    """One page of a list with its total and the cursor of the following page."""
+
+    items: List[Any]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class KeyPart(NamedTuple):
+    """One sort column: attribute name, direction and a stand-in for NULLs."""
+
+    attr: str
+    descending: bool = False
+    default: Any = None
+
+
+class comparable_datetime(FunctionElement):
+    """
+    A DateTime column as compared with a cursor value.
+
+    Plain column everywhere except SQLite, which stores datetimes as text:
+    ``CURRENT_TIMESTAMP`` server defaults write ``2026-10-17 00:37:06``
+    while bound Python datetimes are ``2026-10-17 00:37:06.000000``, and the
+    shorter string sorts first although it is the same instant. There the
+    stored value is padded to the bound format before comparing.
+    """
+
+    name = "comparable_datetime"
+    inherit_cache = True
+
+    def __init__(self, column: Any):
+        super().__init__(column)
+        self.type = column.type
+
+
+@compiles(comparable_datetime)
+def _compile_comparable_datetime(element, compiler, **kw):
+    return compiler.process(element.clauses, **kw)
+
+
+@compiles(comparable_datetime, "sqlite")
+def _compile_comparable_datetime_sqlite(element, compiler, **kw):
+    column = compiler.process(element.clauses, **kw)
+    return f"substr({column} || '.000000', 1, 26)"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def _check_value(value: Any, column_type: Any) -> Any:
+    """A decoded cursor value if it fits the column type, else InvalidCursor."""
+    if value is None:
+        return value
+    try:
+        expected = column_type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if expected is bool:
+        valid = isinstance(value, bool)
+    elif expected is int:
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    elif expected in (float, Decimal):
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        valid = isinstance(value, expected)
+    if not valid:
+        raise InvalidCursor("Invalid pagination cursor")
+    return value
+
+
+class Keyset:
+    """Sort order of a list plus the predicates to resume it after a row."""
+
+    def __init__(self, model: Any, *parts: KeyPart):
+        self.model = model
+        self.parts = parts
+
+    def bind(self, entity: Any) -> "Keyset":
+        """The same keyset over an alias of the model (e.g. a subquery)."""
+        return Keyset(entity, *self.parts)
+
+    def _expression(self, part: KeyPart):
+        column = getattr(self.model, part.attr)
+        return column if part.default is None else func.coalesce(column, part.default)
+
+    def _compared(self, part: KeyPart):
+        """The part's expression for comparisons with cursor values."""
+        expression = self._expression(part)
+        if isinstance(getattr(expression, "type", None), DateTime):
+            return comparable_datetime(expression)
+        return expression
+
+    def order_by(self) -> List[Any]:
+        """ORDER BY clauses for this keyset."""
+        clauses = []
+        for part in self.parts:
+            expression = self._expression(part)
+            clauses.append(expression.desc() if part.descending else expression.asc())
+        return clauses
+
+    def encode(self, row: Any) -> str:
+        """Cursor pointing just past ``row``."""
+        values = []
+        for part in self.parts:
+            value = getattr(row, part.attr)
+            values.append(_encode_value(part.default if value is None else value))
+        raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def decode(self, cursor: str) -> List[Any]:
+        """
+        Sort key values stored in a cursor.
+
+        Each value must match its column's type (a datetime for DateTime
+        columns, an int for Integer and so on), so a tampered cursor is
+        answered with 400 instead of failing in the database.
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            if not isinstance(values, list) or len(values) != len(self.parts):
+                raise InvalidCursor("Invalid pagination cursor")
+            values = [_decode_value(value) for value in values]
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise InvalidCursor("Invalid pagination cursor") from exc
+        return [
+            _check_value(value, getattr(self._expression(part), "type", None))
+            for part, value in zip(self.parts, values)
+        ]
+
+    def after(self, cursor: str):
+        """Predicate selecting rows that sort after the cursor.
+
+        Expanded as (a > x) OR (a = x AND b > y) OR ..., which handles
+        mixed ascending/descending columns. Datetime columns are compared
+        through comparable_datetime, so a cursor on a SQLite server-default
+        timestamp does not match its own row again.
+        """
+        values = self.decode(cursor)
+        clauses = []
+        for index, part in enumerate(self.parts):
+            expression = self._compared(part)
+            beyond = expression < values[index] if part.descending else expression > values[index]
+            equal = [
+                self._compared(previous) == values[position]
+                for position, previous in enumerate(self.parts[:index])
+            ]
+            clauses.append(and_(*equal, beyond) if equal else beyond)
+        return or_(*clauses)
+
+    def paginate(self, query: Any, *, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+        """Order a Query or Select and apply either the cursor or skip/limit."""
+        query = query.order_by(*self.order_by())
+        if cursor:
+            return query.filter(self.after(cursor)).limit(limit)
+        return query.offset(skip).limit(limit)
+
+    def next_cursor(self, rows: Sequence[Any], limit: int) -> Optional[str]:
+        """Cursor for the following page, or None when this page was the last."""
+        if rows and len(rows) >= limit:
+            return self.encode(rows[-1])
+        return None
@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the backend.
+
+Run from the BACKEND directory, e.g. ``python -m benchmarks.site_content``.
+"""
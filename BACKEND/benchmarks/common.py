@@ -0,0 +1,147 @@
+"""
+Shared setup and timing helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway SQLite database by default. Set
+BENCH_DATABASE_URL to measure against Postgres instead. This module must be
+imported before anything from ``app`` so the settings pick up the database.
+"""
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+_bench_dir = tempfile.mkdtemp(prefix="portfolio-bench-")
+os.environ["DATABASE_URL"] = os.environ.get(
+    "BENCH_DATABASE_URL", f"sqlite:///{os.path.join(_bench_dir, 'bench.db')}"
+)
+os.environ["DEBUG"] = "False"
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_bench_dir, "uploads"))
+
+from sqlalchemy.orm import Session  # noqa: E402
+from app.core.database import Base, engine, SessionLocal  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Project, Skill, Experience, Education, ThreeConfig, Contact, SiteContent
+)
+
+
+def setup_database() -> None:
+    """Create a clean schema."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def seed_profile(
+    db: Session,
+    *,
+    slug: str = "bench",
+    projects: int = 20,
+    skills: int = 20,
+    experiences: int = 5,
+    educations: int = 3,
+) -> User:
+    """Create one user with a fully populated public profile."""
+    user = User(
+        email=f"{slug}@example.com",
+        hashed_password="not-a-real-hash",
+        full_name=f"{slug.title()} User",
+        is_active=True,
+        is_superuser=True,
+    )
+    db.add(user)
+    db.flush()
+
+    db.add(
+        SiteContent(
+            user_id=user.id,
+            name=f"{slug} home",
+            is_active=True,
+            profile_slug=slug,
+            display_name=user.full_name,
+            hero_title="A designer who judges a book by its cover.",
+            hero_subtitle="I build cinematic, interactive experiences for brands and studios.",
+            about_body_primary="Lorem ipsum dolor sit amet. " * 40,
+            footer_links=[{"label": "GitHub", "url": "https://github.com/example"}],
+        )
+    )
+    now = datetime.utcnow()
+    for i in range(projects):
+        db.add(
+            Project(
+                user_id=user.id,
+                title=f"Project {i}",
+                description="A long project description. " * 30,
+                short_description=f"Short description {i}",
+                technologies=["React", "Three.js", "FastAPI"],
+                tags=["3d", "web"],
+                category="Web" if i % 2 else "3D",
+                featured=i % 5 == 0,
+                display_order=i,
+                three_config={"camera": {"position": [0, 5, 10], "fov": 75}},
+            )
+        )
+    for i in range(skills):
+        db.add(
+            Skill(
+                user_id=user.id,
+                name=f"Skill {i}",
+                category="Frontend" if i % 2 else "Backend",
+                proficiency=50 + i,
+                display_order=i,
+            )
+        )
+    for i in range(experiences):
+        db.add(
+            Experience(
+                user_id=user.id,
+                company=f"Company {i}",
+                position="Engineer",
+                profile_slug=slug,
+                start_date=now - timedelta(days=365 * (i + 1)),
+                is_current=i == 0,
+                description="Built things. " * 20,
+            )
+        )
+    for i in range(educations):
+        db.add(
+            Education(
+                user_id=user.id,
+                institution=f"University {i}",
+                degree="BSc",
+                start_date=now - timedelta(days=365 * (i + 4)),
+                display_order=i,
+            )
+        )
+    db.commit()
+    return user
+
+
+def timed(func: Callable[[], object], *, number: int = 200, repeat: int = 5) -> Dict[str, float]:
+    """Time func, returning best and median microseconds per call."""
+    func()  # warm up
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - start) / number * 1e6)
+    return {"best_us": min(runs), "median_us": statistics.median(runs)}
+
+
+def report(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Print a results table; the first row is the baseline for the speedup column."""
+    print(f"\n{title}")
+    print(f"{'case':<36}{'best (us)':>12}{'median (us)':>14}{'speedup':>10}")
+    baseline = None
+    for name, result in results.items():
+        baseline = baseline or result["median_us"]
+        speedup = baseline / result["median_us"] if result["median_us"] else float("inf")
+        print(f"{name:<36}{result['best_us']:>12.1f}{result['median_us']:>14.1f}{speedup:>9.1f}x")
+
+
+__all__ = [
+    "Base", "engine", "SessionLocal",
+    "User", "Project", "Skill", "Experience", "Education", "ThreeConfig", "Contact", "SiteContent",
+    "setup_database", "seed_profile", "timed", "report",
+]
@@ -0,0 +1,87 @@
+"""
+Cursor walk check: following next_cursor visits every row exactly once.
+
+Rows are bulk-inserted in one transaction, so their server-default
+timestamps are equal. On SQLite those are stored without fractional
+seconds, unlike bound cursor values. Each list is then walked two rows
+at a time, through the owner-counter path and the ``count(*) OVER()``
+path of ``page`` and through a bare keyset. Exits non-zero if a walk
+repeats or skips a row, or does not end.
+
+    python -m benchmarks.cursor_walk
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.cursor_walk
+"""
+import sys
+from typing import Callable, List, Optional, Tuple
+from benchmarks.common import Contact, Project, SessionLocal, engine, seed_profile, setup_database
+from sqlalchemy import insert
+from app.api.v1.endpoints.contact import INBOX_ORDER
+from app.crud import project
+from app.utils.pagination import Page
+
+ROWS = 7
+PAGE = 2
+
+
+def walk(load: Callable[[Optional[str]], Page]) -> Tuple[List[int], bool]:
+    """Ids in the order the pages return them, and whether the walk ended."""
+    seen: List[int] = []
+    cursor = None
+    for _ in range(ROWS + 2):
+        page = load(cursor)
+        seen.extend(row.id for row in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return seen, True
+    return seen, False
+
+
+def main() -> None:
+    setup_database()
+    db = SessionLocal()
+    try:
+        user_id = seed_profile(db, slug="walk", projects=0).id
+        db.execute(
+            insert(Project),
+            [
+                {"user_id": user_id, "title": f"Same time {i}", "category": "walk", "display_order": 0}
+                for i in range(ROWS)
+            ],
+        )
+        db.execute(
+            insert(Contact),
+            [{"name": f"Sender {i}", "email": "walk@example.com", "message": "Hi"} for i in range(ROWS)],
+        )
+        db.commit()
+
+        def inbox(cursor: Optional[str]) -> Page:
+            items = INBOX_ORDER.paginate(db.query(Contact), limit=PAGE, cursor=cursor).all()
+            return Page(items, ROWS, INBOX_ORDER.next_cursor(items, PAGE))
+
+        cases = {
+            "projects by owner": lambda cursor: project.page(
+                db, limit=PAGE, cursor=cursor, user_id=user_id
+            ),
+            "projects by category": lambda cursor: project.page(
+                db, limit=PAGE, cursor=cursor, category="walk"
+            ),
+            "contact inbox": inbox,
+        }
+
+        failures = 0
+        print(f"\nCursor walks over {ROWS} rows with equal timestamps ({engine.dialect.name})")
+        for name, load in cases.items():
+            seen, ended = walk(load)
+            ok = ended and len(seen) == ROWS and len(set(seen)) == ROWS
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}: ids {seen}{'' if ended else ' ...'}")
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n{failures} walk{'' if failures == 1 else 's'} repeated, skipped or never ended")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
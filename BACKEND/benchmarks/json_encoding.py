@@ -0,0 +1,73 @@
+"""
+JSON encoding cost per list size: FastAPI's default path versus orjson and
+the direct ORM-row -> bytes path used by the list endpoints.
+
+    python -m benchmarks.json_encoding
+"""
+import json
+from datetime import datetime
+from benchmarks.common import Project, report, timed
+from fastapi.encoders import jsonable_encoder
+from app.core.serialization import dumps, encode_list
+from app.schemas.project import ProjectList
+
+SIZES = (100, 1_000, 10_000)
+
+
+def make_rows(count: int):
+    """Transient ORM rows shaped like a real projects page."""
+    now = datetime.utcnow()
+    return [
+        Project(
+            id=i,
+            user_id=1,
+            title=f"Project {i}",
+            description="A long project description. " * 30,
+            short_description=f"Short description {i}",
+            technologies=["React", "Three.js", "FastAPI"],
+            tags=["3d", "web"],
+            category="Web",
+            featured=False,
+            display_order=i,
+            status="completed",
+            three_config={"camera": {"position": [0, 5, 10], "fov": 75}},
+            created_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def fastapi_default(rows):
+    """Validate into ProjectList, jsonable_encoder, stdlib json (FastAPI's default)."""
+    payload = ProjectList(projects=rows, total=len(rows))
+    return json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def pydantic_orjson(rows):
+    """Validate into ProjectList, then encode the dumped dict with orjson."""
+    payload = ProjectList(projects=rows, total=len(rows))
+    return dumps(payload.model_dump())
+
+
+def direct_rows(rows):
+    """Read schema fields straight off ORM rows and encode once."""
+    return encode_list(ProjectList, projects=rows, total=len(rows))
+
+
+def main() -> None:
+    for size in SIZES:
+        rows = make_rows(size)
+        number = max(1, 2_000 // size)
+        assert json.loads(direct_rows(rows))["total"] == size
+        results = {
+            "pydantic + jsonable_encoder + json": timed(lambda: fastapi_default(rows), number=number),
+            "pydantic + orjson": timed(lambda: pydantic_orjson(rows), number=number),
+            "ORM rows -> orjson bytes": timed(lambda: direct_rows(rows), number=number),
+        }
+        report(f"ProjectList encode, {size} rows", results)
+
+
+if __name__ == "__main__":
+    main()
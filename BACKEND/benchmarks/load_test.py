@@ -0,0 +1,140 @@
+"""
+Concurrency load test against a running server.
+
+Fires requests at increasing concurrency levels and reports throughput and
+latency percentiles per level. The throughput plateau is the concurrency
+ceiling. Sync endpoints plateau near the threadpool size (~40 on anyio);
+async endpoints keep scaling until the database pool or CPU is saturated.
+
+    alembic upgrade head
+    BENCH_DATABASE_URL=$DATABASE_URL python -m benchmarks.load_test --seed
+    uvicorn app.main:app --port 8006 &
+    python -m benchmarks.load_test --url http://127.0.0.1:8006 \\
+        --path "/api/v1/projects/?slug=bench" --levels 10 40 80 160 320
+
+To compare before and after, run the same command against a checkout
+from before the async port. Use a Postgres DATABASE_URL; with SQLite the
+database round trip is too short to occupy the threadpool. Each request
+gets a unique ``_lt`` query parameter, so the response cache and request
+coalescing are bypassed and every request reaches the database.
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+_counter = itertools.count()
+
+
+async def fetch(host: str, port: int, path: str) -> Tuple[int, float]:
+    """One HTTP/1.1 GET on a fresh connection; returns (status, seconds)."""
+    separator = "&" if "?" in path else "?"
+    target = f"{path}{separator}_lt={next(_counter)}"
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+    parts = status_line.split()
+    return (int(parts[1]) if len(parts) > 1 else 0), elapsed
+
+
+async def run_level(
+    host: str, port: int, path: str, concurrency: int, requests: int
+) -> Dict[str, float]:
+    """Run ``requests`` GETs with ``concurrency`` in flight at a time."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = itertools.count()
+
+    async def worker() -> None:
+        nonlocal errors
+        while next(remaining) < requests:
+            try:
+                status, elapsed = await fetch(host, port, path)
+            except OSError:
+                errors += 1
+                continue
+            if status != 200:
+                errors += 1
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000
+
+    return {
+        "rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "errors": errors,
+    }
+
+
+def seed(slug: str) -> None:
+    """Add a populated profile to the BENCH_DATABASE_URL database (no tables are dropped)."""
+    from benchmarks.common import Base, SessionLocal, engine, seed_profile
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed_profile(db, slug=slug)
+    finally:
+        db.close()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    url = urlsplit(args.url)
+    host, port = url.hostname or "127.0.0.1", url.port or 80
+    for path in args.path:
+        print(f"\n{path}")
+        print(f"  {'concurrency':>11}  {'req/s':>9}  {'p50 ms':>8}  {'p95 ms':>8}  {'p99 ms':>8}  errors")
+        for level in args.levels:
+            result = await run_level(host, port, path, level, max(args.requests, level * 5))
+            print(
+                f"  {level:>11}  {result['rps']:>9.1f}  {result['p50_ms']:>8.1f}"
+                f"  {result['p95_ms']:>8.1f}  {result['p99_ms']:>8.1f}  {result['errors']}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8006")
+    parser.add_argument(
+        "--path", action="append", default=None,
+        help="Route to load (repeatable); default: projects, skills and education for slug 'bench'",
+    )
+    parser.add_argument("--levels", type=int, nargs="+", default=[10, 40, 80, 160, 320])
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per level (minimum)")
+    parser.add_argument("--seed", action="store_true", help="Seed a 'bench' profile and exit")
+    args = parser.parse_args()
+    if args.seed:
+        seed("bench")
+        return
+    args.path = args.path or [
+        "/api/v1/projects/?slug=bench",
+        "/api/v1/skills/?slug=bench",
+        "/api/v1/education/?slug=bench",
+    ]
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
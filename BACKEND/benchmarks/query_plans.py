@@ -0,0 +1,130 @@
+"""
+Query-plan check: the hot list queries must use their composite indexes.
+
+Runs the real crud methods (``page``, as the list endpoints do) against a
+seeded database, captures the SQL they emit and asks the planner how it
+would execute each statement. Exits
+non-zero if a query does not use the index added for it
+(alembic/versions/0002_hot_query_indexes.py).
+
+    python -m benchmarks.query_plans
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.query_plans
+
+On Postgres, sequential scans are disabled for the check: with a few hundred
+seeded rows a table scan is cheaper, which says nothing about whether the
+index is usable once the tables grow.
+"""
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Tuple
+from benchmarks.common import Contact, SessionLocal, engine, seed_profile, setup_database
+from sqlalchemy import event
+from app.api.v1.endpoints.contact import INBOX_ORDER
+from app.crud import education, experience, project, site_content, skill
+
+PROFILES = 5
+PAGE = 2
+
+
+def capture_sql(func: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    """Run func and return the SELECT statements it sent to the database."""
+    statements: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        func()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def explain(db, statement: str, parameters: Any) -> str:
+    """The planner's chosen plan for a statement, as one string."""
+    connection = db.connection()
+    if connection.dialect.name == "sqlite":
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(str(row[-1]) for row in rows)
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def seed(db) -> int:
+    """Seed several profiles and an inbox; returns the user id the checks query."""
+    users = [seed_profile(db, slug=f"plan{i}") for i in range(PROFILES)]
+    now = datetime.utcnow()
+    for i in range(200):
+        db.add(
+            Contact(
+                name=f"Sender {i}",
+                email=f"sender{i}@example.com",
+                message="Hello",
+                created_at=now - timedelta(minutes=i),
+            )
+        )
+    db.commit()
+    return users[PROFILES // 2].id
+
+
+def main() -> None:
+    setup_database()
+    db = SessionLocal()
+    try:
+        user_id = seed(db)
+        next_projects = project.page(db, user_id=user_id, limit=PAGE).next_cursor
+        cases = {
+            "projects by owner": (
+                "ix_projects_user_display_order",
+                lambda: project.page(db, user_id=user_id, limit=PAGE),
+            ),
+            "projects by owner, next page": (
+                "ix_projects_user_display_order",
+                lambda: project.page(db, user_id=user_id, limit=PAGE, cursor=next_projects),
+            ),
+            "skills by owner and category": (
+                "ix_skills_user_category_order",
+                lambda: skill.page(db, user_id=user_id, category="Frontend", limit=PAGE),
+            ),
+            "experience by owner": (
+                "ix_experience_user_current_start",
+                lambda: experience.page(db, user_id=user_id, limit=PAGE),
+            ),
+            "education by owner": (
+                "ix_education_user_display_order",
+                lambda: education.page(db, user_id=user_id, limit=PAGE),
+            ),
+            "active site content by owner": (
+                "ix_site_content_user_active_updated",
+                lambda: site_content.get_active(db, user_id=user_id),
+            ),
+            "contact inbox": (
+                "ix_contacts_created_at",
+                lambda: INBOX_ORDER.paginate(db.query(Contact), limit=50).all(),
+            ),
+        }
+
+        failures = 0
+        print(f"\nQuery plans ({engine.dialect.name})")
+        for name, (index, run) in cases.items():
+            statements = capture_sql(run)
+            plans = [explain(db, statement, parameters) for statement, parameters in statements]
+            used = any(index in plan for plan in plans)
+            failures += not used
+            print(f"\n{'ok  ' if used else 'FAIL'} {name}: expects {index}")
+            for plan in plans:
+                print("     " + plan.replace("\n", "\n     "))
+            db.rollback()
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n{failures} quer{'y' if failures == 1 else 'ies'} did not use their index")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Public site content: per-request query + Pydantic serialization versus the
+pre-rendered JSON snapshot served by GET /site-content/public.
+
+    python -m benchmarks.site_content
+"""
+from benchmarks.common import SessionLocal, report, seed_profile, setup_database, timed
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.crud import site_content as site_content_crud
+from app.schemas.site_content import SiteContent as SiteContentSchema
+
+
+def legacy_handler(db, slug):
+    """What the endpoint did before snapshots: query, validate, encode, dump."""
+    content = site_content_crud.get_by_slug(db, profile_slug=slug)
+    payload = SiteContentSchema.model_validate(content)
+    return JSONResponse(jsonable_encoder(payload)).body
+
+
+def snapshot_handler(db, slug):
+    return site_content_crud.get_public_json(db, profile_slug=slug).body
+
+
+def main() -> None:
+    setup_database()
+    db = SessionLocal()
+    try:
+        seed_profile(db, slug="bench")
+        assert len(legacy_handler(db, "bench")) > 0
+
+        results = {
+            "query + serialize (legacy)": timed(lambda: legacy_handler(db, "bench")),
+            "pre-rendered snapshot": timed(lambda: snapshot_handler(db, "bench")),
+            "legacy default, no slug": timed(
+                lambda: JSONResponse(
+                    jsonable_encoder(SiteContentSchema.model_validate(site_content_crud.get_active(db)))
+                ).body
+            ),
+            "snapshot default, no slug": timed(lambda: site_content_crud.get_public_json(db).body),
+        }
+        report("GET /site-content/public", results)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
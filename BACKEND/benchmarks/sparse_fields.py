@@ -0,0 +1,58 @@
+"""
+Sparse fieldsets: the full projects list versus the grid's ``fields=``
+projection. Reports query time, encode time and payload size for one page.
+
+    python -m benchmarks.sparse_fields
+"""
+import json
+from benchmarks.common import SessionLocal, report, seed_profile, setup_database, timed
+from app.core.serialization import encode_list
+from app.crud import project as project_crud
+from app.schemas.project import Project as ProjectSchema
+from app.schemas.project import ProjectList
+from app.utils.fieldsets import parse_fields
+
+PAGE = 100
+GRID_FIELDS = "id,title,short_description,thumbnail_url,category,technologies"
+
+
+def main() -> None:
+    setup_database()
+    db = SessionLocal()
+    try:
+        user_id = seed_profile(db, slug="bench", projects=PAGE).id
+        cases = {
+            "all fields": None,
+            "grid fields": parse_fields(GRID_FIELDS, ProjectSchema),
+        }
+
+        def load(columns):
+            # A fresh identity map per call, as each request has its own session.
+            db.expunge_all()
+            return project_crud.page(db, limit=PAGE, columns=columns, user_id=user_id)
+
+        def encode(page, columns):
+            return encode_list(
+                ProjectList, item_fields=columns, projects=page.items, total=page.total
+            )
+
+        query_results, encode_results, sizes = {}, {}, {}
+        for name, columns in cases.items():
+            page = load(columns)
+            body = encode(page, columns)
+            assert len(json.loads(body)["projects"]) == PAGE
+            sizes[name] = len(body)
+            encode_results[name] = timed(lambda: encode(page, columns), number=200)
+            query_results[name] = timed(lambda: load(columns), number=50)
+
+        report(f"Projects page query, {PAGE} rows", query_results)
+        report(f"Projects page encode, {PAGE} rows", encode_results)
+        print(f"\n{'payload':<36}{'bytes':>12}{'of full':>14}")
+        for name, size in sizes.items():
+            print(f"{name:<36}{size:>12}{size / sizes['all fields']:>13.0%}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+SQLite under concurrent reads and writes: stock settings versus the SQLite
+profile (WAL, tuned pragmas and the writer queue from app.core.sqlite).
+
+Reader threads list one profile's projects; writer threads submit contact
+messages, as the contact form does. Each profile runs on its own fresh
+database file for the same duration.
+
+    python -m benchmarks.sqlite_concurrency
+    python -m benchmarks.sqlite_concurrency --readers 16 --writers 8 --seconds 10
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from typing import Dict
+from benchmarks.common import Base, Contact, Project, seed_profile
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from app.core.sqlite import WriterQueue, WriterQueueTimeout, configure_sqlite
+
+
+def make_session_factory(path: str, tuned: bool) -> sessionmaker:
+    """Engine and sessions for one profile on a fresh database file."""
+    engine = create_engine(
+        f"sqlite:///{path}",
+        connect_args={"check_same_thread": False},
+        pool_size=32,
+        max_overflow=0,
+    )
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    if tuned:
+        configure_sqlite(engine, session_factory, WriterQueue(timeout=5.0))
+    Base.metadata.create_all(bind=engine)
+    return session_factory
+
+
+def run_profile(name: str, tuned: bool, readers: int, writers: int, seconds: float) -> Dict[str, float]:
+    path = os.path.join(tempfile.mkdtemp(prefix="portfolio-sqlite-"), f"{name}.db")
+    session_factory = make_session_factory(path, tuned)
+    db = session_factory()
+    try:
+        user_id = seed_profile(db, slug="bench").id
+    finally:
+        db.close()
+
+    counts = {"reads": 0, "writes": 0, "read_errors": 0, "write_errors": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+
+    def record(key: str) -> None:
+        with lock:
+            counts[key] += 1
+
+    def reader() -> None:
+        while time.perf_counter() < deadline:
+            db = session_factory()
+            try:
+                db.query(Project).filter(Project.user_id == user_id).order_by(
+                    Project.display_order
+                ).all()
+                record("reads")
+            except OperationalError:
+                record("read_errors")
+            finally:
+                db.close()
+
+    def writer(index: int) -> None:
+        sequence = 0
+        while time.perf_counter() < deadline:
+            sequence += 1
+            db = session_factory()
+            try:
+                db.add(
+                    Contact(
+                        name=f"Writer {index}",
+                        email=f"writer{index}@example.com",
+                        message=f"Message {sequence}",
+                    )
+                )
+                db.commit()
+                record("writes")
+            except (OperationalError, WriterQueueTimeout):
+                db.rollback()
+                record("write_errors")
+            finally:
+                db.close()
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    return {
+        "reads_per_s": counts["reads"] / wall,
+        "writes_per_s": counts["writes"] / wall,
+        "read_errors": counts["read_errors"],
+        "write_errors": counts["write_errors"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+
+    print(f"\nSQLite, {args.readers} readers + {args.writers} writers for {args.seconds:.0f}s")
+    print(f"{'profile':<28}{'reads/s':>10}{'writes/s':>10}{'read errors':>13}{'write errors':>14}")
+    for name, tuned in (("stock (rollback journal)", False), ("WAL + pragmas + queue", True)):
+        result = run_profile(name.split()[0], tuned, args.readers, args.writers, args.seconds)
+        print(
+            f"{name:<28}{result['reads_per_s']:>10.0f}{result['writes_per_s']:>10.0f}"
+            f"{result['read_errors']:>13}{result['write_errors']:>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Statement-count check: each single-row write is one statement plus the commit.
+
+Runs the real crud create/update/remove methods against a seeded database,
+counts the statements sent and the commits, and reads the returned row
+afterwards so a refresh after the commit would be counted too. Exits
+non-zero if a write costs more than one ``INSERT``/``UPDATE``/``DELETE ...
+RETURNING`` and one commit, or returns values other than those written
+(an update must not hand back the row as it was before).
+
+    python -m benchmarks.write_statements
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.write_statements
+"""
+import sys
+from typing import Any, Callable, List, Tuple
+from benchmarks.common import SessionLocal, engine, seed_profile, setup_database
+from sqlalchemy import event
+from app.crud import education, project, skill, user
+from app.schemas.education import EducationUpdate
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.skill import SkillCreate, SkillUpdate
+from app.schemas.user import UserCreate
+
+
+def capture_writes(func: Callable[[], Any]) -> Tuple[List[str], int]:
+    """Run func and return the statements it sent and the number of commits."""
+    statements: List[str] = []
+    commits = [0]
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(" ".join(statement.split()))
+
+    def commit(conn):
+        commits[0] += 1
+
+    event.listen(engine, "before_cursor_execute", record)
+    event.listen(engine, "commit", commit)
+    try:
+        func()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        event.remove(engine, "commit", commit)
+    return statements, commits[0]
+
+
+def main() -> None:
+    setup_database()
+    db = SessionLocal()
+    try:
+        user_id = seed_profile(db, slug="writes").id
+        db.commit()
+        project_id = project.get_by_user(db, user_id=user_id)[0].id
+        skill_id = skill.get_by_user(db, user_id=user_id)[0].id
+        education_id = education.get_by_user(db, user_id=user_id)[0].id
+
+        # name: (load, write, expected values of the returned row). load runs uncounted,
+        # like an endpoint's ownership check.
+        cases = {
+            "create project": (None, lambda _: project.create_with_user(
+                db, obj_in=ProjectCreate(title="Counted", technologies=["sql"]), user_id=user_id
+            ), {"title": "Counted", "technologies": ["sql"], "user_id": user_id}),
+            "create skill": (None, lambda _: skill.create_with_user(
+                db, obj_in=SkillCreate(name="SQL", category="Backend"), user_id=user_id
+            ), {"name": "SQL", "category": "Backend"}),
+            "create user": (None, lambda _: user.create(
+                db, obj_in=UserCreate(email="count@example.com", password="not-a-password")
+            ), {"email": "count@example.com"}),
+            "update project": (
+                lambda: project.get(db, id=project_id),
+                lambda obj: project.update(db, db_obj=obj, obj_in=ProjectUpdate(title="Renamed")),
+                {"id": project_id, "title": "Renamed"},
+            ),
+            "update skill": (
+                lambda: skill.get(db, id=skill_id),
+                lambda obj: skill.update(db, db_obj=obj, obj_in=SkillUpdate(proficiency=90)),
+                {"id": skill_id, "proficiency": 90},
+            ),
+            "update education": (
+                lambda: education.get(db, id=education_id),
+                lambda obj: education.update(db, db_obj=obj, obj_in=EducationUpdate(degree="MSc")),
+                {"id": education_id, "degree": "MSc"},
+            ),
+            "remove project": (
+                lambda: project.get(db, id=project_id),
+                lambda _: project.remove(db, id=project_id),
+                {"id": project_id},
+            ),
+            "remove skill": (
+                lambda: skill.get(db, id=skill_id),
+                lambda _: skill.remove(db, id=skill_id),
+                {"id": skill_id},
+            ),
+        }
+
+        failures = 0
+        print(f"\nWrite statements ({engine.dialect.name})")
+        for name, (load, write, expected) in cases.items():
+            loaded = load() if load else None
+            written = []
+
+            def run() -> None:
+                obj = write(loaded)
+                # Expired attributes would be reloaded here, one SELECT per row.
+                assert obj.id and obj.created_at
+                written.append(obj)
+
+            statements, commits = capture_writes(run)
+            obj = written[0]
+            wrong = {
+                field: getattr(obj, field)
+                for field, value in expected.items()
+                if getattr(obj, field) != value
+            }
+            ok = (
+                len(statements) == 1
+                and not statements[0].startswith("SELECT")
+                and commits == 1
+                and not wrong
+            )
+            failures += not ok
+            print(f"\n{'ok  ' if ok else 'FAIL'} {name}: {len(statements)} statement(s), {commits} commit(s)")
+            for statement in statements:
+                print("     " + statement[:120])
+            if wrong:
+                print(f"     returned stale values: {wrong}")
+    finally:
+        db.close()
+
+    if failures:
+        print(f"\n{failures} write{'' if failures == 1 else 's'} failed the check")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
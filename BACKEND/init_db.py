@@ -1,9 +1,12 @@
 """
 Database initialization script.
-Creates all tables and optionally seeds initial data.
+Applies the migrations and optionally seeds initial data.
 """
+import os
+from alembic import command
+from alembic.config import Config
 from sqlalchemy.orm import Session
-from app.core.database import engine, Base, SessionLocal
+from app.core.database import SessionLocal
 from app.core.config import settings
 from app.models import User, Project, Skill, Experience, Education, ThreeConfig, Contact, SiteContent
 from app.core.security import get_password_hash
@@ -14,10 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 def create_tables():
-    """Create all database tables."""
-    logger.info("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("✓ Database tables created successfully!")
+    """Create or upgrade all database tables by applying the migrations."""
+    logger.info("Applying database migrations...")
+    config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic.ini")
+    command.upgrade(Config(config_path), "head")
+    logger.info("✓ Database schema is up to date!")
 
 
 def create_superuser(db: Session):
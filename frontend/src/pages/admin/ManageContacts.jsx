@@ -15,7 +15,7 @@ const ManageContacts = () => {
   const fetchContacts = async () => {
     try {
       const response = await api.get('/contact/')
-      setContacts(Array.isArray(response.data) ? response.data : [])
+      setContacts(Array.isArray(response.data?.contacts) ? response.data.contacts : [])
     } catch (error) {
       console.error('Failed to fetch contacts:', error)
       setContacts([])